@@ -0,0 +1,476 @@
+import itertools
+import numpy as np
+
+
+# Gas units of each transaction type
+GAS_UNITS = {
+    'claim': 150000,
+    'unstake': 120000,
+    'approve': 50000,
+    'swap': 180000,
+    'add_liquidity': 220000,
+    'bond': 300000
+}
+
+# Transactions of each bonding path, see controllers/bonds.py. With approval_multiplier at 1, every spend needs
+# its approval: ROME for the swap, FRAX (and ROME) for liquidity, the principal for the bond.
+PATH_TRANSACTIONS = {
+    'frax': ('approve', 'swap', 'approve', 'bond'),
+    'rome_frax_lp': ('approve', 'swap', 'approve', 'approve', 'add_liquidity', 'approve', 'bond')
+}
+
+# Share of the bonded ROME going through a swap: all of it for FRAX bonds, half of it for ROME-FRAX LP bonds
+PATH_SWAPPED_SHARE = {
+    'frax': 1,
+    'rome_frax_lp': 0.5
+}
+
+
+def parameter_grid(**values) -> dict:
+    """
+    Ex: parameter_grid(min_bond_discount=np.arange(0, 15, 0.5), min_srome_balance_to_bond=[0.2, 1, 5])
+    :param values: parameter name -> values to try
+    :return: parameter name -> flat array with every combination of the given values
+    """
+    combinations = np.array(list(itertools.product(*values.values())), dtype=np.float64)
+    return {name: combinations[:, i] for i, name in enumerate(values)}
+
+
+def next_index(mask) -> np.ndarray:
+    """
+    :param mask: boolean array of length n
+    :return: array of length n + 1: for each index, first index from there where mask is True, n if none
+    """
+    indexes = np.append(np.where(mask, np.arange(len(mask)), len(mask)), len(mask))
+    return np.minimum.accumulate(indexes[::-1])[::-1]
+
+
+class SparseTable:
+    """
+    Range maximum (or minimum) table of a series, answering "first index from start where the value is above
+    (or below) threshold" in log(n) steps, for many starts and thresholds at once.
+    """
+    def __init__(self, values, maximum: bool = True):
+        self.maximum = maximum
+        self.size = len(values)
+        reduce = np.maximum if maximum else np.minimum
+        # Out of range windows never match, so that searches stop at size
+        padding = np.inf if maximum else -np.inf
+        levels = [np.append(np.asarray(values, dtype=np.float64), padding)]
+        width = 2
+        while width <= self.size:
+            previous, level = levels[-1], np.full(self.size + 1, padding)
+            count = self.size - width + 1
+            level[:count] = reduce(previous[:count], previous[width // 2:width // 2 + count])
+            levels.append(level)
+            width *= 2
+        self.levels = levels
+
+    def first(self, start, threshold) -> np.ndarray:
+        """
+        :param start: start indexes, array
+        :param threshold: thresholds, array of the same length
+        :return: first index >= start whose value is above threshold (below for a minimum table), size if none
+        """
+        position = np.minimum(start, self.size)
+        for k in range(len(self.levels) - 1, -1, -1):
+            # Skip the whole 2^k window if none of its values matches
+            window = self.levels[k][position]
+            skip = window <= threshold if self.maximum else window > threshold
+            position = np.where(skip, position + 2 ** k, position)
+        return position
+
+
+class Backtester:
+    """
+    Replays the bonding and rebase decisions of the controllers over recorded per-block series (see BlockSeries),
+    for thousands of settings combinations at once.
+    Every combination moves from one of its own events to the next one (rebase, claim round, bond), with NumPy
+    operations over the combinations axis: blocks where nothing happens cost nothing. The next bond block of each
+    combination is found from its balance (when do vested rewards reach min_srome_balance_to_bond) and sparse tables
+    of the best discount (when is it above min_bond_discount).
+    Simulated decisions, as in controllers/controllers.py:
+    - rebase: once per epoch, less than rebase_window blocks before rebase, claim and autostake the pending rewards
+    of every bond above min_pending_rewards_to_claim
+    - bonds: best discount above min_bond_discount, with enough balance or pending rewards, then the bonding path:
+    claims, unstake, swap, (liquidity), bond, each transaction paying gas.
+    Bonds vest linearly over vesting_blocks, a new bond restarting the vesting of its payout, and claims redeem
+    the vested part, like Olympus bond contracts. Swap price impact is ignored: only the swap fee is.
+    """
+    def __init__(
+            self,
+            series,
+            bond_paths: dict,
+            vesting_blocks: int = 36000,
+            swap_fee_bps: int = 25,
+            rebase_rate: float = 0.003,
+            movr_price: float = 50,
+            initial_srome: float = 10,
+            use_pending_rewards: bool = True,
+            rebase_window: int = 30
+    ):
+        """
+        :param series: BlockSeries
+        :param bond_paths: bond name -> bonding path name, for bonds that can be bonded. Others are ignored.
+        :param vesting_blocks: bond vesting term, in blocks
+        :param swap_fee_bps: Solarbeam swap fee in basis points
+        :param rebase_rate: sROME rebase rate, where the series doesn't give it
+        :param movr_price: MOVR price in USD, to convert gas spent into ROME
+        :param initial_srome: staked ROME at the first block
+        :param use_pending_rewards: settings.json use_pending_rewards
+        :param rebase_window: blocks before rebase from which rewards are claimed and autostaked
+        """
+        self.series = series
+        self.bond_names = [name for name in series.discounts if name in bond_paths]
+        self.bond_paths = [bond_paths[name] for name in self.bond_names]
+        self.vesting_blocks = vesting_blocks
+        self.swap_fee = swap_fee_bps / 10000
+        self.rebase_rate = rebase_rate
+        self.movr_price = movr_price
+        self.initial_srome = initial_srome
+        self.use_pending_rewards = use_pending_rewards
+        self.rebase_window = rebase_window
+
+        discounts = np.column_stack([series.discounts[name] for name in self.bond_names])
+        discounts = np.where(np.isnan(discounts), -np.inf, discounts)
+        self.best_bond = discounts.argmax(axis=1)
+        self.best_discount = discounts.max(axis=1)
+        # Best discount, only on blocks where each bond is the best one
+        self.bond_tables = [
+            SparseTable(np.where(self.best_bond == bond, self.best_discount, -np.inf))
+            for bond in range(len(self.bond_names))
+        ]
+        # To know whether two bonds were made during the same discount window
+        self.discount_table = SparseTable(self.best_discount, maximum=False)
+
+        # First block of each epoch in the rebase window
+        window = np.flatnonzero(series.epoch_end - series.block < rebase_window)
+        _, first_in_window = np.unique(series.epoch_end[window], return_index=True)
+        claims = np.zeros(len(series), dtype=bool)
+        claims[window[first_in_window]] = True
+        self.next_claim = next_index(claims)
+        # First block of each new epoch: previous one was rebased
+        rebases = np.zeros(len(series), dtype=bool)
+        rebases[1:] = series.epoch_end[1:] > series.epoch_end[:-1]
+        self.next_rebase = next_index(rebases)
+        self.rebase_rates = np.where(np.isnan(series.rebase_rate), rebase_rate, series.rebase_rate)
+
+        # Discount windows: ranges of blocks with the best discount above a threshold, counted by their rising edges
+        previous = np.append(-np.inf, self.best_discount[:-1])
+        rising = self.best_discount > previous
+        self._window_starts = np.sort(previous[rising])
+        self._window_ends = np.sort(self.best_discount[rising])
+
+    def count_discount_windows(self, min_bond_discount) -> np.ndarray:
+        """
+        :param min_bond_discount: thresholds, array
+        :return: number of block ranges with the best discount above each threshold
+        """
+        return np.searchsorted(self._window_starts, min_bond_discount, side='right') - \
+            np.searchsorted(self._window_ends, min_bond_discount, side='right')
+
+    @staticmethod
+    def get_pending(block, payout, vesting, last):
+        """
+        :param block: block of each combination
+        :return: vested part of a bond payout, by combination
+        """
+        vested = np.ones_like(payout)
+        np.divide(block - last, vesting, out=vested, where=vesting > 0)
+        return payout * np.minimum(vested, 1)
+
+    @staticmethod
+    def get_vested_block(payout, vesting, last, amount):
+        """
+        :param amount: amount of each combination
+        :return: first block from which the vested part of a bond payout is above amount,
+        -inf if it's always the case, inf if never
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            vested_block = np.where(payout > amount, np.floor(last + vesting * amount / payout) + 1, np.inf)
+        return np.where((amount < 0) | ((vesting == 0) & (payout > amount)), -np.inf, vested_block)
+
+    def get_ready_blocks(self, block, state) -> tuple:
+        """
+        Blocks from which each combination would bond if the discount is good enough, see optimize_bonds and
+        process_bond. Bonds with nothing to bond (nothing claimable and no sROME) are skipped: they would revert.
+        :param block: current block of each combination
+        :param state: _Combinations
+        :return: tuple of arrays (-inf if already, inf if never):
+        - list of, for each bond, first block from which sROME + vested rewards of this bond are above
+        min_srome_balance_to_bond, with something to bond. Only valid until pending rewards are used.
+        - first block from which pending rewards are used: above both min balance and sROME balance
+        - first block from which pending rewards are used, with at least one bond rewards to claim
+        """
+        claimable = [
+            self.get_vested_block(payout, vesting, last, state.min_claim)
+            for payout, vesting, last in zip(state.payout, state.vesting, state.last)
+        ]
+        bond_ready = [
+            np.maximum(
+                self.get_vested_block(payout, vesting, last, state.min_balance - state.srome),
+                np.where(state.srome > 0, -np.inf, bond_claimable)
+            )
+            for payout, vesting, last, bond_claimable in zip(state.payout, state.vesting, state.last, claimable)
+        ]
+        pending_used = np.full(len(block), np.inf)
+        if not self.use_pending_rewards:
+            return bond_ready, pending_used, pending_used
+
+        # Vested rewards of all bonds are a sum of linear vestings: solved on each segment between two vesting ends
+        need = np.maximum(state.min_balance, state.srome)
+        vesting_ends = [last + vesting for vesting, last in zip(state.vesting, state.last)]
+        found = np.zeros(len(block), dtype=bool)
+        segment_start = block
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for segment_end in np.sort(np.array(vesting_ends), axis=0):
+                vested_amount, slope, intercept = 0, 0, 0
+                for payout, vesting, last, vesting_end in zip(state.payout, state.vesting, state.last, vesting_ends):
+                    vesting_now = vesting_end > segment_start
+                    vested_amount = vested_amount + np.where(vesting_now, 0, payout)
+                    slope = slope + np.where(vesting_now, payout / vesting, 0)
+                    intercept = intercept + np.where(vesting_now, payout * last / vesting, 0)
+                crossing = (need - vested_amount + intercept) / slope
+                matches = ~found & (slope > 0) & (crossing < segment_end)
+                pending_used = np.where(matches, np.floor(crossing) + 1, pending_used)
+                found |= matches
+                segment_start = np.maximum(segment_start, segment_end)
+        total_pending = sum(
+            self.get_pending(block, payout, vesting, last)
+            for payout, vesting, last in zip(state.payout, state.vesting, state.last)
+        )
+        pending_used = np.where(total_pending > need, -np.inf, pending_used)
+        return bond_ready, pending_used, np.maximum(pending_used, np.minimum.reduce(claimable))
+
+    def run(
+            self,
+            min_bond_discount,
+            min_srome_balance_to_bond,
+            min_pending_rewards_to_claim
+    ) -> dict:
+        """
+        :param min_bond_discount: settings value of each combination, array or scalar
+        :param min_srome_balance_to_bond: settings value of each combination, array or scalar
+        :param min_pending_rewards_to_claim: settings value of each combination, array or scalar
+        :return: dict of arrays, one value per combination:
+        - the three settings values
+        - realized_srome: staked ROME at the last block
+        - bond_payouts: bond payouts still vesting or unclaimed at the last block, in ROME
+        - gas_spent: in MOVR
+        - gas_spent_rome: gas spent converted into ROME at each transaction price
+        - net_rome: realized_srome + bond_payouts - gas_spent_rome
+        - bonds / transactions: number of bonds and transactions sent
+        - discount_windows: number of block ranges with the best discount above min_bond_discount
+        - missed_opportunities: discount windows without any bond, for lack of balance
+        """
+        min_discount, min_balance, min_claim = (
+            np.atleast_1d(values).astype(np.float64) for values in np.broadcast_arrays(
+                min_bond_discount,
+                min_srome_balance_to_bond,
+                min_pending_rewards_to_claim
+            )
+        )
+        combinations, bonds_count = len(min_discount), len(self.bond_names)
+        series, size = self.series, len(self.series)
+        # Float block numbers, as ready blocks are floats, with the last one repeated for finished combinations
+        block_numbers = np.append(series.block, series.block[-1]).astype(np.float64)
+        path_units = [sum(GAS_UNITS[tx] for tx in PATH_TRANSACTIONS[path]) for path in self.bond_paths]
+        path_transactions = [len(PATH_TRANSACTIONS[path]) for path in self.bond_paths]
+        path_kept = [1 - self.swap_fee * PATH_SWAPPED_SHARE[path] for path in self.bond_paths]
+
+        results = {name: np.zeros(combinations) for name in _Combinations.RESULTS}
+        state = _Combinations(
+            combination=np.arange(combinations),
+            min_discount=min_discount,
+            min_balance=min_balance,
+            min_claim=min_claim,
+            srome=np.full(combinations, float(self.initial_srome)),
+            # Bond payout, remaining vesting blocks and last redeem block, by bond
+            payout=[np.zeros(combinations) for _ in range(bonds_count)],
+            vesting=[np.zeros(combinations) for _ in range(bonds_count)],
+            last=[np.zeros(combinations) for _ in range(bonds_count)],
+            gas_spent=np.zeros(combinations),
+            gas_spent_rome=np.zeros(combinations),
+            transactions=np.zeros(combinations, dtype=np.int64),
+            bonds=np.zeros(combinations, dtype=np.int64),
+            bonded_windows=np.zeros(combinations, dtype=np.int64),
+            last_bond=np.full(combinations, -1),
+            # Current block index of each combination, and last indexes its rebase and claims were processed at
+            position=np.zeros(combinations, dtype=np.int64),
+            last_rebase=np.full(combinations, -1),
+            last_claim=np.full(combinations, -1)
+        )
+
+        while len(state.combination):
+            # Next event of every combination
+            next_rebase = self.next_rebase[np.maximum(state.position, state.last_rebase + 1)]
+            next_claim = self.next_claim[np.maximum(state.position, state.last_claim + 1)]
+            next_bond = np.full(len(state.combination), size)
+            bond_ready, pending_used, pending_ready = self.get_ready_blocks(block_numbers[state.position], state)
+            pending_used = np.searchsorted(block_numbers[:size], pending_used)
+            pending_ready = np.maximum(state.position, np.searchsorted(block_numbers[:size], pending_ready))
+            for table, ready in zip(self.bond_tables, bond_ready):
+                start = np.maximum(state.position, np.searchsorted(block_numbers[:size], ready))
+                bond_block = table.first(start, state.min_discount)
+                # Once pending rewards are used, bonding waits for claimable rewards
+                late = np.flatnonzero(bond_block >= pending_used)
+                bond_block[late] = table.first(pending_ready[late], state.min_discount[late])
+                next_bond = np.minimum(next_bond, bond_block)
+            event = np.minimum(np.minimum(next_rebase, next_claim), next_bond)
+            active = event < size
+            if not active.all():
+                # Finished combinations are done with
+                state.store(results, ~active)
+                state = state.take(active)
+                event, next_rebase, next_claim, next_bond = event[active], next_rebase[active], next_claim[active], next_bond[active]
+                if not len(event):
+                    break
+            block = block_numbers[event]
+            gas_cost = series.gas_price[event] * 10 ** -9
+            gas_cost_rome = gas_cost * self.movr_price / series.rome_price[event]
+
+            rebased = event == next_rebase
+            state.srome = np.where(rebased, state.srome * (1 + self.rebase_rates[event - 1]), state.srome)
+            state.last_rebase = np.where(rebased, event, state.last_rebase)
+
+            claiming = event == next_claim
+            claims_count = 0
+            for bond in range(bonds_count):
+                pending = self.get_pending(block, state.payout[bond], state.vesting[bond], state.last[bond])
+                claimed = claiming & (pending > state.min_claim)
+                state.srome = state.srome + np.where(claimed, pending, 0)
+                self.redeem(state, bond, claimed, pending, block)
+                claims_count = claims_count + claimed
+            state.transactions += claims_count
+            state.gas_spent += claims_count * GAS_UNITS['claim'] * gas_cost
+            state.gas_spent_rome += claims_count * GAS_UNITS['claim'] * gas_cost_rome
+            state.last_claim = np.where(claiming, event, state.last_claim)
+
+            # Bonding is decided on the state after this block rebase and claims: next round
+            bonding = (event == next_bond) & ~rebased & ~claiming
+            best_bond = self.best_bond[event]
+            discount = self.best_discount[event]
+            pending = [
+                self.get_pending(block, payout, vesting, last)
+                for payout, vesting, last in zip(state.payout, state.vesting, state.last)
+            ]
+            total_pending = sum(pending)
+            best_pending = np.choose(best_bond, pending)
+            use_pending = self.use_pending_rewards & (total_pending > state.min_balance) & (total_pending > state.srome)
+            bonding &= (discount > state.min_discount) & ((state.srome + best_pending > state.min_balance) | use_pending)
+            # Nothing to bond: bonding transactions would revert
+            claimable = sum(bond_pending > state.min_claim for bond_pending in pending)
+            bonding &= np.where(use_pending, claimable > 0, (state.srome > 0) | (best_pending > state.min_claim))
+
+            # With pending rewards: claim every bond without autostaking. Otherwise claim this bond and unstake.
+            rome, claims_count = 0, 0
+            for bond in range(bonds_count):
+                claimed = bonding & (pending[bond] > state.min_claim) & (use_pending | (best_bond == bond))
+                rome = rome + np.where(claimed, pending[bond], 0)
+                self.redeem(state, bond, claimed, pending[bond], block)
+                claims_count = claims_count + claimed
+            unstaked = bonding & ~use_pending
+            rome = rome + np.where(unstaked, state.srome, 0)
+            state.srome = np.where(unstaked, 0, state.srome)
+
+            units = claims_count * GAS_UNITS['claim'] + unstaked * GAS_UNITS['unstake']
+            state.transactions += claims_count + unstaked
+            for bond in range(bonds_count):
+                bonded = bonding & (best_bond == bond)
+                # Bond payout: USD value of the principal over the bond price, ROME market price cancels out
+                state.payout[bond] = state.payout[bond] + np.where(bonded, rome * path_kept[bond] / (1 - discount / 100), 0)
+                state.vesting[bond] = np.where(bonded, self.vesting_blocks, state.vesting[bond])
+                state.last[bond] = np.where(bonded, block, state.last[bond])
+                units = units + bonded * path_units[bond]
+                state.transactions += bonded * path_transactions[bond]
+            state.gas_spent += units * gas_cost
+            state.gas_spent_rome += units * gas_cost_rome
+            state.bonds += bonding
+
+            # First bond of a discount window: the discount fell below min_bond_discount since the previous bond
+            bonding_indexes = np.flatnonzero(bonding)
+            last_bond = state.last_bond[bonding_indexes]
+            new_window = (last_bond < 0) | (
+                self.discount_table.first(np.maximum(last_bond, 0), state.min_discount[bonding_indexes]) <
+                event[bonding_indexes]
+            )
+            state.bonded_windows[bonding_indexes] += new_window
+            state.last_bond[bonding_indexes] = event[bonding_indexes]
+
+            # Stay on this block after a rebase or claims, as bonding may follow on the same block
+            state.position = np.where(rebased | claiming, event, event + 1)
+
+        results['discount_windows'] = self.count_discount_windows(min_discount)
+        results['missed_opportunities'] = results['discount_windows'] - results['bonded_windows']
+        return {
+            'min_bond_discount': min_discount,
+            'min_srome_balance_to_bond': min_balance,
+            'min_pending_rewards_to_claim': min_claim,
+            'realized_srome': results['srome'],
+            'bond_payouts': results['bond_payouts'],
+            'gas_spent': results['gas_spent'],
+            'gas_spent_rome': results['gas_spent_rome'],
+            'net_rome': results['srome'] + results['bond_payouts'] - results['gas_spent_rome'],
+            'bonds': results['bonds'].astype(np.int64),
+            'transactions': results['transactions'].astype(np.int64),
+            'discount_windows': results['discount_windows'],
+            'missed_opportunities': results['missed_opportunities'].astype(np.int64)
+        }
+
+    @staticmethod
+    def redeem(state, bond: int, redeemed, pending, block):
+        """
+        Redeem the vested part of a bond payout, like Olympus bond contracts: what's left keeps vesting
+        over the rest of the vesting term.
+        :param redeemed: combinations redeeming
+        :param pending: vested payout of each combination
+        """
+        state.payout[bond] = state.payout[bond] - np.where(redeemed, pending, 0)
+        state.vesting[bond] = np.where(
+            redeemed,
+            np.maximum(state.vesting[bond] - (block - state.last[bond]), 0),
+            state.vesting[bond]
+        )
+        state.last[bond] = np.where(redeemed, block, state.last[bond])
+
+    @staticmethod
+    def best(results: dict, count: int = 10, key: str = 'net_rome') -> list:
+        """
+        :param results: run() results
+        :param count: number of combinations to return
+        :param key: result to rank combinations by, highest first
+        :return: list of dicts, one per combination, best first
+        """
+        order = np.argsort(-results[key], kind='stable')[:count]
+        return [{name: values[i].item() for name, values in results.items()} for i in order]
+
+
+class _Combinations:
+    """
+    Simulation state of a set of settings combinations: one array per value, one array per bond for bond values.
+    """
+    # Values kept once a combination is finished
+    RESULTS = ('srome', 'bond_payouts', 'gas_spent', 'gas_spent_rome', 'bonds', 'transactions', 'bonded_windows')
+
+    def __init__(self, **values):
+        self.__dict__.update(values)
+
+    def take(self, mask):
+        """
+        :return: state of the combinations selected by mask
+        """
+        return _Combinations(**{
+            name: [bond_values[mask] for bond_values in values] if isinstance(values, list) else values[mask]
+            for name, values in vars(self).items()
+        })
+
+    def store(self, results: dict, mask):
+        """
+        Write results of the combinations selected by mask.
+        """
+        combinations = self.combination[mask]
+        for name in self.RESULTS:
+            if name == 'bond_payouts':
+                results[name][combinations] = sum(payout[mask] for payout in self.payout)
+            else:
+                results[name][combinations] = getattr(self, name)[mask]
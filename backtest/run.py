@@ -0,0 +1,112 @@
+"""
+Settings backtest: sweeps min_bond_discount, min_srome_balance_to_bond and min_pending_rewards_to_claim over
+recorded per-block series. Run from the repository root, as settings.json is read from the working directory:
+
+    python -m backtest.run --series rpc_session.jsonl.gz [--min-bond-discount 0:20:0.25] [--top 10]
+
+The series is either a session recorded with session mode record (see README), or a CSV file, see BlockSeries.
+Values to try are given as start:stop:step ranges (stop excluded) or comma separated lists.
+"""
+from backtest.backtester import Backtester, parameter_grid
+from backtest.series import BlockSeries
+from models.rome_interface import RomeInterface
+from web3 import Web3
+import argparse
+import numpy as np
+import time
+
+
+# Snapshot reads don't depend on the wallet: any address will do to recognize market calls
+SERIES_ADDRESS = '0x0000000000000000000000000000000000000000'
+RESULT_COLUMNS = (
+    'min_bond_discount',
+    'min_srome_balance_to_bond',
+    'min_pending_rewards_to_claim',
+    'net_rome',
+    'realized_srome',
+    'bond_payouts',
+    'gas_spent',
+    'bonds',
+    'transactions',
+    'missed_opportunities'
+)
+
+
+def parse_values(text: str):
+    """
+    :param text: start:stop:step range or comma separated values
+    :return: array of values
+    """
+    if ':' in text:
+        return np.arange(*(float(value) for value in text.split(':')))
+    return np.array([float(value) for value in text.split(',')])
+
+
+def print_results(rows: list):
+    print(''.join(f'{column[:14]:>16}' for column in RESULT_COLUMNS))
+    for row in rows:
+        print(''.join(
+            f'{row[column]:>16}' if isinstance(row[column], int) else f'{round(row[column], 6):>16}'
+            for column in RESULT_COLUMNS
+        ))
+
+
+def main(args):
+    rome_interface = RomeInterface(Web3(), SERIES_ADDRESS)
+    settings = rome_interface.settings
+    started = time.perf_counter()
+    if args.series.endswith('.csv'):
+        series = BlockSeries.from_csv(args.series)
+    else:
+        series = BlockSeries.from_session(args.series, rome_interface)
+        if args.export_csv:
+            series.to_csv(args.export_csv)
+    print(f"Loaded {len(series)} blocks in {round(time.perf_counter() - started, 2)}s")
+    if len(series) == 0:
+        return
+
+    backtester = Backtester(
+        series,
+        {bond.name: bond.path for bond in rome_interface.bond_registry.all() if bond.path},
+        vesting_blocks=args.vesting_blocks,
+        swap_fee_bps=settings['solarbeam']['swap_fee_bps'],
+        rebase_rate=args.rebase_rate,
+        movr_price=args.movr_price,
+        initial_srome=args.initial_srome,
+        use_pending_rewards=settings['use_pending_rewards']
+    )
+    grid = parameter_grid(
+        min_bond_discount=parse_values(args.min_bond_discount),
+        min_srome_balance_to_bond=parse_values(args.min_srome_balance_to_bond),
+        min_pending_rewards_to_claim=parse_values(args.min_pending_rewards_to_claim)
+    )
+    started = time.perf_counter()
+    results = backtester.run(**grid)
+    print(
+        f"Simulated {len(grid['min_bond_discount'])} combinations over blocks {series.block[0]} to {series.block[-1]} "
+        f"in {round(time.perf_counter() - started, 2)}s\n"
+    )
+
+    print("Current settings:")
+    print_results(Backtester.best(backtester.run(
+        settings['min_bond_discount'],
+        settings['min_srome_balance_to_bond'],
+        settings['min_pending_rewards_to_claim']
+    ), 1))
+    print(f"\nBest {args.top} combinations:")
+    print_results(Backtester.best(results, args.top))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Backtest bonding and claim settings over recorded block series.')
+    parser.add_argument('--series', required=True, help='recorded session (.jsonl.gz) or CSV series file')
+    parser.add_argument('--export-csv', help='save the series extracted from a session to this CSV file')
+    parser.add_argument('--min-bond-discount', default='0:20:0.25', help='values to try')
+    parser.add_argument('--min-srome-balance-to-bond', default='0.05,0.1,0.2,0.5,1,2,5', help='values to try')
+    parser.add_argument('--min-pending-rewards-to-claim', default='0.001,0.005,0.01,0.05,0.1,0.5', help='values to try')
+    parser.add_argument('--vesting-blocks', type=int, default=36000, help='bond vesting term, in blocks')
+    parser.add_argument('--rebase-rate', type=float, default=0.003, help='rebase rate, where the series has none')
+    parser.add_argument('--movr-price', type=float, default=50, help='MOVR price in USD, to convert gas into ROME')
+    parser.add_argument('--initial-srome', type=float, default=10, help='staked ROME at the first block')
+    parser.add_argument('--top', type=int, default=10, help='number of best combinations to print')
+    main(parser.parse_args())
@@ -0,0 +1,124 @@
+from models.multicall import decode_result, encode_call
+from models.rpc_replay import RPCReplay
+from web3 import Web3
+import numpy as np
+
+
+class BlockSeries:
+    """
+    Per-block market series a backtest runs on, as NumPy arrays of the same length, sorted by block:
+    - block: block numbers
+    - rome_price: ROME market price in USD
+    - epoch_end: block of the next rebase
+    - gas_price: network gas price in gwei
+    - discounts: bond name -> bond discount percentage, NaN where the bond isn't priced
+    - rebase_rate: sROME rebase rate of the epoch ending at epoch_end (ex: 0.003 for 0.3%), NaN where unknown
+    """
+    def __init__(
+            self,
+            block,
+            rome_price,
+            epoch_end,
+            gas_price,
+            discounts: dict,
+            rebase_rate=None
+    ):
+        order = np.argsort(block, kind='stable')
+        self.block = np.asarray(block, dtype=np.int64)[order]
+        self.rome_price = np.asarray(rome_price, dtype=np.float64)[order]
+        self.epoch_end = np.asarray(epoch_end, dtype=np.int64)[order]
+        self.gas_price = np.asarray(gas_price, dtype=np.float64)[order]
+        self.discounts = {name: np.asarray(values, dtype=np.float64)[order] for name, values in discounts.items()}
+        if rebase_rate is None:
+            rebase_rate = np.full(len(self.block), np.nan)
+        self.rebase_rate = np.asarray(rebase_rate, dtype=np.float64)[order]
+
+    def __len__(self) -> int:
+        return len(self.block)
+
+    @classmethod
+    def from_csv(cls, path: str):
+        """
+        :param path: CSV file with a header line: block, rome_price, epoch_end, gas_price, discount_<bond name>
+        columns, and an optional rebase_rate column. Empty cells are NaN.
+        """
+        data = np.genfromtxt(path, delimiter=',', names=True)
+        names = data.dtype.names
+        return cls(
+            data['block'],
+            data['rome_price'],
+            data['epoch_end'],
+            data['gas_price'],
+            {name[len('discount_'):]: data[name] for name in names if name.startswith('discount_')},
+            data['rebase_rate'] if 'rebase_rate' in names else None
+        )
+
+    def to_csv(self, path: str):
+        columns = {
+            'block': self.block,
+            'rome_price': self.rome_price,
+            'epoch_end': self.epoch_end,
+            'gas_price': self.gas_price,
+            **{f'discount_{name}': values for name, values in self.discounts.items()},
+            'rebase_rate': self.rebase_rate
+        }
+        np.savetxt(path, np.column_stack(list(columns.values())), delimiter=',', header=','.join(columns), comments='')
+
+    @classmethod
+    def from_session(
+            cls,
+            path: str,
+            rome_interface
+    ):
+        """
+        Extract the series from a session recorded with RPCRecorder: market state from snapshot multicalls,
+        gas price from the last eth_gasPrice / eth_feeHistory answer before each snapshot.
+        Rebase rates are not part of snapshots: they are left unknown.
+        :param path: session file
+        :param rome_interface: RomeInterface with the same enabled bonds as the recorded session,
+        used to recognize and parse market calls
+        """
+        multicall = rome_interface.multicall
+        market_calls = rome_interface.market_calls()
+        market_keys = {encode_call(contract_function): key for key, contract_function in market_calls.items()}
+        gas_price = rome_interface.settings['default_gasprice']
+        rows = {}
+
+        for _, _, method, params, result, error, _ in RPCReplay.load(path).records:
+            if error is not None or result is None:
+                continue
+            if method == 'eth_gasPrice':
+                gas_price = int(result, 16) / 10 ** 9
+            elif method == 'eth_feeHistory':
+                gas_price = (int(result['baseFeePerGas'][-1], 16) + int(result['reward'][-1][0], 16)) / 10 ** 9
+            elif method == 'eth_call' and multicall.address and Web3.toChecksumAddress(params[0]['to']) == multicall.address:
+                aggregate_function, arguments = multicall.contract.decode_function_input(params[0]['data'])
+                block_number, _, return_data = decode_result(
+                    rome_interface.web3,
+                    aggregate_function(*arguments.values()),
+                    bytes.fromhex(result[2:])
+                )
+                results = {}
+                for (target, call_data), (_, data) in zip(arguments['calls'], return_data):
+                    key = market_keys.get((Web3.toChecksumAddress(target), '0x' + call_data.hex()))
+                    if key is not None:
+                        results[key] = decode_result(rome_interface.web3, market_calls[key], data)
+                if len(results) < len(market_calls) or block_number in rows:
+                    continue
+                market = rome_interface.parse_market(block_number, results)
+                rows[block_number] = (market, gas_price)
+
+        blocks = sorted(rows)
+        return cls(
+            blocks,
+            [rows[block][0]['rome_market_price'] for block in blocks],
+            [rows[block][0]['epoch'][2] for block in blocks],
+            [rows[block][1] for block in blocks],
+            {
+                name: [
+                    np.nan if rows[block][0]['discounts'][name] is None else rows[block][0]['discounts'][name]
+                    for block in blocks
+                ]
+                for name in (bond.name for bond in rome_interface.bond_registry.enabled_bonds())
+            }
+        )
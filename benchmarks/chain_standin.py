@@ -0,0 +1,313 @@
+from aiohttp import web
+from collections import Counter
+from eth_abi import decode_abi, encode_abi, encode_single
+from eth_account import Account
+from eth_utils import function_signature_to_4byte_selector, keccak
+from models.rome_contracts import RomeContracts
+from web3 import Web3
+import asyncio
+import rlp
+import time
+
+
+def selector(signature: str) -> str:
+    return '0x' + function_signature_to_4byte_selector(signature).hex()
+
+
+def event_topic(signature: str) -> str:
+    return '0x' + keccak(text=signature).hex()
+
+
+def address_topic(address: str) -> str:
+    return '0x' + encode_single('address', address).hex()
+
+
+MULTICALL_SELECTOR = selector('tryBlockAndAggregate(bool,(address,bytes)[])')
+CHAIN_ID = 1285
+GAS_USED = 150000
+ZERO_ADDRESS = '0x' + '00' * 20
+# Redeemed by each claim: 0.1 ROME
+REDEEMED_PAYOUT = 10 ** 8
+# FRAX wei per ROME wei, at 300 FRAX per ROME
+FRAX_PER_ROME_WEI = 300 * 10 ** 9
+# Zap contract address, for scenarios enabling zap mode
+ZAP_ADDRESS = Web3.toChecksumAddress('0x' + 'a5' * 20)
+
+
+class ChainStandin:
+    """
+    In-process JSON-RPC node answering just what Neron needs to run its controllers, with a fixed Rome market:
+    - ROME-FRAX pool at 300 FRAX per ROME, bonds at 280 USD, so FRAX bond discount is above min_bond_discount
+    - 5 ROME and 5 sROME in the wallet, 0.1 ROME pending in each bond, next rebase in 20 blocks
+    - no allowance, so bonding paths send their approvals
+    - Multicall aggregator deployed, transactions mined right away (or after receipt_delay), with the same
+    events as the Rome and Solarbeam contracts (transfers, swaps, liquidity adds, bond deposits and redeems), and
+    a zap contract at ZAP_ADDRESS.
+    Every HTTP request waits latency seconds before being answered, batches included.
+    Requests are counted by JSON-RPC method, and sent transactions are kept.
+    """
+    def __init__(
+            self,
+            latency: float = 0.0,
+            receipt_delay: float = 0.0,
+            block_number: int = 1000
+    ):
+        """
+        :param latency: seconds added to every HTTP request, like a remote node round trip
+        :param receipt_delay: seconds before a sent transaction receipt is available
+        :param block_number: current block number
+        """
+        self.latency = latency
+        self.receipt_delay = receipt_delay
+        self.block_number = block_number
+        self.http_requests = 0
+        self.calls = Counter()
+        self.transactions = {}
+        self.nonce = 0
+        self._runner = None
+        self.contracts = RomeContracts(Web3())
+        self.uint_answers = {
+            selector('balanceOf(address)'): 5 * 10 ** 9,
+            selector('pendingPayoutFor(address)'): 10 ** 8,
+            selector('bondPriceInUSD()'): 280 * 10 ** 18,
+            selector('bondPrice()'): 28000,
+            selector('allowance(address,address)'): 0
+        }
+
+    def reset_counters(self):
+        self.http_requests = 0
+        self.calls = Counter()
+        self.transactions = {}
+
+    def answer_call(self, data: str) -> bytes:
+        """
+        :param data: eth_call data, hex string
+        :return: ABI encoded result
+        """
+        call_selector = data[:10]
+        if call_selector in self.uint_answers:
+            return encode_abi(['uint256'], [self.uint_answers[call_selector]])
+        if call_selector == selector('epoch()'):
+            return encode_abi(['uint256'] * 4, [2200, 100, self.block_number + 20, 0])
+        if call_selector == selector('getReserves()'):
+            # token0 is FRAX: 300 000 FRAX for 1 000 ROME
+            return encode_abi(['uint112', 'uint112', 'uint32'], [300000 * 10 ** 18, 1000 * 10 ** 9, 0])
+        if call_selector == MULTICALL_SELECTOR:
+            _, calls = decode_abi(['bool', '(address,bytes)[]'], bytes.fromhex(data[10:]))
+            results = [(True, self.answer_call('0x' + call_data.hex())) for _, call_data in calls]
+            return encode_abi(['uint256', 'bytes32', '(bool,bytes)[]'], [self.block_number, b'\0' * 32, results])
+        raise ValueError(f'execution reverted: unknown selector {call_selector}')
+
+    def transaction_events(self, raw_transaction: str) -> list:
+        """
+        :param raw_transaction: signed transaction, hex string
+        :return: list of (address, topics, data) of the events the transaction emits
+        """
+        contracts = self.contracts
+        sender = Account.recover_transaction(raw_transaction)
+        fields = rlp.decode(bytes.fromhex(raw_transaction[2:]))
+        to, data = Web3.toChecksumAddress(fields[3]), '0x' + fields[5].hex()
+        arguments = bytes.fromhex(data[10:])
+
+        def transfer(token, source, destination, amount):
+            return token, [event_topic('Transfer(address,address,uint256)'), address_topic(source), address_topic(destination)], \
+                encode_abi(['uint256'], [amount])
+
+        if data[:10] == selector('approve(address,uint256)'):
+            spender, amount = decode_abi(['address', 'uint256'], arguments)
+            return [(to, [event_topic('Approval(address,address,uint256)'), address_topic(sender), address_topic(spender)], encode_abi(['uint256'], [amount]))]
+        if data[:10] == selector('redeem(address,bool)'):
+            recipient, stake = decode_abi(['address', 'bool'], arguments)
+            return [
+                (to, [event_topic('BondRedeemed(address,uint256,uint256)'), address_topic(recipient)], encode_abi(['uint256', 'uint256'], [REDEEMED_PAYOUT, 0])),
+                transfer(contracts.srome_address, contracts.staking_rome_address, recipient, REDEEMED_PAYOUT) if stake
+                else transfer(contracts.rome_address, to, recipient, REDEEMED_PAYOUT)
+            ]
+        if data[:10] == selector('unstake(uint256,bool)'):
+            amount, _ = decode_abi(['uint256', 'bool'], arguments)
+            return [
+                transfer(contracts.srome_address, sender, contracts.staking_rome_address, amount),
+                transfer(contracts.rome_address, contracts.staking_rome_address, sender, amount)
+            ]
+        if data[:10] == selector('swapExactTokensForTokens(uint256,uint256,address[],address,uint256)'):
+            amount_in, _, path, recipient, _ = decode_abi(['uint256', 'uint256', 'address[]', 'address', 'uint256'], arguments)
+            pair = contracts.rome_frax_lp_address
+            if Web3.toChecksumAddress(path[0]) == contracts.frax_address:
+                amount_out = amount_in // FRAX_PER_ROME_WEI
+                return [
+                    transfer(contracts.frax_address, sender, pair, amount_in),
+                    transfer(contracts.rome_address, pair, recipient, amount_out),
+                    (pair, [event_topic('Swap(address,uint256,uint256,uint256,uint256,address)'), address_topic(to), address_topic(recipient)],
+                     encode_abi(['uint256'] * 4, [amount_in, 0, 0, amount_out]))
+                ]
+            amount_out = amount_in * FRAX_PER_ROME_WEI
+            return [
+                transfer(contracts.rome_address, sender, pair, amount_in),
+                transfer(contracts.frax_address, pair, recipient, amount_out),
+                # token0 is FRAX
+                (pair, [event_topic('Swap(address,uint256,uint256,uint256,uint256,address)'), address_topic(to), address_topic(recipient)],
+                 encode_abi(['uint256'] * 4, [0, amount_in, amount_out, 0]))
+            ]
+        if data[:10] == selector('addLiquidity(address,address,uint256,uint256,uint256,uint256,address,uint256)'):
+            _, _, rome_amount, frax_amount, _, _, recipient, _ = decode_abi(['address', 'address'] + ['uint256'] * 4 + ['address', 'uint256'], arguments)
+            pair = contracts.rome_frax_lp_address
+            return [
+                transfer(contracts.rome_address, sender, pair, rome_amount),
+                transfer(contracts.frax_address, sender, pair, frax_amount),
+                transfer(pair, ZERO_ADDRESS, recipient, 10 ** 18),
+                (pair, [event_topic('Mint(address,uint256,uint256)'), address_topic(to)], encode_abi(['uint256', 'uint256'], [frax_amount, rome_amount]))
+            ]
+        if data[:10] == selector('deposit(uint256,uint256,address)'):
+            amount, _, _ = decode_abi(['uint256', 'uint256', 'address'], arguments)
+            principal = contracts.rome_frax_lp_address if to == contracts.bond_rome_frax_lp_address else contracts.frax_address
+            return [
+                transfer(principal, sender, to, amount),
+                (to, [event_topic('BondCreated(uint256,uint256,uint256,uint256)')] + ['0x' + encode_single('uint256', value).hex() for value in (10 ** 9, self.block_number + 36000, 280 * 10 ** 18)],
+                 encode_abi(['uint256'], [amount]))
+            ]
+        if data[:10] == selector('zapBond(address[],uint256,address,bool,uint256,uint256,uint256)'):
+            redeem_bonds, srome_amount, bond, add_liquidity, _, _, _ = decode_abi(
+                ['address[]', 'uint256', 'address', 'bool', 'uint256', 'uint256', 'uint256'], arguments
+            )
+            events = []
+            for redeem_bond in redeem_bonds:
+                events += [
+                    (redeem_bond, [event_topic('BondRedeemed(address,uint256,uint256)'), address_topic(sender)], encode_abi(['uint256', 'uint256'], [REDEEMED_PAYOUT, 0])),
+                    transfer(contracts.rome_address, redeem_bond, sender, REDEEMED_PAYOUT)
+                ]
+            rome_in = self.uint_answers[selector('balanceOf(address)')] + REDEEMED_PAYOUT * len(redeem_bonds)
+            events.append(transfer(contracts.rome_address, sender, to, rome_in))
+            if srome_amount:
+                events += [
+                    transfer(contracts.srome_address, sender, to, srome_amount),
+                    transfer(contracts.srome_address, to, contracts.staking_rome_address, srome_amount),
+                    transfer(contracts.rome_address, contracts.staking_rome_address, to, srome_amount)
+                ]
+                rome_in += srome_amount
+            pair = contracts.rome_frax_lp_address
+            rome_to_swap = rome_in // 2 if add_liquidity else rome_in
+            frax_out = rome_to_swap * FRAX_PER_ROME_WEI
+            events += [
+                transfer(contracts.rome_address, to, pair, rome_to_swap),
+                transfer(contracts.frax_address, pair, to, frax_out),
+                (pair, [event_topic('Swap(address,uint256,uint256,uint256,uint256,address)'), address_topic(contracts.solarbeam_router_address), address_topic(to)],
+                 encode_abi(['uint256'] * 4, [0, rome_to_swap, frax_out, 0]))
+            ]
+            principal, principal_amount = contracts.frax_address, frax_out
+            if add_liquidity:
+                principal, principal_amount = pair, 10 ** 18
+                events += [
+                    transfer(contracts.rome_address, to, pair, rome_in - rome_to_swap),
+                    transfer(contracts.frax_address, to, pair, frax_out),
+                    transfer(pair, ZERO_ADDRESS, to, principal_amount),
+                    (pair, [event_topic('Mint(address,uint256,uint256)'), address_topic(contracts.solarbeam_router_address)], encode_abi(['uint256', 'uint256'], [frax_out, rome_in - rome_to_swap]))
+                ]
+            payout = 10 ** 9
+            return events + [
+                transfer(principal, to, bond, principal_amount),
+                (bond, [event_topic('BondCreated(uint256,uint256,uint256,uint256)')] + ['0x' + encode_single('uint256', value).hex() for value in (payout, self.block_number + 36000, 280 * 10 ** 18)],
+                 encode_abi(['uint256'], [principal_amount])),
+                (to, [event_topic('Zapped(address,address,uint256,uint256,uint256)'), address_topic(sender), address_topic(bond)],
+                 encode_abi(['uint256'] * 3, [rome_in, principal_amount, payout]))
+            ]
+        return []
+
+    def get_receipt(self, tx_hash: str):
+        if tx_hash not in self.transactions or time.monotonic() - self.transactions[tx_hash]['sent'] < self.receipt_delay:
+            return None
+        logs = [
+            {
+                'address': address,
+                'topics': topics,
+                'data': '0x' + data.hex(),
+                'blockNumber': hex(self.block_number),
+                'blockHash': '0x' + '00' * 32,
+                'transactionHash': tx_hash,
+                'transactionIndex': '0x0',
+                'logIndex': hex(log_index)
+            }
+            for log_index, (address, topics, data) in enumerate(self.transactions[tx_hash]['events'])
+        ]
+        return {
+            'transactionHash': tx_hash,
+            'transactionIndex': '0x0',
+            'blockNumber': hex(self.block_number),
+            'blockHash': '0x' + '00' * 32,
+            'from': '0x' + '00' * 20,
+            'to': '0x' + '00' * 20,
+            'contractAddress': None,
+            'status': '0x1',
+            'gasUsed': hex(GAS_USED),
+            'cumulativeGasUsed': hex(GAS_USED),
+            'effectiveGasPrice': hex(10 ** 9),
+            'logsBloom': '0x' + '00' * 256,
+            'logs': logs
+        }
+
+    def answer(self, method: str, params: list):
+        if method == 'eth_call':
+            return '0x' + self.answer_call(params[0]['data']).hex()
+        if method == 'eth_blockNumber':
+            return hex(self.block_number)
+        if method == 'eth_chainId':
+            return hex(CHAIN_ID)
+        if method == 'eth_getCode':
+            return '0x01'
+        if method == 'eth_gasPrice':
+            return hex(10 ** 9)
+        if method == 'eth_feeHistory':
+            return {
+                'oldestBlock': hex(self.block_number - 9),
+                'baseFeePerGas': [hex(10 ** 9)] * 11,
+                'gasUsedRatio': [0.5] * 10,
+                'reward': [[hex(10 ** 9)]] * 10
+            }
+        if method == 'eth_estimateGas':
+            return hex(GAS_USED)
+        if method == 'eth_getTransactionCount':
+            return hex(self.nonce)
+        if method == 'eth_sendRawTransaction':
+            tx_hash = '0x' + keccak(hexstr=params[0]).hex()
+            self.transactions[tx_hash] = {'sent': time.monotonic(), 'events': self.transaction_events(params[0])}
+            self.nonce += 1
+            return tx_hash
+        if method == 'eth_getTransactionReceipt':
+            return self.get_receipt(params[0])
+        raise ValueError(f'method {method} not supported')
+
+    def handle_request(self, request: dict) -> dict:
+        self.calls[request['method']] += 1
+        response = {'jsonrpc': '2.0', 'id': request['id']}
+        try:
+            response['result'] = self.answer(request['method'], request.get('params') or [])
+        except ValueError as e:
+            response['error'] = {'code': -32000, 'message': str(e)}
+        return response
+
+    async def handle(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        self.http_requests += 1
+        await asyncio.sleep(self.latency)
+        if isinstance(payload, list):
+            return web.json_response([self.handle_request(single) for single in payload])
+        return web.json_response(self.handle_request(payload))
+
+    async def start(
+            self,
+            host: str = '127.0.0.1',
+            port: int = 8645
+    ) -> str:
+        """
+        :return: endpoint URI
+        """
+        app = web.Application()
+        app.router.add_post('/', self.handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        return f'http://{host}:{port}/'
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
@@ -0,0 +1,244 @@
+"""
+Controller cycles benchmark, against an in-process chain stand-in (see chain_standin.py).
+Run from the repository root, as settings.json is read from the working directory:
+
+    python -m benchmarks.run [--latency 0.05] [--iterations 5] [--update-baseline]
+
+Each scenario runs once to warm caches up (multicall detection, fee oracle), then iterations times, one block apart.
+Reported per iteration: median wall time, HTTP requests, JSON-RPC calls, transactions sent,
+and peak traced memory (tracemalloc, measured on a separate iteration as tracing slows everything down).
+Results are compared with benchmarks/baseline.json: more requests, calls or transactions than the baseline is a
+regression, so is a wall time or memory peak above the baseline by more than the tolerance.
+Exit code is 1 on regression.
+"""
+from benchmarks.chain_standin import ZAP_ADDRESS, ChainStandin
+from controllers.bonds import PIPELINES, process_bond
+from controllers.pipeline import PipelineExecutor
+from controllers.rebase import prepare_rebase, rebase
+from eth_account import Account
+from logger.checkpoints import CheckpointStore
+from models.async_rome_interface import AsyncRomeInterface
+from models.async_rpc import AsyncRPC
+from models.chain_snapshot import SnapshotService
+from models.transactions_wrapper import TransactionsWrapper
+from web3 import Web3
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), 'baseline.json')
+# Throwaway key, only ever used against the stand-in
+BENCHMARK_PRIVATE_KEY = '0x' + '42' * 32
+COUNTED_RESULTS = ('http_requests', 'rpc_calls', 'transactions')
+# Bonding paths checkpoints are kept in memory: the benchmark never resumes a run
+PIPELINE_EXECUTOR = PipelineExecutor(CheckpointStore(':memory:'), PIPELINES)
+
+
+# --------- SCENARIOS ---------
+# Same steps as the controllers hooks, on a fresh block snapshot, without their logging.
+
+async def bond_evaluation(tx_performer, snapshots, block_number):
+    # optimize_bonds evaluation: snapshot and best discount, no bonding
+    rome_interface = tx_performer.rome_interface
+    bond_data = await snapshots.get(block_number, rome_interface.account_address)
+    rome_interface.discount_engine.best_bond(bond_data['discounts'], rome_interface.settings['min_bond_discount'])
+
+
+async def rebase_claims(tx_performer, snapshots, block_number):
+    # optimize_rebase claim round: every bond has pending rewards to claim and autostake
+    snapshot = await snapshots.get(block_number, tx_performer.rome_interface.account_address)
+    await rebase(tx_performer, snapshot['pending_rewards'])
+
+
+async def prepare_rebase_claims(tx_performer, snapshots, block_number):
+    # optimize_rebase on the blocks before the trigger: claims signed ahead
+    snapshot = await snapshots.get(block_number, tx_performer.rome_interface.account_address)
+    await prepare_rebase(tx_performer, snapshot['pending_rewards'])
+
+
+async def frax_bond(tx_performer, snapshots, block_number):
+    # Full FRAX bond path with stacked ROME: claim, unstake, swap, approvals, bond
+    rome_interface = tx_performer.rome_interface
+    bond_data = await snapshots.get(block_number, rome_interface.account_address)
+    await process_bond(tx_performer, rome_interface.bond_registry.get('frax'), bond_data, use_pending=False, executor=PIPELINE_EXECUTOR)
+
+
+SCENARIOS = {
+    'bond_evaluation': bond_evaluation,
+    'rebase_claims': rebase_claims,
+    # Same claims, signed ahead by prepare_rebase_claims (not measured)
+    'rebase_claims_presigned': rebase_claims,
+    'frax_bond': frax_bond,
+    # Same path, in a single transaction through the zap contract
+    'frax_bond_zap': frax_bond
+}
+# Steps run before a scenario, out of its measures
+SCENARIO_PREPARE = {
+    'rebase_claims_presigned': prepare_rebase_claims
+}
+# Settings overriding settings.json in a scenario
+SCENARIO_SETTINGS = {
+    'frax_bond_zap': {'zap': {'enabled': True, 'address': ZAP_ADDRESS}}
+}
+
+
+# --------- RUNNER ---------
+
+async def run_iteration(scenario, standin: ChainStandin, rome_interface, snapshots, prepare=None) -> dict:
+    if prepare is not None:
+        # One block before the measured one, as hooks do
+        standin.block_number += 1
+        await rome_interface.on_block(standin.block_number)
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            await prepare(TransactionsWrapper(rome_interface), snapshots, standin.block_number)
+    standin.block_number += 1
+    await rome_interface.on_block(standin.block_number)
+    standin.reset_counters()
+    started = time.perf_counter()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        await scenario(TransactionsWrapper(rome_interface), snapshots, standin.block_number)
+    return {
+        'wall_time': time.perf_counter() - started,
+        'http_requests': standin.http_requests,
+        'rpc_calls': sum(standin.calls.values()),
+        'transactions': len(standin.transactions)
+    }
+
+
+async def run_scenario(
+        name: str,
+        latency: float,
+        iterations: int,
+        port: int
+) -> dict:
+    """
+    :return: scenario results: median wall time, counts of the last iteration, memory peak
+    """
+    standin = ChainStandin(latency=latency)
+    rpc = AsyncRPC(await standin.start(port=port))
+    account = Account.from_key(BENCHMARK_PRIVATE_KEY)
+    rome_interface = AsyncRomeInterface(Web3(), rpc, account.address, BENCHMARK_PRIVATE_KEY)
+    if name in SCENARIO_SETTINGS:
+        rome_interface.settings = {**rome_interface.settings, **SCENARIO_SETTINGS[name]}
+        rome_interface.event_decoder = rome_interface.build_event_decoder()
+    snapshots = SnapshotService([rome_interface])
+    scenario = SCENARIOS[name]
+    prepare = SCENARIO_PREPARE.get(name)
+    try:
+        await run_iteration(scenario, standin, rome_interface, snapshots, prepare)
+        runs = [await run_iteration(scenario, standin, rome_interface, snapshots, prepare) for _ in range(iterations)]
+
+        tracemalloc.start()
+        try:
+            await run_iteration(scenario, standin, rome_interface, snapshots, prepare)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    finally:
+        await rpc.close()
+        await standin.stop()
+
+    return {
+        'wall_time': round(statistics.median(run['wall_time'] for run in runs), 4),
+        **{key: runs[-1][key] for key in COUNTED_RESULTS},
+        'peak_kib': round(peak / 1024, 1)
+    }
+
+
+def compare(
+        results: dict,
+        baseline: dict,
+        time_tolerance: float,
+        memory_tolerance: float
+) -> list:
+    """
+    :param results: scenario name: scenario results
+    :param baseline: stored baseline, same format plus the latency it was measured with
+    :return: list of regression messages, empty if none
+    """
+    regressions = []
+    for name, result in results.items():
+        reference = baseline['scenarios'].get(name)
+        if reference is None:
+            continue
+        for key in COUNTED_RESULTS:
+            if result[key] > reference[key]:
+                regressions.append(f"{name}: {key} {result[key]} > baseline {reference[key]}")
+        # Wall time is mostly made of injected latency: only comparable with the same one
+        if baseline['latency'] == results[name]['latency'] and \
+                result['wall_time'] > reference['wall_time'] * (1 + time_tolerance):
+            regressions.append(f"{name}: wall time {result['wall_time']}s > baseline {reference['wall_time']}s")
+        if result['peak_kib'] > reference['peak_kib'] * (1 + memory_tolerance):
+            regressions.append(f"{name}: memory peak {result['peak_kib']} KiB > baseline {reference['peak_kib']} KiB")
+    return regressions
+
+
+def print_results(results: dict, baseline: dict):
+    print(f"{'scenario':<25}{'wall time (s)':>15}{'http requests':>15}{'rpc calls':>11}{'txs':>5}{'peak KiB':>10}")
+    for name, result in results.items():
+        print(
+            f"{name:<25}{result['wall_time']:>15}{result['http_requests']:>15}{result['rpc_calls']:>11}"
+            f"{result['transactions']:>5}{result['peak_kib']:>10}"
+        )
+        reference = (baseline or {}).get('scenarios', {}).get(name)
+        if reference:
+            print(
+                f"{'  baseline':<25}{reference['wall_time']:>15}{reference['http_requests']:>15}"
+                f"{reference['rpc_calls']:>11}{reference['transactions']:>5}{reference['peak_kib']:>10}"
+            )
+
+
+async def main(args) -> int:
+    results = {}
+    for name in args.scenario or SCENARIOS:
+        results[name] = await run_scenario(name, args.latency, args.iterations, args.port)
+        results[name]['latency'] = args.latency
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print(f"Latency: {args.latency}s per request, {args.iterations} iterations\n")
+    print_results(results, baseline)
+
+    if args.update_baseline:
+        scenarios = dict(baseline['scenarios']) if baseline and baseline['latency'] == args.latency else {}
+        scenarios.update({
+            name: {key: value for key, value in result.items() if key != 'latency'}
+            for name, result in results.items()
+        })
+        with open(args.baseline, 'w') as f:
+            json.dump({'latency': args.latency, 'scenarios': scenarios}, f, indent=4)
+            f.write('\n')
+        print(f"\nBaseline updated: {args.baseline}")
+        return 0
+
+    if baseline is None:
+        print("\nNo baseline to compare with, run with --update-baseline to store one.")
+        return 0
+    regressions = compare(results, baseline, args.time_tolerance, args.memory_tolerance)
+    if regressions:
+        print("\nREGRESSIONS:\n" + '\n'.join(regressions))
+        return 1
+    print("\nNo regression.")
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark controller cycles against a local chain stand-in.')
+    parser.add_argument('--latency', type=float, default=0.05, help='seconds added to every RPC request')
+    parser.add_argument('--iterations', type=int, default=5, help='measured iterations per scenario')
+    parser.add_argument('--scenario', action='append', choices=list(SCENARIOS), help='scenario to run, all if omitted')
+    parser.add_argument('--port', type=int, default=8645, help='local port of the chain stand-in')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='baseline file to compare with')
+    parser.add_argument('--update-baseline', action='store_true', help='store results as the new baseline')
+    parser.add_argument('--time-tolerance', type=float, default=0.25, help='allowed wall time increase ratio')
+    parser.add_argument('--memory-tolerance', type=float, default=0.5, help='allowed memory peak increase ratio')
+    sys.exit(asyncio.run(main(parser.parse_args())))
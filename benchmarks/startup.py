@@ -0,0 +1,71 @@
+"""
+Startup benchmark: time and resident memory for the bot to get ready to run, measured in fresh interpreters,
+as on each main.py restart or cold Heroku boot. Run from the repository root:
+
+    python -m benchmarks.startup [--runs 5]
+
+Each run imports controllers.controllers (imports, settings, RPC clients, contracts and wallet interfaces),
+in a temporary directory holding a copy of settings.json, so that nothing is written to the repository.
+No request is sent: the bot only reaches the network once the block scheduler runs.
+"""
+from benchmarks.run import BENCHMARK_PRIVATE_KEY
+from eth_account import Account
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+
+REPOSITORY_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STARTUP_CODE = """
+import json, resource, time
+started = time.perf_counter()
+import controllers.controllers
+print(json.dumps({
+    'startup': time.perf_counter() - started,
+    'max_rss_mib': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+}))
+"""
+
+
+def run_startup(directory: str) -> dict:
+    """
+    :param directory: working directory of the run, with a settings.json
+    :return: dict with startup seconds and max resident memory in MiB
+    """
+    env = {
+        **os.environ,
+        'PYTHONPATH': REPOSITORY_PATH,
+        'WALLET_ADDRESS': Account.from_key(BENCHMARK_PRIVATE_KEY).address,
+        'PRIVATE_KEY': BENCHMARK_PRIVATE_KEY
+    }
+    output = subprocess.run(
+        [sys.executable, '-c', STARTUP_CODE],
+        cwd=directory,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main(args):
+    with tempfile.TemporaryDirectory() as directory:
+        shutil.copy(os.path.join(REPOSITORY_PATH, 'settings.json'), directory)
+        # Warm-up run: compiles bytecode caches, as on any restart but the very first one
+        run_startup(directory)
+        results = [run_startup(directory) for _ in range(args.runs)]
+    print(f"Startup over {args.runs} runs:")
+    print(f"- time: {round(statistics.median(result['startup'] for result in results), 3)}s (median)")
+    print(f"- resident memory: {round(max(result['max_rss_mib'] for result in results), 1)} MiB (max)")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure bot startup time and resident memory.')
+    parser.add_argument('--runs', type=int, default=5, help='number of measured runs')
+    main(parser.parse_args())
@@ -0,0 +1,207 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.4;
+
+interface IERC20 {
+    function balanceOf(address account) external view returns (uint256);
+    function allowance(address owner, address spender) external view returns (uint256);
+    function approve(address spender, uint256 amount) external returns (bool);
+    function transfer(address to, uint256 amount) external returns (bool);
+    function transferFrom(address from, address to, uint256 amount) external returns (bool);
+}
+
+interface IRomeBond {
+    function redeem(address recipient, bool stake) external returns (uint256);
+    function deposit(uint256 amount, uint256 maxPrice, address depositor) external returns (uint256);
+}
+
+interface IRomeStaking {
+    function unstake(uint256 amount, bool trigger) external;
+}
+
+interface ISolarbeamPair {
+    function token0() external view returns (address);
+    function getReserves() external view returns (uint112 reserve0, uint112 reserve1, uint32 blockTimestampLast);
+}
+
+interface ISolarbeamRouter {
+    function swapExactTokensForTokens(
+        uint256 amountIn,
+        uint256 amountOutMin,
+        address[] calldata path,
+        address to,
+        uint256 deadline
+    ) external returns (uint256[] memory amounts);
+
+    function addLiquidity(
+        address tokenA,
+        address tokenB,
+        uint256 amountADesired,
+        uint256 amountBDesired,
+        uint256 amountAMin,
+        uint256 amountBMin,
+        address to,
+        uint256 deadline
+    ) external returns (uint256 amountA, uint256 amountB, uint256 liquidity);
+}
+
+/// @title Neron zap
+/// @notice Runs a whole Neron bonding path in a single transaction: redeem pending bond rewards, unstake sROME,
+/// swap ROME for FRAX, add ROME-FRAX liquidity (LP bonds only) and deposit in the bond, on behalf of the caller.
+/// Either every step succeeds or the transaction reverts: no FRAX nor ROME is ever left halfway in the wallet.
+/// The caller approves this contract to spend its ROME and sROME. Bond rewards are credited to the caller, and
+/// nothing is kept by this contract: any leftover of a liquidity add is sent back.
+contract NeronZap {
+    uint256 private constant FEE_BASE = 10000;
+
+    IERC20 public immutable rome;
+    IERC20 public immutable srome;
+    IERC20 public immutable frax;
+    IRomeStaking public immutable staking;
+    ISolarbeamRouter public immutable router;
+    ISolarbeamPair public immutable pair;
+    uint256 public immutable swapFeeBps;
+
+    event Zapped(address indexed depositor, address indexed bond, uint256 romeIn, uint256 principal, uint256 payout);
+
+    constructor(
+        address rome_,
+        address srome_,
+        address frax_,
+        address staking_,
+        address router_,
+        address pair_,
+        uint256 swapFeeBps_
+    ) {
+        rome = IERC20(rome_);
+        srome = IERC20(srome_);
+        frax = IERC20(frax_);
+        staking = IRomeStaking(staking_);
+        router = ISolarbeamRouter(router_);
+        pair = ISolarbeamPair(pair_);
+        swapFeeBps = swapFeeBps_;
+    }
+
+    /// @param redeemBonds bonds to redeem the caller's pending rewards from, without autostaking
+    /// @param sromeAmount sROME of the caller to unstake, 0 to only use ROME
+    /// @param bond bond to deposit in
+    /// @param addLiquidity true for a ROME-FRAX LP bond, false for a FRAX bond
+    /// @param minFraxOut minimum FRAX received from the swap
+    /// @param maxPrice maximum bond price accepted by the bond deposit
+    /// @param deadline timestamp after which the swap and liquidity add revert
+    /// @return payout ROME payout of the bond
+    function zapBond(
+        address[] calldata redeemBonds,
+        uint256 sromeAmount,
+        address bond,
+        bool addLiquidity,
+        uint256 minFraxOut,
+        uint256 maxPrice,
+        uint256 deadline
+    ) external returns (uint256 payout) {
+        uint256 romeIn = _collectRome(redeemBonds, sromeAmount);
+        (IERC20 principal, uint256 principalAmount) = _toPrincipal(romeIn, addLiquidity, minFraxOut, deadline);
+        _approve(principal, bond, principalAmount);
+        payout = IRomeBond(bond).deposit(principalAmount, maxPrice, msg.sender);
+        emit Zapped(msg.sender, bond, romeIn, principalAmount, payout);
+    }
+
+    /// @dev Redeem, pull and unstake: every ROME the caller bonds ends up held by this contract
+    /// @return romeIn ROME held
+    function _collectRome(address[] calldata redeemBonds, uint256 sromeAmount) private returns (uint256 romeIn) {
+        for (uint256 i = 0; i < redeemBonds.length; i++) {
+            IRomeBond(redeemBonds[i]).redeem(msg.sender, false);
+        }
+
+        // Every ROME of the caller, as far as its allowance goes: rewards may have grown since it approved
+        romeIn = _min(rome.balanceOf(msg.sender), rome.allowance(msg.sender, address(this)));
+        require(rome.transferFrom(msg.sender, address(this), romeIn), "NeronZap: ROME transfer failed");
+        if (sromeAmount > 0) {
+            require(srome.transferFrom(msg.sender, address(this), sromeAmount), "NeronZap: sROME transfer failed");
+            _approve(srome, address(staking), sromeAmount);
+            // No rebase trigger: its gains on the sROME held here would be stuck in this contract
+            staking.unstake(sromeAmount, false);
+            romeIn += sromeAmount;
+        }
+        require(romeIn > 0, "NeronZap: nothing to bond");
+    }
+
+    /// @dev Swap, and add liquidity for a LP bond
+    /// @return principal token to deposit in the bond
+    /// @return principalAmount amount of it held by this contract
+    function _toPrincipal(
+        uint256 romeIn,
+        bool addLiquidity,
+        uint256 minFraxOut,
+        uint256 deadline
+    ) private returns (IERC20 principal, uint256 principalAmount) {
+        uint256 romeToSwap = addLiquidity ? _optimalSwapAmount(romeIn) : romeIn;
+        address[] memory path = new address[](2);
+        path[0] = address(rome);
+        path[1] = address(frax);
+        _approve(rome, address(router), romeIn);
+        uint256[] memory amounts = router.swapExactTokensForTokens(romeToSwap, minFraxOut, path, address(this), deadline);
+        if (!addLiquidity) {
+            return (frax, amounts[1]);
+        }
+
+        // Swapped in this same transaction: the pool ratio can't move between the swap and the liquidity add
+        _approve(frax, address(router), amounts[1]);
+        (, , principalAmount) = router.addLiquidity(
+            address(rome),
+            address(frax),
+            romeIn - romeToSwap,
+            amounts[1],
+            0,
+            0,
+            address(this),
+            deadline
+        );
+        _refund(rome);
+        _refund(frax);
+        return (IERC20(address(pair)), principalAmount);
+    }
+
+    /// @dev Amount of ROME to swap so that the FRAX received and the remaining ROME match the pool ratio after
+    /// the swap, as SolarbeamPair.optimal_swap_amount() computes it off-chain
+    function _optimalSwapAmount(uint256 amountIn) private view returns (uint256) {
+        (uint256 reserve0, uint256 reserve1, ) = pair.getReserves();
+        uint256 reserveIn = pair.token0() == address(rome) ? reserve0 : reserve1;
+        uint256 feeFactor = FEE_BASE - swapFeeBps;
+        return (
+            _sqrt(
+                reserveIn * reserveIn * (FEE_BASE + feeFactor) ** 2 + 4 * feeFactor * FEE_BASE * amountIn * reserveIn
+            ) - reserveIn * (FEE_BASE + feeFactor)
+        ) / (2 * feeFactor);
+    }
+
+    function _approve(IERC20 token, address spender, uint256 amount) private {
+        if (token.allowance(address(this), spender) < amount) {
+            require(token.approve(spender, type(uint256).max), "NeronZap: approve failed");
+        }
+    }
+
+    function _refund(IERC20 token) private {
+        uint256 balance = token.balanceOf(address(this));
+        if (balance > 0) {
+            require(token.transfer(msg.sender, balance), "NeronZap: refund failed");
+        }
+    }
+
+    function _min(uint256 a, uint256 b) private pure returns (uint256) {
+        return a < b ? a : b;
+    }
+
+    /// @dev Integer square root (Babylonian method), rounded down like Python math.isqrt
+    function _sqrt(uint256 y) private pure returns (uint256 z) {
+        if (y > 3) {
+            z = y;
+            uint256 x = y / 2 + 1;
+            while (x < z) {
+                z = x;
+                x = (y / x + x) / 2;
+            }
+        } else if (y != 0) {
+            z = 1;
+        }
+    }
+}
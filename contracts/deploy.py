@@ -0,0 +1,274 @@
+"""
+Zap contract deployment. Run from the repository root, as settings.json is read from the working directory:
+
+    python -m contracts.deploy [--rpc URL]
+
+deploys NeronZap (contracts/NeronZap.sol) against the Rome and Solarbeam contracts, from the wallet of the .env file.
+Put the printed address in settings.json zap address, and set zap enabled to true.
+
+    python -m contracts.deploy --mocks --rpc http://127.0.0.1:8545
+
+deploys mock Rome and Solarbeam contracts (contracts/mocks/RomeMocks.sol) and a NeronZap using them on a local dev
+chain (anvil, ganache, hardhat node...), then zaps into a FRAX bond and a ROME-FRAX LP bond, and checks that a zap
+reverting on its last step leaves the wallet untouched. The .env wallet must be one of the dev chain funded accounts.
+
+Contracts are compiled with py-solc-x (pip install py-solc-x), which downloads solc SOLC_VERSION on first run.
+"""
+from models.account_interface import load_env, load_settings
+from models.rome_contracts import RomeContracts
+from models.solarbeam_pair import SolarbeamPair
+from web3 import Web3
+import argparse
+import os
+import time
+
+
+CONTRACTS_PATH = os.path.dirname(os.path.abspath(__file__))
+SOLC_VERSION = '0.8.13'
+SOURCES = [
+    os.path.join(CONTRACTS_PATH, 'NeronZap.sol'),
+    os.path.join(CONTRACTS_PATH, 'mocks', 'RomeMocks.sol')
+]
+
+
+def compile_contracts() -> dict:
+    """
+    :return: contract name -> {'abi': ..., 'bin': ...}
+    """
+    try:
+        import solcx
+    except ImportError:
+        raise SystemExit("Compiling contracts needs py-solc-x: pip install py-solc-x")
+    if SOLC_VERSION not in [str(version) for version in solcx.get_installed_solc_versions()]:
+        print(f"Installing solc {SOLC_VERSION}...")
+        solcx.install_solc(SOLC_VERSION)
+    compiled = solcx.compile_files(SOURCES, output_values=['abi', 'bin'], solc_version=SOLC_VERSION, optimize=True)
+    return {name.split(':')[-1]: output for name, output in compiled.items()}
+
+
+class Deployer:
+    """
+    Deploys and calls contracts from a single wallet, waiting for each transaction to be mined.
+    """
+    def __init__(
+            self,
+            web3,
+            compiled: dict,
+            account_address: str,
+            private_key: str
+    ):
+        self.web3 = web3
+        self.compiled = compiled
+        self.account_address = web3.toChecksumAddress(account_address)
+        self.private_key = private_key
+
+    def send(self, tx: dict) -> dict:
+        """
+        :param tx: transaction dict built by web3, without nonce
+        :return: receipt. Raises if the transaction reverted.
+        """
+        tx['nonce'] = self.web3.eth.get_transaction_count(self.account_address)
+        signed_tx = self.web3.eth.account.sign_transaction(tx, private_key=self.private_key)
+        tx_receipt = self.web3.eth.wait_for_transaction_receipt(self.web3.eth.send_raw_transaction(signed_tx.rawTransaction))
+        if tx_receipt['status'] != 1:
+            raise RuntimeError(f"Transaction reverted: {tx_receipt['transactionHash'].hex()}")
+        return tx_receipt
+
+    def tx_params(self) -> dict:
+        return {
+            'from': self.account_address,
+            'chainId': self.web3.eth.chain_id,
+            'gasPrice': self.web3.eth.gas_price
+        }
+
+    def deploy(self, name: str, *args):
+        """
+        :param name: contract name in compiled sources
+        :return: web3 contract at the deployed address
+        """
+        factory = self.web3.eth.contract(abi=self.compiled[name]['abi'], bytecode=self.compiled[name]['bin'])
+        tx_receipt = self.send(factory.constructor(*args).buildTransaction(self.tx_params()))
+        print(f"{name} deployed at {tx_receipt['contractAddress']}")
+        return self.web3.eth.contract(address=tx_receipt['contractAddress'], abi=self.compiled[name]['abi'])
+
+    def transact(self, contract_function) -> dict:
+        return self.send(contract_function.buildTransaction(self.tx_params()))
+
+
+def deploy_zap(
+        deployer: Deployer,
+        rome: str,
+        srome: str,
+        frax: str,
+        staking: str,
+        router: str,
+        pair: str,
+        swap_fee_bps: int
+):
+    return deployer.deploy('NeronZap', rome, srome, frax, staking, router, pair, swap_fee_bps)
+
+
+def deploy_mocks(
+        deployer: Deployer,
+        swap_fee_bps: int
+) -> dict:
+    """
+    Mock Rome market, same as the benchmark chain stand-in: ROME-FRAX pool at 300 FRAX per ROME, bonds at 280 USD.
+    :return: mock name -> web3 contract
+    """
+    mocks = {
+        'rome': deployer.deploy('MockERC20', 'Rome', 'ROME', 9),
+        'srome': deployer.deploy('MockERC20', 'Staked Rome', 'sROME', 9),
+        'frax': deployer.deploy('MockERC20', 'Frax', 'FRAX', 18)
+    }
+    mocks['staking'] = deployer.deploy('MockRomeStaking', mocks['rome'].address, mocks['srome'].address)
+    mocks['pair'] = deployer.deploy('MockSolarbeamPair', mocks['rome'].address, mocks['frax'].address, swap_fee_bps)
+    mocks['router'] = deployer.deploy('MockSolarbeamRouter', mocks['pair'].address)
+    mocks['bond_frax'] = deployer.deploy('MockRomeBond', mocks['frax'].address, mocks['rome'].address, 28000)
+    # LP bond price, in hundredths of LP token per ROME
+    mocks['bond_rome_frax_lp'] = deployer.deploy('MockRomeBond', mocks['pair'].address, mocks['rome'].address, 10)
+
+    # ROME paid by staking and bonds
+    for payer in ('staking', 'bond_frax', 'bond_rome_frax_lp'):
+        deployer.transact(mocks['rome'].functions.mint(mocks[payer].address, 10 ** 9 * 10 ** 9))
+
+    # Pool liquidity: 10 000 ROME and 3 000 000 FRAX
+    rome_liquidity, frax_liquidity = 10 ** 4 * 10 ** 9, 3 * 10 ** 6 * 10 ** 18
+    deployer.transact(mocks['rome'].functions.mint(deployer.account_address, rome_liquidity))
+    deployer.transact(mocks['frax'].functions.mint(deployer.account_address, frax_liquidity))
+    deployer.transact(mocks['rome'].functions.approve(mocks['router'].address, rome_liquidity))
+    deployer.transact(mocks['frax'].functions.approve(mocks['router'].address, frax_liquidity))
+    deployer.transact(mocks['router'].functions.addLiquidity(
+        mocks['rome'].address,
+        mocks['frax'].address,
+        rome_liquidity,
+        frax_liquidity,
+        0,
+        0,
+        deployer.account_address,
+        int(time.time()) + 3600
+    ))
+    return mocks
+
+
+def balances(mocks: dict, address: str) -> dict:
+    """
+    :return: token name -> balance of address, in wei
+    """
+    return {
+        token: mocks[token].functions.balanceOf(address).call()
+        for token in ('rome', 'srome', 'frax', 'pair')
+    }
+
+
+def smoke_test(
+        deployer: Deployer,
+        mocks: dict,
+        zap,
+        swap_fee_bps: int
+):
+    """
+    Zap into each mock bond with 1 ROME, 1 sROME and 0.1 ROME pending in each bond, then zap with a max price
+    below the bond price: the whole transaction reverts, nothing moves.
+    The mock staking credits rebase gains on a triggered unstake: no token left in the zap means it doesn't trigger.
+    """
+    wallet = deployer.account_address
+    bonds = [mocks['bond_frax'], mocks['bond_rome_frax_lp']]
+
+    def fund():
+        deployer.transact(mocks['rome'].functions.mint(wallet, 10 ** 9))
+        deployer.transact(mocks['srome'].functions.mint(wallet, 10 ** 9))
+        for bond in bonds:
+            deployer.transact(bond.functions.setPendingPayout(wallet, 10 ** 8))
+        srome_amount = mocks['srome'].functions.balanceOf(wallet).call()
+        deployer.transact(mocks['rome'].functions.approve(zap.address, 2 ** 256 - 1))
+        deployer.transact(mocks['srome'].functions.approve(zap.address, srome_amount))
+        return srome_amount
+
+    def zap_bond(bond, add_liquidity: bool, max_price: int, srome_amount: int):
+        pair = SolarbeamPair.from_reserves(
+            mocks['rome'].address,
+            mocks['frax'].address,
+            mocks['pair'].functions.getReserves().call(),
+            swap_fee_bps
+        )
+        rome_amount = mocks['rome'].functions.balanceOf(wallet).call() + 2 * 10 ** 8 + srome_amount
+        rome_to_swap = pair.optimal_swap_amount(rome_amount, mocks['rome'].address) if add_liquidity else rome_amount
+        return zap.functions.zapBond(
+            [bond.address for bond in bonds],
+            srome_amount,
+            bond.address,
+            add_liquidity,
+            pair.apply_slippage(pair.get_amount_out(rome_to_swap, mocks['rome'].address), 0.01),
+            max_price,
+            int(time.time()) + 300
+        )
+
+    for bond, add_liquidity in ((mocks['bond_frax'], False), (mocks['bond_rome_frax_lp'], True)):
+        srome_amount = fund()
+        payout_before = bond.functions.bondInfo(wallet).call()[0]
+        rome_before, frax_before = balances(mocks, wallet)['rome'], balances(mocks, wallet)['frax']
+        deployer.transact(zap_bond(bond, add_liquidity, bond.functions.bondPrice().call(), srome_amount))
+        payout = bond.functions.bondInfo(wallet).call()[0] - payout_before
+        after = balances(mocks, wallet)
+        assert payout > 0, "no bond payout"
+        assert balances(mocks, zap.address) == dict.fromkeys(('rome', 'srome', 'frax', 'pair'), 0), "tokens left in zap"
+        assert after['srome'] == 0, "sROME left in wallet"
+        # Liquidity add leftovers are refunded
+        print(f"Zap into {'ROME-FRAX LP' if add_liquidity else 'FRAX'} bond: {payout / 10 ** 9} ROME payout, "
+              f"refunded: {after['rome'] / 10 ** 9} ROME and {(after['frax'] - frax_before) / 10 ** 18} FRAX "
+              f"out of {(rome_before + 2 * 10 ** 8 + srome_amount) / 10 ** 9} ROME")
+
+    srome_amount = fund()
+    before = balances(mocks, wallet)
+    try:
+        deployer.transact(zap_bond(mocks['bond_frax'], False, mocks['bond_frax'].functions.bondPrice().call() - 1, srome_amount))
+    except (ValueError, RuntimeError) as e:
+        print(f"Zap above max price reverted: {e}")
+    else:
+        raise AssertionError("zap above max price did not revert")
+    assert balances(mocks, wallet) == before, "reverted zap moved tokens"
+    print("Smoke test passed: wallet untouched by the reverted zap.")
+
+
+def main(args):
+    load_env()
+    settings = load_settings()
+    web3 = Web3(Web3.HTTPProvider(args.rpc or settings['rpc']['endpoints'][0]))
+    deployer = Deployer(web3, compile_contracts(), os.getenv('WALLET_ADDRESS'), os.getenv('PRIVATE_KEY'))
+    swap_fee_bps = settings['solarbeam']['swap_fee_bps']
+
+    if args.mocks:
+        mocks = deploy_mocks(deployer, swap_fee_bps)
+        zap = deploy_zap(
+            deployer,
+            mocks['rome'].address,
+            mocks['srome'].address,
+            mocks['frax'].address,
+            mocks['staking'].address,
+            mocks['router'].address,
+            mocks['pair'].address,
+            swap_fee_bps
+        )
+        smoke_test(deployer, mocks, zap, swap_fee_bps)
+        return
+
+    rome_contracts = RomeContracts(web3)
+    zap = deploy_zap(
+        deployer,
+        rome_contracts.rome_address,
+        rome_contracts.srome_address,
+        rome_contracts.frax_address,
+        rome_contracts.staking_rome_address,
+        rome_contracts.solarbeam_router_address,
+        rome_contracts.rome_frax_lp_address,
+        swap_fee_bps
+    )
+    print(f"Set settings.json zap address to {zap.address}, and zap enabled to true.")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Deploy the Neron zap contract.')
+    parser.add_argument('--rpc', help='HTTP endpoint to deploy on, first settings.json rpc endpoint by default')
+    parser.add_argument('--mocks', action='store_true', help='deploy mock Rome contracts and smoke test the zap (dev chain only)')
+    main(parser.parse_args())
@@ -0,0 +1,296 @@
+// SPDX-License-Identifier: MIT
+pragma solidity ^0.8.4;
+
+// Minimal stand-ins for the Rome and Solarbeam contracts the zap calls, with the same function signatures and
+// events, to try NeronZap on a local dev chain. Anyone can mint and set pending rewards: never deploy on a live chain.
+
+contract MockERC20 {
+    string public name;
+    string public symbol;
+    uint8 public immutable decimals;
+    uint256 public totalSupply;
+    mapping(address => uint256) public balanceOf;
+    mapping(address => mapping(address => uint256)) public allowance;
+
+    event Transfer(address indexed from, address indexed to, uint256 value);
+    event Approval(address indexed owner, address indexed spender, uint256 value);
+
+    constructor(string memory name_, string memory symbol_, uint8 decimals_) {
+        name = name_;
+        symbol = symbol_;
+        decimals = decimals_;
+    }
+
+    function mint(address to, uint256 amount) external {
+        _mint(to, amount);
+    }
+
+    function approve(address spender, uint256 amount) external returns (bool) {
+        allowance[msg.sender][spender] = amount;
+        emit Approval(msg.sender, spender, amount);
+        return true;
+    }
+
+    function transfer(address to, uint256 amount) external returns (bool) {
+        _transfer(msg.sender, to, amount);
+        return true;
+    }
+
+    function transferFrom(address from, address to, uint256 amount) external returns (bool) {
+        if (allowance[from][msg.sender] != type(uint256).max) {
+            require(allowance[from][msg.sender] >= amount, "MockERC20: allowance too low");
+            allowance[from][msg.sender] -= amount;
+        }
+        _transfer(from, to, amount);
+        return true;
+    }
+
+    function _mint(address to, uint256 amount) internal {
+        totalSupply += amount;
+        balanceOf[to] += amount;
+        emit Transfer(address(0), to, amount);
+    }
+
+    function _transfer(address from, address to, uint256 amount) internal {
+        require(balanceOf[from] >= amount, "MockERC20: balance too low");
+        balanceOf[from] -= amount;
+        balanceOf[to] += amount;
+        emit Transfer(from, to, amount);
+    }
+}
+
+/// @notice Staking contract: sROME in, the same amount of ROME out. Holds the ROME it pays.
+/// A triggered rebase grows the caller's sROME balance by 1% before unstaking, as a real rebase would.
+contract MockRomeStaking {
+    MockERC20 public immutable rome;
+    MockERC20 public immutable srome;
+
+    constructor(address rome_, address srome_) {
+        rome = MockERC20(rome_);
+        srome = MockERC20(srome_);
+    }
+
+    function unstake(uint256 amount, bool trigger) external {
+        if (trigger) {
+            srome.mint(msg.sender, srome.balanceOf(msg.sender) / 100);
+        }
+        srome.transferFrom(msg.sender, address(this), amount);
+        rome.transfer(msg.sender, amount);
+    }
+}
+
+/// @notice Bond depository: fixed price, pending payouts set by hand, paid from the ROME it holds.
+contract MockRomeBond {
+    struct Bond {
+        uint256 payout;
+        uint256 vesting;
+        uint256 lastBlock;
+        uint256 pricePaid;
+    }
+
+    MockERC20 public immutable principal;
+    MockERC20 public immutable rome;
+    // Hundredths of principal token per ROME, as Rome bondPrice()
+    uint256 public bondPrice;
+    uint256 public constant VESTING_BLOCKS = 36000;
+    mapping(address => Bond) public bondInfo;
+    mapping(address => uint256) public pendingPayoutFor;
+
+    event BondCreated(uint256 deposit, uint256 indexed payout, uint256 indexed expires, uint256 indexed priceInUSD);
+    event BondRedeemed(address indexed recipient, uint256 payout, uint256 remaining);
+
+    constructor(address principal_, address rome_, uint256 bondPrice_) {
+        principal = MockERC20(principal_);
+        rome = MockERC20(rome_);
+        bondPrice = bondPrice_;
+    }
+
+    function bondPriceInUSD() public view returns (uint256) {
+        return bondPrice * 10 ** (principal.decimals() - 2);
+    }
+
+    function setPendingPayout(address recipient, uint256 payout) external {
+        pendingPayoutFor[recipient] = payout;
+    }
+
+    function deposit(uint256 amount, uint256 maxPrice, address depositor) external returns (uint256 payout) {
+        require(maxPrice >= bondPrice, "Slippage limit: more than max price");
+        principal.transferFrom(msg.sender, address(this), amount);
+        payout = amount * 100 / bondPrice / 10 ** (principal.decimals() - rome.decimals());
+        require(payout > 0, "Bond too small");
+        Bond storage info = bondInfo[depositor];
+        info.payout += payout;
+        info.vesting = VESTING_BLOCKS;
+        info.lastBlock = block.number;
+        info.pricePaid = bondPriceInUSD();
+        emit BondCreated(amount, payout, block.number + VESTING_BLOCKS, info.pricePaid);
+    }
+
+    function redeem(address recipient, bool) external returns (uint256 payout) {
+        payout = pendingPayoutFor[recipient];
+        pendingPayoutFor[recipient] = 0;
+        rome.transfer(recipient, payout);
+        emit BondRedeemed(recipient, payout, bondInfo[recipient].payout);
+    }
+}
+
+/// @notice Constant product pair, Uniswap V2 math with a swapFeeBps fee. Also the LP token.
+contract MockSolarbeamPair is MockERC20 {
+    address public immutable token0;
+    address public immutable token1;
+    uint256 public immutable swapFeeBps;
+    uint112 private reserve0;
+    uint112 private reserve1;
+
+    event Mint(address indexed sender, uint256 amount0, uint256 amount1);
+    event Swap(
+        address indexed sender,
+        uint256 amount0In,
+        uint256 amount1In,
+        uint256 amount0Out,
+        uint256 amount1Out,
+        address indexed to
+    );
+    event Sync(uint112 reserve0, uint112 reserve1);
+
+    constructor(address tokenA, address tokenB, uint256 swapFeeBps_) MockERC20("Solarbeam LP Token", "SLP", 18) {
+        token0 = tokenA < tokenB ? tokenA : tokenB;
+        token1 = tokenA < tokenB ? tokenB : tokenA;
+        swapFeeBps = swapFeeBps_;
+    }
+
+    function getReserves() public view returns (uint112, uint112, uint32) {
+        return (reserve0, reserve1, uint32(block.timestamp));
+    }
+
+    /// @notice Mint LP tokens for the tokens sent to the pair since last update
+    function mint(address to) external returns (uint256 liquidity) {
+        uint256 balance0 = MockERC20(token0).balanceOf(address(this));
+        uint256 balance1 = MockERC20(token1).balanceOf(address(this));
+        uint256 amount0 = balance0 - reserve0;
+        uint256 amount1 = balance1 - reserve1;
+        if (totalSupply == 0) {
+            liquidity = _sqrt(amount0 * amount1);
+        } else {
+            liquidity = _min(amount0 * totalSupply / reserve0, amount1 * totalSupply / reserve1);
+        }
+        require(liquidity > 0, "MockSolarbeamPair: insufficient liquidity minted");
+        _mint(to, liquidity);
+        _update(balance0, balance1);
+        emit Mint(msg.sender, amount0, amount1);
+    }
+
+    /// @notice Send amounts out, for the tokens sent to the pair since last update
+    function swap(uint256 amount0Out, uint256 amount1Out, address to) external {
+        if (amount0Out > 0) MockERC20(token0).transfer(to, amount0Out);
+        if (amount1Out > 0) MockERC20(token1).transfer(to, amount1Out);
+        uint256 balance0 = MockERC20(token0).balanceOf(address(this));
+        uint256 balance1 = MockERC20(token1).balanceOf(address(this));
+        uint256 amount0In = balance0 > reserve0 - amount0Out ? balance0 - (reserve0 - amount0Out) : 0;
+        uint256 amount1In = balance1 > reserve1 - amount1Out ? balance1 - (reserve1 - amount1Out) : 0;
+        require(
+            (balance0 * 10000 - amount0In * swapFeeBps) * (balance1 * 10000 - amount1In * swapFeeBps)
+                >= uint256(reserve0) * reserve1 * 10000 ** 2,
+            "MockSolarbeamPair: K"
+        );
+        _update(balance0, balance1);
+        emit Swap(msg.sender, amount0In, amount1In, amount0Out, amount1Out, to);
+    }
+
+    function _update(uint256 balance0, uint256 balance1) private {
+        reserve0 = uint112(balance0);
+        reserve1 = uint112(balance1);
+        emit Sync(reserve0, reserve1);
+    }
+
+    function _min(uint256 a, uint256 b) private pure returns (uint256) {
+        return a < b ? a : b;
+    }
+
+    function _sqrt(uint256 y) private pure returns (uint256 z) {
+        if (y > 3) {
+            z = y;
+            uint256 x = y / 2 + 1;
+            while (x < z) {
+                z = x;
+                x = (y / x + x) / 2;
+            }
+        } else if (y != 0) {
+            z = 1;
+        }
+    }
+}
+
+/// @notice Router of a single pair, same swap and liquidity math as Uniswap V2 router
+contract MockSolarbeamRouter {
+    MockSolarbeamPair public immutable pair;
+
+    constructor(address pair_) {
+        pair = MockSolarbeamPair(pair_);
+    }
+
+    function swapExactTokensForTokens(
+        uint256 amountIn,
+        uint256 amountOutMin,
+        address[] calldata path,
+        address to,
+        uint256 deadline
+    ) external returns (uint256[] memory amounts) {
+        require(deadline >= block.timestamp, "MockSolarbeamRouter: expired");
+        require(path.length == 2, "MockSolarbeamRouter: single pair only");
+        (uint256 reserveIn, uint256 reserveOut) = _getReserves(path[0]);
+        uint256 amountInWithFee = amountIn * (10000 - pair.swapFeeBps());
+        amounts = new uint256[](2);
+        amounts[0] = amountIn;
+        amounts[1] = amountInWithFee * reserveOut / (reserveIn * 10000 + amountInWithFee);
+        require(amounts[1] >= amountOutMin, "MockSolarbeamRouter: insufficient output amount");
+        MockERC20(path[0]).transferFrom(msg.sender, address(pair), amountIn);
+        if (path[0] == pair.token0()) {
+            pair.swap(0, amounts[1], to);
+        } else {
+            pair.swap(amounts[1], 0, to);
+        }
+    }
+
+    function addLiquidity(
+        address tokenA,
+        address tokenB,
+        uint256 amountADesired,
+        uint256 amountBDesired,
+        uint256 amountAMin,
+        uint256 amountBMin,
+        address to,
+        uint256 deadline
+    ) external returns (uint256 amountA, uint256 amountB, uint256 liquidity) {
+        require(deadline >= block.timestamp, "MockSolarbeamRouter: expired");
+        (amountA, amountB) = _liquidityAmounts(tokenA, amountADesired, amountBDesired);
+        require(amountA >= amountAMin && amountB >= amountBMin, "MockSolarbeamRouter: insufficient amount");
+        MockERC20(tokenA).transferFrom(msg.sender, address(pair), amountA);
+        MockERC20(tokenB).transferFrom(msg.sender, address(pair), amountB);
+        liquidity = pair.mint(to);
+    }
+
+    function _liquidityAmounts(
+        address tokenA,
+        uint256 amountADesired,
+        uint256 amountBDesired
+    ) private view returns (uint256, uint256) {
+        (uint256 reserveA, uint256 reserveB) = _getReserves(tokenA);
+        if (reserveA == 0 && reserveB == 0) {
+            return (amountADesired, amountBDesired);
+        }
+        uint256 amountBOptimal = amountADesired * reserveB / reserveA;
+        if (amountBOptimal <= amountBDesired) {
+            return (amountADesired, amountBOptimal);
+        }
+        return (amountBDesired * reserveA / reserveB, amountBDesired);
+    }
+
+    function _getReserves(address tokenIn) private view returns (uint256, uint256) {
+        (uint256 reserve0, uint256 reserve1, ) = pair.getReserves();
+        if (tokenIn == pair.token0()) {
+            return (reserve0, reserve1);
+        }
+        return (reserve1, reserve0);
+    }
+}
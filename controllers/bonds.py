@@ -1,97 +1,170 @@
+from controllers.pipeline import Step
+from functools import partial
 
 
-def frax_bond(
-        tx_performer,
-        bond_data: dict,
-        use_pending: bool
-) -> dict:
-
-    settings = tx_performer.rome_interface.settings
-    logged_txs = []
-
-    if use_pending:
-        print("Using pending rewards...")
-        if bond_data["pending_rewards"]["rome_frax"] > settings["min_pending_rewards_to_claim"]:
-            tx = tx_performer.redeem_rome_frax(do_autostake=False)
-            logged_txs.append(tx)
+# --------- BONDING PATHS ---------
+# Turn our unstaked ROME into the bond principal token, then bond it.
+# Keys are the path names of the bond descriptors, see models/bond_registry.py
+# Each path is a list of pipeline steps, run by the pipeline executor, see controllers/pipeline.py.
 
-        if bond_data["pending_rewards"]["gohm"] > settings["min_pending_rewards_to_claim"]:
-            tx = tx_performer.redeem_gohm(do_autostake=False)
-            logged_txs.append(tx)
+def swap_outputs(changes: dict) -> dict:
+    # Swap result used by the next steps, from a swap mined while the process was down
+    return {'frax_received_wei': changes.get('frax', 0)}
 
-        if bond_data["pending_rewards"]["frax"] > settings["min_pending_rewards_to_claim"]:
-            tx = tx_performer.redeem_frax(do_autostake=False)
-            logged_txs.append(tx)
 
-    else:
-        print("Using stacked ROME...")
-        if bond_data["pending_rewards"]["frax"] > settings["min_pending_rewards_to_claim"]:
-            tx = tx_performer.redeem_frax(do_autostake=False)
-            logged_txs.append(tx)
-
-        # After claiming FRAX reawards, we can unstake our total sRome balance
-        tx = tx_performer.unstake(bond_data["srome_balance"])
-        logged_txs.append(tx)
-
-    # Then, we can swap our ROME for FRAX
-    swap_tx = tx_performer.swap(total_balance=True)
-
-    # Finally, we bond our FRAX
-    bonding_tx = tx_performer.bond_frax(frax_amount=swap_tx["frax_received_wei"])
-
-    logged_txs = logged_txs + [swap_tx, bonding_tx]
-    return {
-        'bond': 'FRAX',
-        'discount': bond_data['frax_discount'],
-        'path': logged_txs
-    }
+def unwind_swap(
+        tx_performer,
+        swap_result: dict
+) -> Step:
+    # FRAX received but not bonded: swap it back to ROME
+    return Step(
+        'unwind_swap',
+        partial(tx_performer.swap_back, swap_result['frax_received_wei']),
+        function='swapExactTokensForTokens'
+    )
 
 
-def rome_frax_bond(
+def frax_path(
+        tx_performer,
+        bond,
+        after: tuple
+) -> list:
+    return [
+        # Swap our ROME for FRAX
+        Step(
+            'swap',
+            partial(tx_performer.swap, total_balance=True),
+            after=after,
+            function='swapExactTokensForTokens',
+            recover=swap_outputs,
+            unwind=partial(unwind_swap, tx_performer)
+        ),
+        # Then we bond our FRAX
+        Step(
+            'bond',
+            partial(tx_performer.bond, bond),
+            inputs={'amount': 'swap.frax_received_wei'},
+            function='deposit'
+        )
+    ]
+
+
+def rome_frax_lp_path(
+        tx_performer,
+        bond,
+        after: tuple
+) -> list:
+    return [
+        # Swap just enough ROME for FRAX to add liquidity with all of it
+        Step(
+            'swap',
+            partial(tx_performer.swap, total_balance=False),
+            after=after,
+            function='swapExactTokensForTokens',
+            recover=swap_outputs,
+            unwind=partial(unwind_swap, tx_performer)
+        ),
+        # Now we add rome-frax liquidity
+        Step(
+            'add_liquidity',
+            tx_performer.add_liquidity,
+            inputs={'frax_amount': 'swap.frax_received_wei'},
+            function='addLiquidity'
+        ),
+        # Finally we can bond: LP tokens left by an unfinished run are bonded by the next one
+        Step(
+            'bond',
+            partial(tx_performer.bond, bond),
+            after=('add_liquidity',),
+            function='deposit'
+        )
+    ]
+
+
+BONDING_PATHS = {
+    'frax': frax_path,
+    'rome_frax_lp': rome_frax_lp_path
+}
+
+
+def bond_pipeline(
+        tx_performer,
+        bond: str,
+        redeem_bonds: list,
+        unstake: bool,
+        srome_balance: float = 0
+) -> list:
+    """
+    Whole bonding path: claims without autostaking, unstake, then the bond path.
+    :param bond: name of the bond to bond in
+    :param redeem_bonds: names of the bonds to claim pending rewards from
+    :param unstake: True to unstake our sROME balance too
+    :param srome_balance: sROME balance to unstake, for display only: the whole balance is unstaked
+    :return: pipeline steps
+    """
+    registry = tx_performer.rome_interface.bond_registry
+    # Claims and unstake are independent from each other: they run concurrently
+    steps = [
+        Step(
+            f'redeem_{redeem_bond}',
+            partial(tx_performer.redeem, registry.get(redeem_bond), do_autostake=False),
+            function='redeem'
+        )
+        for redeem_bond in redeem_bonds
+    ]
+    if unstake:
+        steps.append(Step('unstake', partial(tx_performer.unstake, srome_balance), function='unstake'))
+
+    bond = registry.get(bond)
+    return steps + BONDING_PATHS[bond.path](tx_performer, bond, after=tuple(step.name for step in steps))
+
+
+PIPELINES = {
+    'bond': bond_pipeline
+}
+
+
+async def process_bond(
         tx_performer,
+        bond,
         bond_data: dict,
-        use_pending: bool
+        use_pending: bool,
+        executor
 ) -> dict:
-
+    """
+    :param executor: PipelineExecutor running the step by step path, with PIPELINES
+    """
     settings = tx_performer.rome_interface.settings
-    logged_txs = []
 
     if use_pending:
-        print("Using pending rewards...")
-        if bond_data["pending_rewards"]["frax"] > settings["min_pending_rewards_to_claim"]:
-            tx = tx_performer.redeem_frax(do_autostake=False)
-            logged_txs.append(tx)
-
-        if bond_data["pending_rewards"]["gohm"] > settings["min_pending_rewards_to_claim"]:
-            tx = tx_performer.redeem_gohm(do_autostake=False)
-            logged_txs.append(tx)
-
-        if bond_data["pending_rewards"]["rome_frax"] > settings["min_pending_rewards_to_claim"]:
-            tx = tx_performer.redeem_rome_frax(do_autostake=False)
-            logged_txs.append(tx)
-
+        redeem_bonds = [
+            pending_bond for pending_bond in tx_performer.rome_interface.bond_registry.all()
+            if bond_data["pending_rewards"][pending_bond.name] > settings["min_pending_rewards_to_claim"]
+        ]
     else:
-        print("Using stacked ROME...")
-        if bond_data["pending_rewards"]["rome_frax"] > settings["min_pending_rewards_to_claim"]:
-            tx = tx_performer.redeem_rome_frax(do_autostake=False)
-            logged_txs.append(tx)
-
-        # After claiming ROME-FRAX reawards, we can unstake our total sRome balance
-        tx = tx_performer.unstake(bond_data["srome_balance"])
-        logged_txs.append(tx)
-
-    # Then, we can swap our ROME for FRAX
-    swap_tx = tx_performer.swap(total_balance=False)
-
-    # Now we add rome-frax liquidity
-    add_liq_tx = tx_performer.add_liquidity(frax_amount=swap_tx["frax_received_wei"])
-
-    # Finally we can bond
-    bonding_tx = tx_performer.bond_rome_frax_lp()
-
-    logged_txs = logged_txs + [swap_tx, add_liq_tx, bonding_tx]
+        redeem_bonds = [bond] if bond_data["pending_rewards"][bond.name] > settings["min_pending_rewards_to_claim"] else []
+
+    if settings['zap']['enabled'] and tx_performer.rome_interface.get_zap_contract() is not None:
+        # Whole path in a single transaction: same claims and unstake, one confirmation, nothing stranded midway
+        return {
+            'bond': bond.label,
+            'discount': bond_data['discounts'][bond.name],
+            'path': [await tx_performer.zap_bond(bond, redeem_bonds, unstake=not use_pending)]
+        }
+
+    print("Using pending rewards..." if use_pending else "Using stacked ROME...")
+    run = await executor.run(tx_performer, 'bond', {
+        'bond': bond.name,
+        'redeem_bonds': [redeem_bond.name for redeem_bond in redeem_bonds],
+        'unstake': not use_pending,
+        'srome_balance': bond_data["srome_balance"]
+    })
+    if run['status'] != 'done':
+        print(f"{bond.label} bond stopped halfway: it will be resumed or unwound on next block.")
     return {
-        'bond': 'ROME-FRAX LP',
-        'discount': bond_data['rome_frax_discount'],
-        'path': logged_txs
+        'bond': bond.label,
+        'discount': bond_data['discounts'][bond.name],
+        'run_id': run['run_id'],
+        'status': run['status'],
+        'path': run['path']
     }
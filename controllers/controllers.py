@@ -1,124 +1,277 @@
-import asyncio
-from controllers.bonds import frax_bond, rome_frax_bond
-from controllers.rebase import rebase
+from controllers.bonds import PIPELINES, process_bond
+from controllers.pipeline import PipelineExecutor
+from controllers.rebase import prepare_rebase, rebase
+from controllers.scheduler import BlockScheduler
 from datetime import datetime
+from functools import partial
+from logger.checkpoints import CheckpointStore
 from logger.logger import Logger
-from models.rome_interface import RomeInterface
+from logger.metrics import METRICS
+from models.account_interface import load_settings, load_wallets
+from models.async_rome_interface import AsyncRomeInterface
+from models.chain_snapshot import SnapshotService
+from models.rebase_predictor import RebasePredictor
+from models.rpc_pool import RPCPool
+from models.rpc_recorder import RecordingRPC, RPCRecorder
+from models.rpc_replay import ReplayRPC, RPCReplay
 from models.transactions_wrapper import TransactionsWrapper
 from web3 import Web3
-import random
+import asyncio
+import time
 
 
-web3 = Web3(Web3.HTTPProvider("https://rpc.api.moonriver.moonbeam.network/"))
-rome_interface = RomeInterface(web3)
-tx_performer = TransactionsWrapper(rome_interface)
+SETTINGS = load_settings()
+# web3 is only used to encode calls and sign transactions, all requests go through the async rpc endpoint pool,
+# so all per-block hooks below really run concurrently.
+web3 = Web3(Web3.HTTPProvider(SETTINGS['rpc']['endpoints'][0]))
+# Contracts are only ever given addresses: without this, web3 builds a new ENS client for each contract
+web3.ens = None
+rpc = RPCPool.from_settings(SETTINGS['rpc'])
+ws_endpoint = SETTINGS['rpc']['ws_endpoint']
+# Session mode: record every RPC request of a live session, or replay a recorded session instead of the network
+recorder = None
+if SETTINGS['session']['mode'] == 'record':
+    recorder = RPCRecorder(SETTINGS['session']['path'])
+    rpc = RecordingRPC(rpc, recorder)
+elif SETTINGS['session']['mode'] == 'replay':
+    rpc = ReplayRPC(RPCReplay.load(SETTINGS['session']['path'], SETTINGS['session']['time_dilation']))
+    # Blocks come from the recorded timeline, through eth_blockNumber polling
+    ws_endpoint = None
 logger = Logger()
+scheduler = BlockScheduler(rpc, ws_endpoint)
+if recorder is not None:
+    scheduler.on_block(recorder.on_block)
+
+# One interface per wallet, each with its own nonce manager and allowances. Gas price and receipts are shared.
+rome_interfaces = []
+for wallet_address, wallet_private_key in load_wallets():
+    rome_interfaces.append(AsyncRomeInterface(
+        web3,
+        rpc,
+        wallet_address,
+        wallet_private_key,
+        fee_oracle=rome_interfaces[0].fee_oracle if rome_interfaces else None,
+        receipt_tracker=rome_interfaces[0].receipt_tracker if rome_interfaces else None
+    ))
+# Receipts of every wallet transactions are fetched in a single batch per block
+if rome_interfaces:
+    scheduler.on_block(rome_interfaces[0].receipt_tracker.on_block)
+# Market state and every wallet balances are read in a single batched call per block
+snapshots = SnapshotService(rome_interfaces)
 
+# Bonding paths run step by step, checkpointed in the journal database: a restart picks unfinished ones up
+pipelines = PipelineExecutor(CheckpointStore(), PIPELINES, SETTINGS['pipeline']['max_resumes'])
 
-async def optimize_rebase():
-    while True:
+# Block after which the next rebase can be claimed again, by wallet address
+rebase_claimed_until_block = {}
+# When the rebase hooks need chain state: rebase block, block time and claim latency are the same for every wallet
+rebase_predictor = RebasePredictor(**SETTINGS['rebase'])
+for past_rebase in logger.journal.get_operations('REBASE', limit=rebase_predictor.claim_latencies.maxlen):
+    if past_rebase.get('duration') and any(past_rebase.get('path', [])):
+        rebase_predictor.record_claim(past_rebase['duration'])
+scheduler.on_block(rebase_predictor.on_block)
 
-        # Gathering pending rewards informations: individual bonds + total balance
-        pending_rewards = rome_interface.get_all_bond_pending_rewards()
 
-        await asyncio.sleep(random.randint(3, 7))
+async def optimize_rebase(
+        tx_performer: TransactionsWrapper,
+        block_number: int
+):
+    rome_interface = tx_performer.rome_interface
 
-        # Checking number of blocks before next rebase (1 block ~= 5sec)
-        next_rebase = rome_interface.check_blocks_before_rebase()
-        print(f"{next_rebase} blocks before rebase\n")
+    # Already claimed for this epoch: nothing to do until rebase happened
+    if block_number <= rebase_claimed_until_block.get(rome_interface.account_address, 0):
+        return
 
-        # If ~5min left, claim and autostake pending rewards
-        if next_rebase < 30:
-            rebase_result = rebase(tx_performer, pending_rewards)
-            print("Successfully claimed and autostaked !\n")
-            logger.log_move(
-                operation="REBASE",
-                data=rebase_result
-            )
+    # Rebase block known and still far: nothing to read until shortly before the trigger block
+    if not rebase_predictor.should_check(block_number):
+        return
 
-            await asyncio.sleep(300)
+    # Block snapshot shared with optimize_bonds: epoch and pending rewards (individual bonds + total balance)
+    snapshot = await snapshots.get(block_number, rome_interface.account_address)
+    rebase_predictor.set_epoch(snapshot["epoch"])
 
+    # Checking number of blocks before next rebase, and how many blocks a claim round needs to be mined before it
+    next_rebase = snapshot["blocks_before_rebase"]
+    lead_blocks = rebase_predictor.lead_blocks()
+    print(f"{next_rebase} blocks before rebase, claiming {lead_blocks} blocks before\n")
+
+    if next_rebase < lead_blocks:
+        started = time.monotonic()
+        rebase_result = await rebase(tx_performer, snapshot["pending_rewards"])
+        duration = time.monotonic() - started
+        snapshots.invalidate()
+        sent = [tx_result for tx_result in rebase_result['path'] if tx_result]
+        if sent:
+            rebase_predictor.record_claim(duration)
+        if not sent:
+            print(f"{rome_interface.account_address}: No pending rewards to claim before rebase.\n")
+        elif any(tx_result.get('tx_status') == 1 for tx_result in sent):
+            print(f"{rome_interface.account_address}: Successfully claimed and autostaked !\n")
+        else:
+            print(f"{rome_interface.account_address}: [FAIL] - Claims failed.\n")
+        logger.log_move(
+            operation="REBASE",
+            data={
+                'wallet': rome_interface.account_address,
+                'block_number': block_number,
+                'duration': round(duration, 3),
+                **rebase_result
+            }
+        )
+        # Once the epoch end is past, the rebase is only waiting for its trigger: don't claim again meanwhile
+        rebase_claimed_until_block[rome_interface.account_address] = block_number + max(next_rebase, lead_blocks)
 
-async def optimize_bonds():
-    while True:
+    elif rebase_predictor.should_check(block_number + 1):
+        # Trigger is coming: claims are signed ahead, so that at trigger they are only broadcast
+        await prepare_rebase(tx_performer, snapshot["pending_rewards"])
 
-        # Gathering all important informations: discounts, srome balance, and pending rewards
-        bond_data = {
-            'frax_discount': rome_interface.get_bond_discount(rome_interface.bond_frax_contract),
-            #'rome_frax_discount': rome_interface.get_bond_discount(rome_interface.bond_rome_frax_lp_contract),
-            'srome_balance': rome_interface.get_stacked_balance(),
-            'pending_rewards': rome_interface.get_all_bond_pending_rewards()
-        }
+    else:
+        wake_block = rebase_predictor.wake_block(block_number)
+        seconds = rebase_predictor.seconds_until(block_number, wake_block)
+        print(f"Next rebase check on block {wake_block}" + (f", in ~{round(seconds / 60)} min\n" if seconds is not None else "\n"))
 
-        print(datetime.now())
-        print(
-            f'FRAX: {bond_data["frax_discount"]} %\n'
-            #f'ROME-FRAX LP: {bond_data["rome_frax_discount"]} %\n'
-            f'Pending bond rewards: {bond_data["pending_rewards"]["total"]} ROME\n'
+
+async def resume_bonds(
+        tx_performer: TransactionsWrapper,
+        bond_data: dict,
+        block_number: int
+) -> bool:
+    """
+    :return: True if an unfinished bond sent transactions
+    """
+    rome_interface = tx_performer.rome_interface
+    min_bond_discount = rome_interface.settings["min_bond_discount"]
+    started = time.monotonic()
+    outcomes = await pipelines.resume_open_runs(
+        tx_performer,
+        lambda pipeline, params: bond_data["discounts"].get(params['bond'], 0) > min_bond_discount
+    )
+    for outcome in outcomes:
+        logger.log_move(
+            operation="BOND",
+            data={
+                'wallet': rome_interface.account_address,
+                'block_number': block_number,
+                'duration': round(time.monotonic() - started, 3),
+                'bond': rome_interface.bond_registry.get(outcome['params']['bond']).label,
+                'discount': bond_data["discounts"].get(outcome['params']['bond']),
+                'run_id': outcome['run_id'],
+                'action': outcome['action'],
+                'status': outcome['status'],
+                'path': outcome['path']
+            }
         )
+    if any(outcome['path'] for outcome in outcomes):
+        snapshots.invalidate()
+        return True
+    return False
 
-        # Checking if we'll use pending rewards.
-        # If user has decided to use pending in his setting,
-        # And his pending rewards > min sRome balance to bond defined in settings
-        # And his pending rewards > his sRome balance, we can use pending rewards.
-        if rome_interface.settings["use_pending_rewards"] and \
-            bond_data["pending_rewards"]["total"] > rome_interface.settings["min_srome_balance_to_bond"] and \
-            bond_data["pending_rewards"]["total"] > bond_data["srome_balance"]:
-            use_pending = True
-        else:
-            use_pending = False
-
-        # Two conditions to meet before bonding: Discount A > Discount B and Discount > min discount defined in settings
-
-        # FRAX BOND
-        if bond_data["frax_discount"] > rome_interface.settings["min_bond_discount"]:
-
-            # Condition 1 met.
-            # Now, we have to check if user has enough balance to bond.
-            if bond_data["srome_balance"] + bond_data["pending_rewards"]["frax"] > rome_interface.settings["min_srome_balance_to_bond"] or use_pending:
-
-                print(f"Good discount found on FRAX: {bond_data['frax_discount']} %")
-
-                # We can finally process our bond.
-                bond_result = frax_bond(
-                    tx_performer,
-                    bond_data,
-                    use_pending
-                )
-                print("Frax bond successful !\n")
-                logger.log_move(
-                    operation="BOND",
-                    data=bond_result
-                )
-
-            else:
-                print(f"Good discount found on FRAX: {bond_data['frax_discount']} %, but not enough sRome balance !")
-
-        # # ROME-FRAX BOND
-        # elif bond_data["rome_frax_discount"] > bond_data["frax_discount"] and \
-        #         bond_data["rome_frax_discount"] > rome_interface.settings["min_bond_discount"]:
-        #
-        #     if bond_data["srome_balance"] + bond_data["pending_rewards"]["rome_frax"] > rome_interface.settings["min_srome_balance_to_bond"] or use_pending:
-        #
-        #         print(f"Good discount found on ROME-FRAX LP: {bond_data['rome_frax_discount']} %")
-        #
-        #         bond_result = rome_frax_bond(
-        #             tx_performer,
-        #             bond_data,
-        #             use_pending
-        #         )
-        #         print("Rome-Frax LP bond successful !\n")
-        #         logger.log_move(
-        #             operation="BOND",
-        #             data=bond_result
-        #         )
-        #
-        #     else:
-        #         print(f"Good discount found on ROME-FRAX LP: {bond_data['rome_frax_discount']} %, but not enough sRome balance !")
-
-        await asyncio.sleep(random.randint(1, 7))
+
+async def optimize_bonds(
+        tx_performer: TransactionsWrapper,
+        block_number: int
+):
+    rome_interface = tx_performer.rome_interface
+
+    # Gathering all important informations: discounts of every enabled bond, srome balance, and pending rewards
+    # All read in a single batched call, on the same block, shared with optimize_rebase and other wallets
+    bond_data = await snapshots.get(block_number, rome_interface.account_address)
+
+    # Bonds a crash or a failed step left halfway: completed while still above min discount, unwound otherwise.
+    # Nothing else is bonded on the same block.
+    if await resume_bonds(tx_performer, bond_data, block_number):
+        return
+
+    print(datetime.now())
+    print(
+        f'{rome_interface.account_address}\n' +
+        ''.join(
+            f'{rome_interface.bond_registry.get(name).label}: {discount} %\n'
+            for name, discount in bond_data["discounts"].items()
+        ) +
+        f'Pending bond rewards: {bond_data["pending_rewards"]["total"]} ROME\n'
+    )
+
+    # Checking if we'll use pending rewards.
+    # If user has decided to use pending in his setting,
+    # And his pending rewards > min sRome balance to bond defined in settings
+    # And his pending rewards > his sRome balance, we can use pending rewards.
+    if rome_interface.settings["use_pending_rewards"] and \
+        bond_data["pending_rewards"]["total"] > rome_interface.settings["min_srome_balance_to_bond"] and \
+        bond_data["pending_rewards"]["total"] > bond_data["srome_balance"]:
+        use_pending = True
+    else:
+        use_pending = False
+
+    # Two conditions to meet before bonding: best discount among enabled bonds, and discount > min discount
+    # defined in settings
+    bond, discount = rome_interface.discount_engine.best_bond(
+        bond_data["discounts"],
+        rome_interface.settings["min_bond_discount"]
+    )
+    if bond is None:
+        return
+
+    # Condition 1 met.
+    # Now, we have to check if user has enough balance to bond.
+    if bond_data["srome_balance"] + bond_data["pending_rewards"][bond.name] > rome_interface.settings["min_srome_balance_to_bond"] or use_pending:
+
+        print(f"Good discount found on {bond.label}: {discount} %")
+
+        # We can finally process our bond.
+        started = time.monotonic()
+        bond_result = await process_bond(
+            tx_performer,
+            bond,
+            bond_data,
+            use_pending,
+            pipelines
+        )
+        snapshots.invalidate()
+        if bond_result.get('status', 'done') == 'done':
+            print(f"{bond.label} bond successful !\n")
+        logger.log_move(
+            operation="BOND",
+            data={
+                'wallet': rome_interface.account_address,
+                'block_number': block_number,
+                'duration': round(time.monotonic() - started, 3),
+                **bond_result
+            }
+        )
+
+    else:
+        print(f"Good discount found on {bond.label}: {discount} %, but not enough sRome balance !")
+
+
+# Each wallet has its own hooks, so its own transaction queue: a wallet busy bonding doesn't delay the other ones
+for wallet_interface in rome_interfaces:
+    wallet_tx_performer = TransactionsWrapper(wallet_interface)
+    scheduler.on_block(wallet_interface.on_block)
+    scheduler.on_block(partial(optimize_rebase, wallet_tx_performer))
+    scheduler.on_block(partial(optimize_bonds, wallet_tx_performer))
 
 
 async def main():
-    tasks = [asyncio.create_task(coro()) for coro in (optimize_rebase, optimize_bonds)]
-    await asyncio.wait(tasks)
+    # Operation logs and console output are written in background, out of the transactions path
+    logger.start()
+    metrics_runner, metrics_summaries = None, None
+    if SETTINGS['metrics']['enabled']:
+        try:
+            metrics_runner = await METRICS.start_server(SETTINGS['metrics']['host'], SETTINGS['metrics']['port'])
+        except OSError as e:
+            # Metrics are optional: run without the endpoint rather than not at all
+            print(f"[FAIL] - Metrics endpoint not served on {SETTINGS['metrics']['host']}:{SETTINGS['metrics']['port']}: {e}")
+        metrics_summaries = asyncio.ensure_future(METRICS.print_summaries(SETTINGS['metrics']['summary_interval']))
+    try:
+        await scheduler.run()
+    finally:
+        # Summaries are printed even when the endpoint couldn't be served
+        if metrics_summaries is not None:
+            metrics_summaries.cancel()
+        if metrics_runner is not None:
+            await metrics_runner.cleanup()
+        await rpc.close()
+        if recorder is not None:
+            recorder.flush()
+        await logger.close()
@@ -0,0 +1,264 @@
+from models.async_account_interface import TX_SENT_LISTENER
+import asyncio
+
+
+class Step:
+    """
+    A step of a pipeline: one action sending the transactions of one operation (ex: a swap, with its approval).
+    """
+    def __init__(
+            self,
+            name: str,
+            action,
+            inputs: dict = None,
+            after: tuple = (),
+            function: str = None,
+            recover=None,
+            unwind=None
+    ):
+        """
+        :param name: step name, unique in its pipeline
+        :param action: coroutine function, called with inputs as keyword arguments, returning a transaction result
+        dict (tx_hash, tx_status...). The step succeeded if tx_status is 1.
+        :param inputs: keyword argument -> 'step.key' reference to the result of a previous step, ex:
+        {'amount': 'swap.frax_received_wei'}. Referenced steps are dependencies.
+        :param after: names of steps to wait for, without using their results
+        :param function: contract function of the step main transaction, ex: swapExactTokensForTokens. If a
+        transaction calling it was mined while the process was down, the step is recovered instead of run again.
+        :param recover: function(token name -> balance change in wei of the recovered transaction) -> dict of
+        result keys, for steps whose result is used as an input
+        :param unwind: function(step result) -> Step undoing what the step left in the wallet, if a dependent
+        step can't complete
+        """
+        self.name = name
+        self.action = action
+        self.inputs = inputs or {}
+        self.after = after
+        self.function = function
+        self.recover = recover
+        self.unwind = unwind
+
+    @property
+    def dependencies(self) -> set:
+        return set(self.after) | {reference.split('.')[0] for reference in self.inputs.values()}
+
+
+def succeeded(result: dict) -> bool:
+    return result is not None and result.get('tx_status') == 1
+
+
+class PipelineExecutor:
+    """
+    Runs pipelines of steps, checkpointing their progress in a CheckpointStore:
+    - a step starts as soon as its dependencies succeeded, so independent steps (ex: claims of different bonds)
+    run concurrently. Once a step failed, no other step starts: its dependents would run on missing tokens.
+    - each transaction hash is checkpointed as soon as it is broadcast, each step result once it is known.
+    A run which didn't complete (a failed step, or a crash) stays open. resume_open_runs() picks it up in place:
+    steps whose transaction got mined meanwhile are recovered from their receipts, then the run either goes on
+    with the remaining steps, or unwinds the steps whose results were left halfway (ex: swaps FRAX back to ROME).
+    Pipelines are built again from their name and parameters, so a resume only needs the checkpoints.
+    """
+    def __init__(
+            self,
+            checkpoints,
+            pipelines: dict,
+            max_resumes: int = 3
+    ):
+        """
+        :param checkpoints: CheckpointStore, see logger/checkpoints.py
+        :param pipelines: pipeline name -> function(tx_performer, **params) -> list of Steps
+        :param max_resumes: resumes of a run before giving up on completing it: it is unwound instead, with as
+        many attempts, then abandoned
+        """
+        self.checkpoints = checkpoints
+        self.pipelines = pipelines
+        self.max_resumes = max_resumes
+
+    async def run(
+            self,
+            tx_performer,
+            pipeline: str,
+            params: dict
+    ) -> dict:
+        """
+        :param tx_performer: TransactionsWrapper of the wallet
+        :param pipeline: pipeline name
+        :param params: pipeline parameters, JSON serializable
+        :return: dict with run_id, status (done or stranded) and path: results of the steps run, in step order
+        """
+        steps = self.pipelines[pipeline](tx_performer, **params)
+        run_id = self.checkpoints.create_run(tx_performer.rome_interface.account_address, pipeline, params)
+        results, path = await self._execute(tx_performer, run_id, steps, {})
+        status = 'done' if len(results) == len(steps) else 'stranded'
+        self.checkpoints.set_run_status(run_id, status)
+        return {
+            'run_id': run_id,
+            'status': status,
+            'path': path
+        }
+
+    async def resume_open_runs(
+            self,
+            tx_performer,
+            proceed
+    ) -> list:
+        """
+        Complete or unwind every open run of the wallet.
+        :param tx_performer: TransactionsWrapper of the wallet
+        :param proceed: function(pipeline name, params) -> True if the run is still worth completing
+        :return: one dict per open run: run_id, pipeline, params, action (completed, resumed, unwound or abandoned),
+        status and path
+        """
+        outcomes = []
+        for run in self.checkpoints.get_open_runs(tx_performer.rome_interface.account_address):
+            steps = self.pipelines[run['pipeline']](tx_performer, **run['params'])
+            results = await self._recover(tx_performer, run, steps)
+            outcome = {'run_id': run['id'], 'pipeline': run['pipeline'], 'params': run['params'], 'path': []}
+
+            if len(results) == len(steps):
+                # Last steps got mined while the process was down
+                outcome.update(action='completed', status='done')
+            elif run['resumes'] < self.max_resumes and proceed(run['pipeline'], run['params']):
+                print(f"Resuming {run['pipeline']} run {run['id']}, from {len(results)}/{len(steps)} steps done...")
+                self.checkpoints.set_run_status(run['id'], 'running', resumed=True)
+                results, outcome['path'] = await self._execute(tx_performer, run['id'], steps, results)
+                outcome.update(action='resumed', status='done' if len(results) == len(steps) else 'stranded')
+            elif run['resumes'] >= 2 * self.max_resumes:
+                print(f"[FAIL] - Giving up {run['pipeline']} run {run['id']}: its tokens are left in the wallet.")
+                outcome.update(action='abandoned', status='abandoned')
+            else:
+                print(f"Unwinding {run['pipeline']} run {run['id']}...")
+                unwind_steps = self._unwind_steps(steps, results)
+                self.checkpoints.set_run_status(run['id'], 'running', resumed=True)
+                unwound = await self._recover(tx_performer, run, unwind_steps)
+                unwound, outcome['path'] = await self._execute(tx_performer, run['id'], unwind_steps, unwound)
+                outcome.update(action='unwound', status='unwound' if len(unwound) == len(unwind_steps) else 'stranded')
+
+            self.checkpoints.set_run_status(run['id'], outcome['status'])
+            outcomes.append(outcome)
+        return outcomes
+
+    @staticmethod
+    def _unwind_steps(
+            steps: list,
+            results: dict
+    ) -> list:
+        """
+        :return: steps undoing every succeeded step one of its dependents didn't consume, latest first. Steps without
+        unwind leave their tokens in the wallet (ex: claimed ROME, used by the next bond anyway).
+        """
+        left_halfway = [
+            step for step in steps
+            if step.name in results and any(
+                step.name in other.dependencies and other.name not in results for other in steps
+            )
+        ]
+        return [step.unwind(results[step.name]) for step in reversed(left_halfway) if step.unwind is not None]
+
+    async def _recover(
+            self,
+            tx_performer,
+            run: dict,
+            steps: list
+    ) -> dict:
+        """
+        :return: step name -> result, for steps which succeeded, from checkpoints or from their mined transactions
+        """
+        results = {}
+        for step in steps:
+            state = run['steps'].get(step.name)
+            if state is None:
+                continue
+            if state['status'] == 'done':
+                results[step.name] = state['result']
+                continue
+            # Interrupted or failed: one of its transactions may still have been mined
+            result = await self._recover_step(tx_performer, run['id'], step, state['txs'])
+            if result is not None:
+                results[step.name] = result
+        return results
+
+    async def _recover_step(
+            self,
+            tx_performer,
+            run_id: int,
+            step: Step,
+            txs: list
+    ) -> dict:
+        tx_hashes = [tx_hash for tx_hash, function in txs if function == step.function]
+        if not tx_hashes:
+            return None
+        tx_receipts = await asyncio.gather(
+            *(tx_performer.rome_interface.wait_for_transaction_receipt(tx_hash) for tx_hash in tx_hashes),
+            return_exceptions=True
+        )
+        for tx_hash, tx_receipt in zip(tx_hashes, tx_receipts):
+            if isinstance(tx_receipt, Exception) or tx_receipt['status'] != 1:
+                continue
+            _, changes = tx_performer.rome_interface.apply_receipt(tx_receipt)
+            result = {
+                'tx_type': step.name,
+                'tx_hash': tx_hash,
+                'tx_status': 1,
+                'recovered': True,
+                **(step.recover(changes) if step.recover is not None else {})
+            }
+            print(f"{step.name} transaction was mined: {tx_hash}")
+            self.checkpoints.set_step(run_id, step.name, 'done', result)
+            return result
+        return None
+
+    async def _execute(
+            self,
+            tx_performer,
+            run_id: int,
+            steps: list,
+            results: dict
+    ) -> tuple:
+        """
+        Run every step not in results, each as soon as its dependencies succeeded.
+        :param results: step name -> result of steps already succeeded
+        :return: tuple (step name -> result of succeeded steps, results of the steps run, in step order)
+        """
+        results = dict(results)
+        run_results = {}
+        pending = [step for step in steps if step.name not in results]
+        running = {}
+        failed = False
+        while pending or running:
+            if not failed:
+                for step in [step for step in pending if step.dependencies.issubset(results)]:
+                    pending.remove(step)
+                    running[asyncio.ensure_future(self._run_step(run_id, step, results))] = step
+            if not running:
+                break
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                step = running.pop(task)
+                run_results[step.name] = task.result()
+                if succeeded(run_results[step.name]):
+                    results[step.name] = run_results[step.name]
+                else:
+                    failed = True
+        return results, [run_results[step.name] for step in steps if step.name in run_results]
+
+    async def _run_step(
+            self,
+            run_id: int,
+            step: Step,
+            results: dict
+    ) -> dict:
+        self.checkpoints.set_step(run_id, step.name, 'running')
+        # Each broadcast transaction is checkpointed before its receipt is awaited. Set in this step task only.
+        TX_SENT_LISTENER.set(lambda tx_hash, function: self.checkpoints.add_tx(run_id, step.name, tx_hash, function))
+        kwargs = {
+            argument: results[reference.split('.')[0]][reference.split('.')[1]]
+            for argument, reference in step.inputs.items()
+        }
+        try:
+            result = await step.action(**kwargs)
+        except Exception as e:
+            print(f"[FAIL] - {step.name} failed: {e}")
+            result = {'tx_type': step.name, 'tx_hash': None, 'tx_status': 0, 'error': str(e)}
+        self.checkpoints.set_step(run_id, step.name, 'done' if succeeded(result) else 'failed', result)
+        return result
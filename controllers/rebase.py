@@ -1,25 +1,40 @@
+def bonds_to_claim(
+        tx_performer,
+        pending_rewards: dict
+) -> list:
+    """
+    :return: Bond descriptors with enough pending rewards to be claimed
+    """
+    min_pending_rewards_to_claim = tx_performer.rome_interface.settings['min_pending_rewards_to_claim']
+    return [
+        bond for bond in tx_performer.rome_interface.bond_registry.all()
+        if pending_rewards[bond.name] > min_pending_rewards_to_claim
+    ]
 
 
-def rebase(
+async def prepare_rebase(
         tx_performer,
         pending_rewards: dict,
-) -> dict:
+):
+    # Claims are signed ahead of the trigger, so that rebase() only broadcasts them
+    await tx_performer.prepare_claims(bonds_to_claim(tx_performer, pending_rewards))
 
-    # Workflow
-    frax_tx, rome_frax_tx, gohm_tx = {}, {}, {}
-    if pending_rewards['frax'] > tx_performer.rome_interface.settings['min_pending_rewards_to_claim']:
-        frax_tx = tx_performer.redeem_frax(do_autostake=True)
 
-    if pending_rewards['rome_frax'] > tx_performer.rome_interface.settings['min_pending_rewards_to_claim']:
-        rome_frax_tx = tx_performer.redeem_rome_frax(do_autostake=True)
+async def rebase(
+        tx_performer,
+        pending_rewards: dict,
+) -> dict:
 
-    if pending_rewards['gohm'] > tx_performer.rome_interface.settings['min_pending_rewards_to_claim']:
-        gohm_tx = tx_performer.redeem_gohm(do_autostake=True)
+    # Workflow
+    # Claims are independent from each other: they are broadcast back-to-back with consecutive nonces,
+    # and their receipts are awaited concurrently.
+    bonds = bonds_to_claim(tx_performer, pending_rewards)
+    presigned = bool(bonds) and tx_performer.rome_interface.claim_presigner.is_ready(
+        [bond.bond_contract for bond in bonds]
+    )
+    claim_txs = dict(zip((bond.name for bond in bonds), await tx_performer.redeem_all(bonds)))
 
     return {
-        'path': [
-            frax_tx,
-            rome_frax_tx,
-            gohm_tx
-        ]
+        'presigned': presigned,
+        'path': [claim_txs.get(bond.name, {}) for bond in tx_performer.rome_interface.bond_registry.all()]
     }
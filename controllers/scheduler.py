@@ -0,0 +1,124 @@
+from logger.metrics import METRICS
+import asyncio
+import json
+import time
+import traceback
+import websockets
+
+
+class BlockScheduler:
+    """
+    Fires registered hooks once per new block.
+    New blocks are received through a newHeads websocket subscription, with eth_blockNumber polling as fallback.
+    Each hook runs in its own task: if several blocks arrive while a hook is still running,
+    it is called again only once, with the latest block (missed blocks are coalesced).
+    """
+    def __init__(
+            self,
+            rpc,
+            ws_uri: str = None,
+            poll_interval: float = 2,
+            ws_retry_interval: float = 60
+    ):
+        """
+        :param rpc: AsyncRPC client used for polling
+        :param ws_uri: websocket endpoint for newHeads subscription. If None, only polling is used.
+        :param poll_interval: seconds between two eth_blockNumber polls
+        :param ws_retry_interval: seconds to poll before trying to subscribe again after a websocket failure
+        """
+        self.rpc = rpc
+        self.ws_uri = ws_uri
+        self.poll_interval = poll_interval
+        self.ws_retry_interval = ws_retry_interval
+        self.hooks = []
+        self.latest_block = None
+        self.latest_block_time = None
+        self._events = []
+
+    def on_block(self, hook):
+        """
+        Register a hook. Can be used as a decorator.
+        :param hook: coroutine function taking the new block number as argument
+        :return: the hook
+        """
+        self.hooks.append(hook)
+        return hook
+
+    async def run(self):
+        self._events = [asyncio.Event() for _ in self.hooks]
+        runners = [
+            asyncio.create_task(self._run_hook(hook, event))
+            for hook, event in zip(self.hooks, self._events)
+        ]
+        try:
+            await self._watch_blocks()
+        finally:
+            for runner in runners:
+                runner.cancel()
+
+    def new_block(self, block_number: int):
+        """
+        Notify hooks of a new block. Already seen blocks are ignored.
+        """
+        if self.latest_block is not None and block_number <= self.latest_block:
+            return
+        self.latest_block = block_number
+        self.latest_block_time = time.monotonic()
+        for event in self._events:
+            event.set()
+
+    async def _run_hook(self, hook, event: asyncio.Event):
+        # Per-wallet hooks are partials of the same function
+        labels = {'hook': getattr(hook, 'func', hook).__name__}
+        while True:
+            await event.wait()
+            event.clear()
+            started = time.monotonic()
+            METRICS.observe('neron_hook_lag_seconds', started - self.latest_block_time, labels)
+            try:
+                await hook(self.latest_block)
+            except Exception:
+                # A failing hook must not stop the other ones: it will be retried on next block
+                METRICS.inc('neron_hook_errors_total', labels)
+                traceback.print_exc()
+            METRICS.observe('neron_hook_tick_seconds', time.monotonic() - started, labels)
+
+    async def _watch_blocks(self):
+        while True:
+            if self.ws_uri:
+                try:
+                    await self._subscribe_new_heads()
+                except Exception as e:
+                    print(f"newHeads subscription lost ({e}), falling back to polling.")
+                await self._poll_blocks(self.ws_retry_interval)
+            else:
+                await self._poll_blocks()
+
+    async def _subscribe_new_heads(self):
+        async with websockets.connect(self.ws_uri) as ws:
+            await ws.send(json.dumps({
+                'jsonrpc': '2.0',
+                'id': 1,
+                'method': 'eth_subscribe',
+                'params': ['newHeads']
+            }))
+            response = json.loads(await ws.recv())
+            if 'error' in response:
+                raise ValueError(response['error'])
+
+            async for message in ws:
+                notification = json.loads(message)
+                if notification.get('method') == 'eth_subscription':
+                    self.new_block(int(notification['params']['result']['number'], 16))
+
+    async def _poll_blocks(self, duration: float = None):
+        """
+        :param duration: seconds to poll for, forever if None
+        """
+        started = time.monotonic()
+        while duration is None or time.monotonic() - started < duration:
+            try:
+                self.new_block(int(await self.rpc.request('eth_blockNumber'), 16))
+            except Exception as e:
+                print(f"Block polling failed: {e}")
+            await asyncio.sleep(self.poll_interval)
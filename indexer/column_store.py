@@ -0,0 +1,112 @@
+import json
+import numpy as np
+import os
+
+
+class ColumnStore:
+    """
+    Local columnar store of indexed logs. Each stream (ex: frax_bond_created) is a directory of segments,
+    one compressed NumPy archive per indexed block range (<first block>-<last block>.npz) holding one array
+    per column, so a query only loads the segments and columns it needs.
+    checkpoint.json holds the last indexed block: segments past it were written by an interrupted run,
+    they are deleted when the store is opened, and their blocks indexed again.
+    """
+    def __init__(self, path: str = 'logs_store'):
+        """
+        :param path: store directory, created if missing
+        """
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self.last_block = None
+        checkpoint_path = os.path.join(path, 'checkpoint.json')
+        if os.path.exists(checkpoint_path):
+            with open(checkpoint_path) as f:
+                self.last_block = json.load(f)['last_block']
+        for stream in self.streams():
+            for first_block, _, segment_path in self.segments(stream):
+                if self.last_block is None or first_block > self.last_block:
+                    os.remove(segment_path)
+
+    def streams(self) -> list:
+        return sorted(
+            name for name in os.listdir(self.path)
+            if os.path.isdir(os.path.join(self.path, name))
+        )
+
+    def segments(self, stream: str) -> list:
+        """
+        :return: list of (first block, last block, file path) of the stream segments, by block
+        """
+        stream_path = os.path.join(self.path, stream)
+        if not os.path.isdir(stream_path):
+            return []
+        segments = []
+        for name in os.listdir(stream_path):
+            if name.endswith('.npz'):
+                first_block, last_block = (int(block) for block in name[:-len('.npz')].split('-'))
+                segments.append((first_block, last_block, os.path.join(stream_path, name)))
+        return sorted(segments)
+
+    def write(
+            self,
+            first_block: int,
+            last_block: int,
+            streams: dict
+    ):
+        """
+        Store the logs of a block range, then move the checkpoint to its last block.
+        Each file is written to a temporary file first, then renamed: a crash never leaves a partial file.
+        :param first_block: first block of the range, right after the checkpoint
+        :param last_block: last block of the range
+        :param streams: stream name -> dict of column name -> array, all of the same length.
+        Streams without rows get no segment.
+        """
+        for stream, columns in streams.items():
+            if not len(columns['block_number']):
+                continue
+            stream_path = os.path.join(self.path, stream)
+            os.makedirs(stream_path, exist_ok=True)
+            segment_path = os.path.join(stream_path, f'{first_block}-{last_block}.npz')
+            # np.savez adds the .npz extension to names without it
+            with open(segment_path + '.tmp', 'wb') as f:
+                np.savez_compressed(f, **columns)
+            os.replace(segment_path + '.tmp', segment_path)
+
+        checkpoint_path = os.path.join(self.path, 'checkpoint.json')
+        with open(checkpoint_path + '.tmp', 'w') as f:
+            json.dump({'last_block': last_block}, f)
+        os.replace(checkpoint_path + '.tmp', checkpoint_path)
+        self.last_block = last_block
+
+    def read(
+            self,
+            stream: str,
+            start_block: int = None,
+            end_block: int = None,
+            columns: list = None
+    ) -> dict:
+        """
+        :param stream: stream name
+        :param start_block: first block, included. From the first indexed block if None.
+        :param end_block: last block, included. Up to the checkpoint if None.
+        :param columns: columns to load, all of them if None
+        :return: dict of column name -> array, rows sorted by block and log index. Empty dict if no row.
+        """
+        parts = []
+        for first_block, last_block, segment_path in self.segments(stream):
+            if (start_block is not None and last_block < start_block) or (end_block is not None and first_block > end_block):
+                continue
+            with np.load(segment_path) as segment:
+                block_number = segment['block_number']
+                mask = np.ones(len(block_number), dtype=bool)
+                if start_block is not None:
+                    mask &= block_number >= start_block
+                if end_block is not None:
+                    mask &= block_number <= end_block
+                parts.append({
+                    column: segment[column][mask]
+                    for column in (columns or segment.files) if column in segment.files
+                })
+        if not parts:
+            return {}
+        return {column: np.concatenate([part[column] for part in parts]) for column in parts[0]}
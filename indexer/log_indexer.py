@@ -0,0 +1,295 @@
+from models.event_decoder import EventDecoder
+import asyncio
+import numpy as np
+import time
+
+
+# Node errors meaning the range holds too many logs, or is too wide, for a single eth_getLogs
+RANGE_ERRORS = (
+    'too many',
+    'more than',
+    'range',
+    'limit exceeded',
+    'size exceeded',
+    'timeout',
+    'timed out'
+)
+
+
+def is_range_error(error: Exception) -> bool:
+    """
+    :param error: exception raised by an eth_getLogs request
+    :return: True if a smaller block range may succeed
+    """
+    if isinstance(error, asyncio.TimeoutError):
+        return True
+    return isinstance(error, ValueError) and any(message in str(error.args[0]).lower() for message in RANGE_ERRORS)
+
+
+class LogStream:
+    """
+    One event of one contract, stored as its own set of columns. Every stream has block_number, log_index
+    and transaction_hash columns, followed by its own columns.
+    """
+    def __init__(
+            self,
+            name: str,
+            contract,
+            event: str,
+            columns: dict
+    ):
+        """
+        :param name: stream name, ex: frax_bond_created
+        :param contract: web3 contract emitting the event
+        :param event: event name
+        :param columns: column name -> (event argument name, kind). Kind is a number of decimals for token amounts,
+        stored in token units as float64, 'int' for integers stored as int64, or 'address' for addresses stored as
+        20 bytes.
+        """
+        self.name = name
+        self.contract = contract
+        self.event = event
+        self.columns = columns
+
+    def to_row(self, decoded: dict) -> dict:
+        """
+        :param decoded: EventDecoder.decode() result
+        :return: column name -> value
+        """
+        row = {
+            'block_number': decoded['block_number'],
+            'log_index': decoded['log_index'],
+            'transaction_hash': decoded['transaction_hash']
+        }
+        for column, (argument, kind) in self.columns.items():
+            value = decoded['args'][argument]
+            if kind == 'address':
+                row[column] = bytes.fromhex(value[2:])
+            elif kind == 'int':
+                row[column] = value
+            else:
+                row[column] = value / 10 ** kind
+        return row
+
+    def to_arrays(self, rows: list) -> dict:
+        """
+        :param rows: to_row() results
+        :return: column name -> array
+        """
+        dtypes = {
+            'block_number': np.int64,
+            'log_index': np.int32,
+            'transaction_hash': 'S32',
+            **{
+                column: 'S20' if kind == 'address' else np.int64 if kind == 'int' else np.float64
+                for column, (_, kind) in self.columns.items()
+            }
+        }
+        return {column: np.array([row[column] for row in rows], dtype=dtype) for column, dtype in dtypes.items()}
+
+
+def rome_streams(rome_contracts, bond_registry) -> list:
+    """
+    :param rome_contracts: RomeContracts instance
+    :param bond_registry: BondRegistry instance
+    :return: streams of bond deposits and redeems of every known bond, sROME rebases and ROME-FRAX pair swaps
+    and reserves. Rebases are indexed from sROME LogRebase, emitted when the staking contract rebases:
+    the staking contract has no rebase event of its own.
+    """
+    streams = []
+    for bond in bond_registry.all():
+        streams.append(LogStream(f'{bond.name}_bond_created', bond.bond_contract, 'BondCreated', {
+            'deposit': ('deposit', bond.principal_decimals),
+            'payout': ('payout', 9),
+            'expires': ('expires', 'int'),
+            'price_in_usd': ('priceInUSD', 18)
+        }))
+        streams.append(LogStream(f'{bond.name}_bond_redeemed', bond.bond_contract, 'BondRedeemed', {
+            'recipient': ('recipient', 'address'),
+            'payout': ('payout', 9),
+            'remaining': ('remaining', 9)
+        }))
+    streams.append(LogStream('srome_rebase', rome_contracts.srome_contract, 'LogRebase', {
+        'epoch': ('epoch', 'int'),
+        'rebase': ('rebase', 18),
+        'index': ('index', 9)
+    }))
+
+    # Pair tokens are sorted by address, see SolarbeamPair.from_reserves
+    rome, frax = ('0', '1') if int(rome_contracts.rome_address, 16) < int(rome_contracts.frax_address, 16) else ('1', '0')
+    streams.append(LogStream('rome_frax_sync', rome_contracts.rome_frax_lp_contract, 'Sync', {
+        'rome_reserve': (f'reserve{rome}', 9),
+        'frax_reserve': (f'reserve{frax}', 18)
+    }))
+    streams.append(LogStream('rome_frax_swap', rome_contracts.rome_frax_lp_contract, 'Swap', {
+        'sender': ('sender', 'address'),
+        'to': ('to', 'address'),
+        'rome_in': (f'amount{rome}In', 9),
+        'frax_in': (f'amount{frax}In', 18),
+        'rome_out': (f'amount{rome}Out', 9),
+        'frax_out': (f'amount{frax}Out', 18)
+    }))
+    return streams
+
+
+class LogIndexer:
+    """
+    Backfills, then follows, the logs of a set of streams into a ColumnStore, with one eth_getLogs filter
+    covering every stream.
+    Block ranges are fetched several at a time, and their size adapts to log density: a range the node refuses
+    (too many results, too wide, timeout) is split in two and the chunk size shrinks; when ranges come back
+    sparse, the chunk size doubles. Only blocks with enough confirmations are indexed, so indexed logs are never
+    reorganized away. Progress is checkpointed in the store every checkpoint_interval seconds: a restart resumes
+    from the last checkpoint.
+    """
+    def __init__(
+            self,
+            rpc,
+            store,
+            streams: list,
+            start_block: int = 0,
+            chunk_blocks: int = 2000,
+            max_chunk_blocks: int = 100000,
+            target_logs: int = 2000,
+            concurrency: int = 4,
+            confirmations: int = 12,
+            checkpoint_interval: float = 60
+    ):
+        """
+        :param rpc: AsyncRPC client
+        :param store: ColumnStore
+        :param streams: list of LogStream
+        :param start_block: first block to index, when the store is empty
+        :param chunk_blocks: initial block range size of a single eth_getLogs
+        :param max_chunk_blocks: maximum block range size
+        :param target_logs: number of logs per range above which ranges stop growing
+        :param concurrency: number of ranges fetched at the same time
+        :param confirmations: number of blocks on top of the last indexed one
+        :param checkpoint_interval: seconds between two writes to the store
+        """
+        self.rpc = rpc
+        self.store = store
+        self.streams = {}
+        self.decoder = EventDecoder()
+        for stream in streams:
+            self.streams[(stream.contract.address.lower(), stream.event)] = stream
+            self.decoder.add_contract(stream.contract, [stream.event])
+        self.addresses = self.decoder.addresses()
+        self.topics = self.decoder.topics()
+        self.start_block = start_block
+        self.chunk_blocks = chunk_blocks
+        self.max_chunk_blocks = max_chunk_blocks
+        self.target_logs = target_logs
+        self.concurrency = concurrency
+        self.confirmations = confirmations
+        self.checkpoint_interval = checkpoint_interval
+        # Logs fetched since the last checkpoint, by stream name
+        self._rows = {stream.name: [] for stream in streams}
+        self._buffered_from = None
+        self._buffered_until = None
+        self._checkpointed = time.monotonic()
+        self._split = False
+
+    def next_block(self) -> int:
+        """
+        :return: first block not fetched yet
+        """
+        if self._buffered_until is not None:
+            return self._buffered_until + 1
+        if self.store.last_block is not None:
+            return self.store.last_block + 1
+        return self.start_block
+
+    async def fetch_logs(
+            self,
+            first_block: int,
+            last_block: int
+    ) -> list:
+        """
+        :return: logs of every stream in this block range, split into smaller ranges as long as the node refuses it
+        """
+        try:
+            return await self.rpc.request('eth_getLogs', [{
+                'fromBlock': hex(first_block),
+                'toBlock': hex(last_block),
+                'address': self.addresses,
+                'topics': [self.topics]
+            }])
+        except (ValueError, asyncio.TimeoutError) as e:
+            if first_block == last_block or not is_range_error(e):
+                raise
+        middle_block = (first_block + last_block) // 2
+        self._split = True
+        self.chunk_blocks = max(1, min(self.chunk_blocks, middle_block - first_block + 1))
+        first_logs, last_logs = await asyncio.gather(
+            self.fetch_logs(first_block, middle_block),
+            self.fetch_logs(middle_block + 1, last_block)
+        )
+        return first_logs + last_logs
+
+    def add_logs(self, logs: list):
+        for log in logs:
+            if log.get('removed'):
+                continue
+            decoded = self.decoder.decode(log)
+            if decoded is None:
+                continue
+            stream = self.streams[(decoded['address'].lower(), decoded['event'])]
+            self._rows[stream.name].append(stream.to_row(decoded))
+
+    async def index(self, until_block: int):
+        """
+        Fetch logs up to a block, a round of concurrent ranges at a time.
+        :param until_block: last block to fetch
+        """
+        while self.next_block() <= until_block:
+            ranges = []
+            first_block = self.next_block()
+            while len(ranges) < self.concurrency and first_block <= until_block:
+                last_block = min(first_block + self.chunk_blocks - 1, until_block)
+                ranges.append((first_block, last_block))
+                first_block = last_block + 1
+
+            self._split = False
+            results = await asyncio.gather(*(self.fetch_logs(first, last) for first, last in ranges))
+            for logs in results:
+                self.add_logs(logs)
+            if self._buffered_from is None:
+                self._buffered_from = ranges[0][0]
+            self._buffered_until = ranges[-1][1]
+
+            # Sparse ranges: fewer round trips next time
+            logs_count = sum(len(logs) for logs in results)
+            if not self._split and logs_count < self.target_logs * len(ranges) / 2:
+                self.chunk_blocks = min(self.chunk_blocks * 2, self.max_chunk_blocks)
+
+            if time.monotonic() - self._checkpointed >= self.checkpoint_interval:
+                self.checkpoint()
+
+    async def on_block(self, block_number: int):
+        """
+        Block hook: index blocks with enough confirmations.
+        """
+        await self.index(block_number - self.confirmations)
+
+    def checkpoint(self):
+        """
+        Write logs fetched since the last checkpoint to the store.
+        """
+        self._checkpointed = time.monotonic()
+        if self._buffered_until is None:
+            return
+        self.store.write(
+            self._buffered_from,
+            self._buffered_until,
+            {
+                stream.name: stream.to_arrays(self._rows[stream.name])
+                for stream in self.streams.values()
+            }
+        )
+        print(
+            f"Indexed blocks {self._buffered_from} to {self._buffered_until}: "
+            f"{sum(len(rows) for rows in self._rows.values())} logs"
+        )
+        self._rows = {name: [] for name in self._rows}
+        self._buffered_from, self._buffered_until = None, None
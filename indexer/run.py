@@ -0,0 +1,59 @@
+"""
+Log indexer: backfills bond deposits and redeems, sROME rebases and ROME-FRAX swaps and reserves into a local
+columnar store, then follows new blocks with --follow. Run from the repository root, as settings.json is read from
+the working directory:
+
+    python -m indexer.run [--follow]
+
+Indexed history is then read without any RPC request, ex: ColumnStore('logs_store').read('frax_bond_created').
+"""
+from controllers.scheduler import BlockScheduler
+from indexer.column_store import ColumnStore
+from indexer.log_indexer import LogIndexer, rome_streams
+from models.account_interface import load_settings
+from models.bond_registry import BondRegistry
+from models.rome_contracts import RomeContracts
+from models.rpc_pool import RPCPool
+from web3 import Web3
+import argparse
+import asyncio
+
+
+async def main(args):
+    settings = load_settings()
+    indexer_settings = settings['indexer']
+    rome_contracts = RomeContracts(Web3())
+    rpc = RPCPool.from_settings(settings['rpc'])
+    indexer = LogIndexer(
+        rpc,
+        ColumnStore(indexer_settings['path']),
+        rome_streams(rome_contracts, BondRegistry(rome_contracts, settings['bonds'])),
+        start_block=indexer_settings['start_block'],
+        chunk_blocks=indexer_settings['chunk_blocks'],
+        max_chunk_blocks=indexer_settings['max_chunk_blocks'],
+        target_logs=indexer_settings['target_logs'],
+        concurrency=indexer_settings['concurrency'],
+        confirmations=indexer_settings['confirmations'],
+        checkpoint_interval=indexer_settings['checkpoint_interval']
+    )
+    try:
+        until_block = args.until_block
+        if until_block is None:
+            until_block = int(await rpc.request('eth_blockNumber'), 16) - indexer.confirmations
+        print(f"Indexing from block {indexer.next_block()} to {until_block}")
+        await indexer.index(until_block)
+        indexer.checkpoint()
+        if args.follow:
+            scheduler = BlockScheduler(rpc, settings['rpc']['ws_endpoint'])
+            scheduler.on_block(indexer.on_block)
+            await scheduler.run()
+    finally:
+        indexer.checkpoint()
+        await rpc.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Index Rome bond, rebase and ROME-FRAX pair logs.')
+    parser.add_argument('--until-block', type=int, help='last block to backfill, latest confirmed block by default')
+    parser.add_argument('--follow', action='store_true', help='keep indexing new blocks once backfilled')
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,158 @@
+from datetime import datetime
+import asyncio
+import sys
+import threading
+
+
+class QueuedStream:
+    """
+    File-like object replacing sys.stdout while the background writer runs: print() calls made from the event loop
+    only enqueue their text, the actual write happens in the writer.
+    Text is enqueued by complete lines, so that a full queue drops whole lines.
+    """
+    def __init__(self, writer, stream):
+        self.writer = writer
+        self.stream = stream
+        self._thread_id = threading.get_ident()
+        self._buffer = ''
+
+    def write(self, text: str):
+        if threading.get_ident() != self._thread_id:
+            # Not from the event loop thread: the queue can't be used from there
+            return self.stream.write(text)
+        self._buffer += text
+        if '\n' in self._buffer:
+            lines, self._buffer = self._buffer.rsplit('\n', 1)
+            self.writer.write(lines + '\n')
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def pop_buffer(self) -> str:
+        """
+        :return: text written since last complete line
+        """
+        text, self._buffer = self._buffer, ''
+        return text
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+class BackgroundWriter:
+    """
+    Moves logging I/O out of the trading path: operation records and console output are put in a bounded queue,
+    and a background task writes them by batches, journal writes running in a worker thread.
+    Backpressure policy, when the queue is full:
+    - console output is dropped, the number of dropped writes is reported once there's room again
+    - operation records are never dropped: the producer writes them to the journal itself.
+    close() flushes everything still queued.
+    """
+    def __init__(
+            self,
+            journal,
+            max_queue_size: int = 1000,
+            batch_size: int = 100
+    ):
+        """
+        :param journal: Journal operation records are written to
+        :param max_queue_size: maximum number of queued events
+        :param batch_size: maximum number of events written at once
+        """
+        self.journal = journal
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.dropped = 0
+        self._queue = None
+        self._task = None
+        self._stdout = None
+        # Journal is written from the worker thread, or from the producer when the queue is full
+        self._journal_lock = threading.Lock()
+
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """
+        Start the writer task on the running event loop, and route stdout through it.
+        """
+        self._queue = asyncio.Queue(self.max_queue_size)
+        self._task = asyncio.ensure_future(self._run())
+        self._stdout = sys.stdout
+        sys.stdout = QueuedStream(self, self._stdout)
+
+    def log_move(self, operation: str, data: dict):
+        """
+        :param operation: operation type, ex: BOND or REBASE
+        :param data: operation data: transactions, amounts, timings...
+        """
+        event = ('operation', operation, data, datetime.now())
+        if self.is_running():
+            try:
+                return self._queue.put_nowait(event)
+            except asyncio.QueueFull:
+                pass
+        self._write_operations([event[1:]])
+
+    def write(self, text: str):
+        """
+        :param text: console output
+        """
+        if not self.is_running():
+            (self._stdout or sys.stdout).write(text)
+            return
+        try:
+            self._queue.put_nowait(('console', text))
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    def _write_operations(self, records: list):
+        with self._journal_lock:
+            self.journal.append_many(records)
+
+    def _write_console(self, texts: list):
+        if self.dropped:
+            texts.append(f"[LOGGER] {self.dropped} console writes dropped: logging queue was full.\n")
+            self.dropped = 0
+        self._stdout.write(''.join(texts))
+        self._stdout.flush()
+
+    async def _flush(self, events: list):
+        operations = [event[1:] for event in events if event[0] == 'operation']
+        texts = [event[1] for event in events if event[0] == 'console']
+        if texts or self.dropped:
+            self._write_console(texts)
+        if operations:
+            await asyncio.get_running_loop().run_in_executor(None, self._write_operations, operations)
+
+    def _drain(self, events: list) -> list:
+        while len(events) < self.batch_size and not self._queue.empty():
+            events.append(self._queue.get_nowait())
+        return events
+
+    async def _run(self):
+        while True:
+            events = self._drain([await self._queue.get()])
+            try:
+                await self._flush(events)
+            except Exception as e:
+                self._stdout.write(f"[LOGGER] Failed to write {len(events)} log events: {e}\n")
+
+    async def close(self):
+        """
+        Stop the writer task and flush everything still queued. stdout is restored.
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        remaining_text = sys.stdout.pop_buffer() if isinstance(sys.stdout, QueuedStream) else ''
+        sys.stdout = self._stdout
+        while not self._queue.empty():
+            await self._flush(self._drain([]))
+        self._stdout.write(remaining_text)
@@ -0,0 +1,165 @@
+from datetime import datetime
+import json
+import sqlite3
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pipeline_runs (
+    id INTEGER PRIMARY KEY,
+    wallet TEXT NOT NULL,
+    pipeline TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL,
+    resumes INTEGER NOT NULL DEFAULT 0,
+    created TEXT NOT NULL,
+    updated TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pipeline_steps (
+    run_id INTEGER NOT NULL REFERENCES pipeline_runs(id),
+    step TEXT NOT NULL,
+    status TEXT NOT NULL,
+    result TEXT,
+    updated TEXT NOT NULL,
+    PRIMARY KEY (run_id, step)
+);
+CREATE TABLE IF NOT EXISTS pipeline_txs (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES pipeline_runs(id),
+    step TEXT NOT NULL,
+    tx_hash TEXT NOT NULL,
+    function TEXT
+);
+CREATE INDEX IF NOT EXISTS pipeline_runs_wallet_status ON pipeline_runs(wallet, status);
+CREATE INDEX IF NOT EXISTS pipeline_txs_run_id ON pipeline_txs(run_id);
+"""
+
+# Runs in any other status are over
+OPEN_STATUSES = ('running', 'stranded')
+
+
+def now() -> str:
+    return datetime.now().isoformat(sep=' ', timespec='seconds')
+
+
+class CheckpointStore:
+    """
+    Progress of pipeline runs (see controllers/pipeline.py), in the journal SQLite database: run parameters, state
+    and result of each step, and hash of each transaction as soon as it is broadcast.
+    Unlike operation logs, checkpoints are written synchronously, each in its own database transaction, before
+    the pipeline goes on: after a crash, a restart knows every transaction which may have been mined.
+    Uses its own connection: operation logs are written by a background thread on the journal one.
+    """
+    def __init__(self, path: str = 'journal.db'):
+        """
+        :param path: SQLite database file, created if missing. ':memory:' keeps checkpoints in memory only.
+        """
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(SCHEMA)
+
+    def create_run(
+            self,
+            wallet: str,
+            pipeline: str,
+            params: dict
+    ) -> int:
+        """
+        :param wallet: wallet address the run sends transactions from
+        :param pipeline: pipeline name, to build its steps again on resume
+        :param params: pipeline parameters, JSON serializable
+        :return: run id
+        """
+        with self.connection:
+            cursor = self.connection.execute(
+                'INSERT INTO pipeline_runs (wallet, pipeline, params, status, created, updated) VALUES (?, ?, ?, ?, ?, ?)',
+                (wallet, pipeline, json.dumps(params), 'running', now(), now())
+            )
+        return cursor.lastrowid
+
+    def set_run_status(
+            self,
+            run_id: int,
+            status: str,
+            resumed: bool = False
+    ):
+        """
+        :param status: running, stranded (a step failed, some tokens may be left halfway), done, unwound
+        or abandoned
+        :param resumed: True to count one more resume of the run
+        """
+        with self.connection:
+            self.connection.execute(
+                'UPDATE pipeline_runs SET status = ?, resumes = resumes + ?, updated = ? WHERE id = ?',
+                (status, int(resumed), now(), run_id)
+            )
+
+    def set_step(
+            self,
+            run_id: int,
+            step: str,
+            status: str,
+            result: dict = None
+    ):
+        """
+        :param status: running, done, failed or unwound
+        :param result: step transaction result, as returned by its action
+        """
+        with self.connection:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO pipeline_steps (run_id, step, status, result, updated) VALUES (?, ?, ?, ?, ?)',
+                (run_id, step, status, json.dumps(result, default=str) if result is not None else None, now())
+            )
+
+    def add_tx(
+            self,
+            run_id: int,
+            step: str,
+            tx_hash: str,
+            function: str
+    ):
+        """
+        :param tx_hash: hash of a transaction the step just broadcast
+        :param function: called contract function
+        """
+        with self.connection:
+            self.connection.execute(
+                'INSERT INTO pipeline_txs (run_id, step, tx_hash, function) VALUES (?, ?, ?, ?)',
+                (run_id, step, tx_hash, function)
+            )
+
+    def get_open_runs(self, wallet: str) -> list:
+        """
+        :return: runs of the wallet which neither completed nor were unwound, oldest first. Each run is a dict with
+        id, pipeline, params, status, resumes, and steps: step name -> {'status', 'result', 'txs'}, txs being a
+        list of (tx hash, function) in broadcast order.
+        """
+        runs = []
+        for run_id, pipeline, params, status, resumes in self.connection.execute(
+            f'SELECT id, pipeline, params, status, resumes FROM pipeline_runs '
+            f'WHERE wallet = ? AND status IN ({", ".join("?" * len(OPEN_STATUSES))}) ORDER BY id',
+            (wallet, *OPEN_STATUSES)
+        ).fetchall():
+            steps = {
+                step: {'status': step_status, 'result': json.loads(result) if result else None, 'txs': []}
+                for step, step_status, result in self.connection.execute(
+                    'SELECT step, status, result FROM pipeline_steps WHERE run_id = ?', (run_id,)
+                )
+            }
+            for step, tx_hash, function in self.connection.execute(
+                'SELECT step, tx_hash, function FROM pipeline_txs WHERE run_id = ? ORDER BY id', (run_id,)
+            ):
+                steps.setdefault(step, {'status': 'running', 'result': None, 'txs': []})['txs'].append((tx_hash, function))
+            runs.append({
+                'id': run_id,
+                'pipeline': pipeline,
+                'params': json.loads(params),
+                'status': status,
+                'resumes': resumes,
+                'steps': steps
+            })
+        return runs
+
+    def close(self):
+        self.connection.close()
@@ -0,0 +1,195 @@
+from datetime import datetime
+import json
+import os
+import sqlite3
+
+
+LEGACY_DATE_FORMAT = "%m/%d/%Y, %H:%M:%S"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS operations (
+    id INTEGER PRIMARY KEY,
+    operation TEXT NOT NULL,
+    date TEXT NOT NULL,
+    wallet TEXT,
+    bond TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY,
+    operation_id INTEGER NOT NULL REFERENCES operations(id),
+    tx_type TEXT,
+    tx_hash TEXT,
+    tx_status INTEGER
+);
+CREATE TABLE IF NOT EXISTS migrations (
+    name TEXT PRIMARY KEY,
+    date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS operations_date ON operations(date);
+CREATE INDEX IF NOT EXISTS operations_operation_date ON operations(operation, date);
+CREATE INDEX IF NOT EXISTS operations_bond_date ON operations(bond, date);
+CREATE INDEX IF NOT EXISTS transactions_tx_hash ON transactions(tx_hash);
+CREATE INDEX IF NOT EXISTS transactions_operation_id ON transactions(operation_id);
+"""
+
+
+class Journal:
+    """
+    Append-only journal of BOND / REBASE operations, in a SQLite database in WAL mode:
+    each record is a single appended transaction, so logging cost doesn't grow with history,
+    and a crash mid-write can't corrupt previous records.
+    Operations are indexed by date, operation type and bond, and their transactions by hash.
+    """
+    def __init__(self, path: str = 'journal.db'):
+        """
+        :param path: SQLite database file, created if missing
+        """
+        self.path = path
+        # Writes may come from a background writer thread
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(SCHEMA)
+
+    def append(
+            self,
+            operation: str,
+            data: dict,
+            date: datetime = None
+    ) -> int:
+        """
+        :param operation: operation type, ex: BOND or REBASE
+        :param data: operation data, as given to Logger.log_move(). Its path transactions are indexed by hash.
+        :param date: operation date, now if None
+        :return: id of the appended operation
+        """
+        date = date or datetime.now()
+        with self.connection:
+            operation_id = self._insert(operation, data, date)
+        return operation_id
+
+    def append_many(self, records: list):
+        """
+        Append several operations in a single database transaction.
+        :param records: list of (operation, data, date) tuples
+        """
+        with self.connection:
+            for operation, data, date in records:
+                self._insert(operation, data, date or datetime.now())
+
+    def _insert(
+            self,
+            operation: str,
+            data: dict,
+            date: datetime
+    ) -> int:
+        cursor = self.connection.execute(
+            'INSERT INTO operations (operation, date, wallet, bond, data) VALUES (?, ?, ?, ?, ?)',
+            (
+                operation,
+                date.isoformat(sep=' ', timespec='seconds'),
+                data.get('wallet'),
+                data.get('bond'),
+                # Amounts can be Decimal (ex: LP token amount), keep them as strings
+                json.dumps(data, default=str)
+            )
+        )
+        self.connection.executemany(
+            'INSERT INTO transactions (operation_id, tx_type, tx_hash, tx_status) VALUES (?, ?, ?, ?)',
+            [
+                (cursor.lastrowid, tx.get('tx_type'), tx.get('tx_hash'), tx.get('tx_status'))
+                for tx in data.get('path', []) if tx and tx.get('tx_hash')
+            ]
+        )
+        return cursor.lastrowid
+
+    @staticmethod
+    def _to_record(row) -> dict:
+        operation_id, operation, date, data = row
+        return {
+            'id': operation_id,
+            'operation': operation,
+            **json.loads(data),
+            'date': date
+        }
+
+    def get_operations(
+            self,
+            operation: str = None,
+            bond: str = None,
+            wallet: str = None,
+            start: datetime = None,
+            end: datetime = None,
+            limit: int = None
+    ) -> list:
+        """
+        Ex: all FRAX bonds of last week: get_operations('BOND', bond='FRAX', start=datetime.now() - timedelta(7))
+        :param operation: operation type, ex: BOND or REBASE. All if None.
+        :param bond: bond label, ex: FRAX. All if None.
+        :param wallet: wallet address. All if None.
+        :param start: only operations from this date, included
+        :param end: only operations before this date, excluded
+        :param limit: maximum number of operations, most recent ones first
+        :return: list of operation dicts, as logged, with id and ISO date, most recent first
+        """
+        filters = {
+            'operation = ?': operation,
+            'bond = ?': bond,
+            'wallet = ?': wallet,
+            'date >= ?': start.isoformat(sep=' ', timespec='seconds') if start else None,
+            'date < ?': end.isoformat(sep=' ', timespec='seconds') if end else None
+        }
+        filters = {condition: value for condition, value in filters.items() if value is not None}
+        query = 'SELECT id, operation, date, data FROM operations'
+        if filters:
+            query += ' WHERE ' + ' AND '.join(filters)
+        query += ' ORDER BY date DESC, id DESC'
+        if limit is not None:
+            query += f' LIMIT {int(limit)}'
+        return [self._to_record(row) for row in self.connection.execute(query, list(filters.values()))]
+
+    def get_by_tx_hash(self, tx_hash: str):
+        """
+        :param tx_hash: hash of one of the operation transactions
+        :return: the operation dict, None if not found
+        """
+        row = self.connection.execute(
+            'SELECT operations.id, operation, date, data FROM operations '
+            'JOIN transactions ON transactions.operation_id = operations.id WHERE tx_hash = ?',
+            (tx_hash,)
+        ).fetchone()
+        return self._to_record(row) if row else None
+
+    def migrate_tinydb(self, path: str = 'db.json') -> int:
+        """
+        One-shot import of the former TinyDB log file. Does nothing if the file is missing or was already imported.
+        :param path: TinyDB json file
+        :return: number of imported operations
+        """
+        if not os.path.exists(path):
+            return 0
+        if self.connection.execute('SELECT 1 FROM migrations WHERE name = ?', (path,)).fetchone():
+            return 0
+
+        with open(path) as f:
+            content = f.read()
+        tables = json.loads(content) if content.strip() else {}
+        records = []
+        for table in tables.values():
+            for _, log in sorted(table.items(), key=lambda item: int(item[0])):
+                data = {key: value for key, value in log.items() if key not in ('operation', 'date')}
+                records.append((log['operation'], data, datetime.strptime(log['date'], LEGACY_DATE_FORMAT)))
+
+        with self.connection:
+            for operation, data, date in records:
+                self._insert(operation, data, date)
+            self.connection.execute(
+                'INSERT INTO migrations (name, date) VALUES (?, ?)',
+                (path, datetime.now().isoformat(sep=' ', timespec='seconds'))
+            )
+        print(f"Imported {len(records)} operations from {path} into {self.path}")
+        return len(records)
+
+    def close(self):
+        self.connection.close()
@@ -1,17 +1,35 @@
-from tinydb import TinyDB
-from datetime import datetime
+from .background_writer import BackgroundWriter
+from .journal import Journal
 
 
 class Logger:
+    """
+    Logs each operation (bond / rebase) with its transactions in the operations journal.
+    Operations logged by former versions in db.json are imported into the journal on first start.
+    Once started, operation records and console output are written by a background writer,
+    so logging never delays the next transaction.
+    """
+    def __init__(
+            self,
+            journal_path: str = 'journal.db',
+            legacy_db_path: str = 'db.json',
+            max_queue_size: int = 1000
+    ):
+        self.journal = Journal(journal_path)
+        self.journal.migrate_tinydb(legacy_db_path)
+        self.writer = BackgroundWriter(self.journal, max_queue_size)
 
-    @staticmethod
-    def log_move(operation: str, data: dict):
-        db = TinyDB('db.json')
+    def start(self):
+        """
+        Start the background writer, on the running event loop.
+        """
+        self.writer.start()
 
-        log = {
-            'operation': operation,
-            'date': datetime.now().strftime("%m/%d/%Y, %H:%M:%S")
-        }
+    async def close(self):
+        """
+        Flush queued logs and stop the background writer.
+        """
+        await self.writer.close()
 
-        log.update(data)
-        db.insert(log)
\ No newline at end of file
+    def log_move(self, operation: str, data: dict):
+        self.writer.log_move(operation, data)
@@ -0,0 +1,152 @@
+import asyncio
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+RATIO_BUCKETS = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 0.95, 1)
+ATTEMPT_BUCKETS = (1, 2, 3, 5)
+
+# name: (type, help, histogram buckets)
+METRIC_DEFINITIONS = {
+    'neron_rpc_requests_total': ('counter', 'JSON-RPC HTTP requests sent, batches count as one', None),
+    'neron_rpc_errors_total': ('counter', 'JSON-RPC HTTP requests which failed at transport level', None),
+    'neron_rpc_request_seconds': ('histogram', 'JSON-RPC HTTP request latency', LATENCY_BUCKETS),
+    'neron_contract_calls_total': ('counter', 'Read-only contract calls, batched or not', None),
+    'neron_contract_call_seconds': ('histogram', 'Time to get a contract call result, batch duration for batched calls', LATENCY_BUCKETS),
+    'neron_transactions_total': ('counter', 'Transactions mined, by status', None),
+    'neron_transaction_inclusion_seconds': ('histogram', 'Time between transaction broadcast and its receipt', LATENCY_BUCKETS),
+    'neron_transaction_gas_used_ratio': ('histogram', 'Gas used divided by gas limit', RATIO_BUCKETS),
+    'neron_claim_sign_seconds': ('histogram', 'Time to build and sign a set of rebase claims, ahead of the trigger', LATENCY_BUCKETS),
+    'neron_claim_broadcast_seconds': ('histogram', 'Time between rebase trigger and every claim broadcast', LATENCY_BUCKETS),
+    'neron_transaction_attempts': ('histogram', 'Attempts needed by a contract transaction', ATTEMPT_BUCKETS),
+    'neron_hook_tick_seconds': ('histogram', 'Duration of a per-block hook evaluation', LATENCY_BUCKETS),
+    'neron_hook_lag_seconds': ('histogram', 'Time between block arrival and hook evaluation start', LATENCY_BUCKETS),
+    'neron_hook_errors_total': ('counter', 'Per-block hook evaluations which raised', None),
+    'neron_ledger_drift_total': ('counter', 'Local token balances found different from chain state', None)
+}
+
+
+class Metrics:
+    """
+    In-process metrics registry: counters and histograms labelled by method, contract, hook...
+    Exposed in Prometheus text format on a local HTTP endpoint, and printed as a periodic summary.
+    """
+    def __init__(self, definitions: dict = None):
+        self.definitions = definitions or METRIC_DEFINITIONS
+        self.counters = {}
+        self.histograms = {}
+
+    @staticmethod
+    def _key(name: str, labels: dict) -> tuple:
+        return name, tuple(sorted((labels or {}).items()))
+
+    def inc(
+            self,
+            name: str,
+            labels: dict = None,
+            value: float = 1
+    ):
+        key = self._key(name, labels)
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(
+            self,
+            name: str,
+            value: float,
+            labels: dict = None
+    ):
+        key = self._key(name, labels)
+        if key not in self.histograms:
+            self.histograms[key] = {
+                'buckets': [0] * len(self.definitions[name][2]),
+                'sum': 0,
+                'count': 0,
+                'max': value
+            }
+        histogram = self.histograms[key]
+        for i, bound in enumerate(self.definitions[name][2]):
+            if value <= bound:
+                histogram['buckets'][i] += 1
+        histogram['sum'] += value
+        histogram['count'] += 1
+        histogram['max'] = max(histogram['max'], value)
+
+    @staticmethod
+    def _format_labels(labels) -> str:
+        if not labels:
+            return ''
+        return '{' + ','.join(f'{key}="{value}"' for key, value in labels) + '}'
+
+    def render(self) -> str:
+        """
+        :return: every metric in Prometheus text exposition format
+        """
+        lines = []
+        for name, (metric_type, description, buckets) in self.definitions.items():
+            lines += [f'# HELP {name} {description}', f'# TYPE {name} {metric_type}']
+            for (metric_name, labels), value in self.counters.items():
+                if metric_name == name:
+                    lines.append(f'{name}{self._format_labels(labels)} {value}')
+            for (metric_name, labels), histogram in self.histograms.items():
+                if metric_name != name:
+                    continue
+                for bound, count in zip(buckets, histogram['buckets']):
+                    lines.append(f'{name}_bucket{self._format_labels(labels + (("le", bound),))} {count}')
+                lines += [
+                    f'{name}_bucket{self._format_labels(labels + (("le", "+Inf"),))} {histogram["count"]}',
+                    f'{name}_sum{self._format_labels(labels)} {histogram["sum"]}',
+                    f'{name}_count{self._format_labels(labels)} {histogram["count"]}'
+                ]
+        return '\n'.join(lines) + '\n'
+
+    def summary(self) -> str:
+        """
+        :return: human-readable summary: counters, and count / average / max of histograms
+        """
+        lines = ['----- METRICS -----']
+        for (name, labels), value in sorted(self.counters.items()):
+            lines.append(f'{name}{self._format_labels(labels)}: {value}')
+        for (name, labels), histogram in sorted(self.histograms.items()):
+            lines.append(
+                f'{name}{self._format_labels(labels)}: count {histogram["count"]}, '
+                f'avg {round(histogram["sum"] / histogram["count"], 4)}, max {round(histogram["max"], 4)}'
+            )
+        return '\n'.join(lines) + '\n'
+
+    async def handle_metrics(self, request):
+        from aiohttp import web
+        return web.Response(text=self.render(), content_type='text/plain', charset='utf-8')
+
+    async def start_server(
+            self,
+            host: str = '127.0.0.1',
+            port: int = 9100
+    ):
+        """
+        Serve metrics on http://host:port/metrics
+        Raises OSError if the address can't be bound, ex: port already in use.
+        :return: the server runner (aiohttp web.AppRunner), to be cleaned up on shutdown
+        """
+        # aiohttp server side is only imported when metrics are served
+        from aiohttp import web
+        app = web.Application()
+        app.router.add_get('/metrics', self.handle_metrics)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        try:
+            await web.TCPSite(runner, host, port).start()
+        except OSError:
+            await runner.cleanup()
+            raise
+        return runner
+
+    async def print_summaries(self, interval: float):
+        """
+        Print a metrics summary every interval seconds, forever.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            print(self.summary())
+
+
+# Registry shared by the whole process
+METRICS = Metrics()
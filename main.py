@@ -1,5 +1,7 @@
 from controllers.controllers import main
 import asyncio
+import time
+import traceback
 
 
 if __name__ == "__main__":
@@ -9,8 +11,18 @@ if __name__ == "__main__":
         "If you like this tool, feel free to offer me a coffee:\n"
         "0x8b85755F6D3D3B6f984F896b219f99BC561Ed057"
     )
+    restart_delay = 1
     while True:
+        started = time.monotonic()
         try:
             asyncio.run(main())
-        except:
-            continue
+        except KeyboardInterrupt:
+            raise
+        except Exception:
+            traceback.print_exc()
+        # Don't restart in a tight loop when something keeps failing: back off, up to one minute
+        if time.monotonic() - started > 60:
+            restart_delay = 1
+        print(f"Restarting in {restart_delay} seconds...")
+        time.sleep(restart_delay)
+        restart_delay = min(restart_delay * 2, 60)
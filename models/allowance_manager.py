@@ -0,0 +1,106 @@
+from fractions import Fraction
+from web3 import Web3
+
+
+MAX_UINT256 = 2 ** 256 - 1
+APPROVAL_TOPIC = Web3.keccak(text='Approval(address,address,uint256)').hex()
+
+
+def topic_to_address(topic) -> str:
+    """
+    :param topic: indexed address topic (32 bytes, left padded)
+    :return: checksum address
+    """
+    topic = topic.hex() if isinstance(topic, bytes) else topic
+    return Web3.toChecksumAddress('0x' + topic[-40:])
+
+
+def approval_amount(
+        amount: int,
+        multiplier: float
+) -> int:
+    """
+    :param amount: amount to spend, in wei
+    :param multiplier: approval_multiplier setting
+    :return: amount to approve, in wei: amount times multiplier, rounded up in integer math so it is never below
+    amount, capped to MAX_UINT256
+    """
+    multiplier = Fraction(str(multiplier))
+    if multiplier <= 1:
+        return amount
+    return min(-(-amount * multiplier.numerator // multiplier.denominator), MAX_UINT256)
+
+
+class AllowanceManager:
+    """
+    Keeps a cache of our ERC20 allowances, per (token, spender) pair, so approve transactions are only sent
+    when the current allowance is too low.
+    Allowances are read in a single batch on first use, then kept up to date from Approval events found
+    in our transaction receipts, or decreased by the spent amount when a spending receipt has no Approval event.
+    """
+    def __init__(self, account):
+        """
+        :param account: AsyncWeb3Account used to batch allowance reads
+        """
+        self.account = account
+        self.known_pairs = []
+        self._allowances = {}
+
+    async def load_allowances(self, pairs: list):
+        """
+        Read allowances of all given pairs in a single batched call.
+        :param pairs: list of (token contract, spender address) tuples
+        """
+        results = await self.account.batch_call({
+            (token_contract.address, spender_address): token_contract.functions.allowance(
+                self.account.account_address,
+                spender_address
+            )
+            for token_contract, spender_address in pairs
+        })
+        self._allowances.update(results)
+
+    async def get_allowance(
+            self,
+            token_contract,
+            spender_address: str
+    ) -> int:
+        """
+        :param token_contract: ERC20 token contract
+        :param spender_address: spender address
+        :return: current allowance, from cache. On cache miss, all known pairs are loaded at once.
+        """
+        key = (token_contract.address, spender_address)
+        if key not in self._allowances:
+            await self.load_allowances(
+                [pair for pair in self.known_pairs if (pair[0].address, pair[1]) not in self._allowances] +
+                [(token_contract, spender_address)]
+            )
+        return self._allowances[key]
+
+    def update_from_receipt(
+            self,
+            tx_receipt: dict,
+            spent: list = ()
+    ):
+        """
+        :param tx_receipt: receipt of one of our transactions
+        :param spent: list of (token address, spender address, amount) spent by this transaction,
+        used for pairs whose new allowance is not given by an Approval event.
+        """
+        updated = set()
+        owner = self.account.account_address.lower()
+        for log in tx_receipt['logs']:
+            topics = [topic.hex() if isinstance(topic, bytes) else topic for topic in log['topics']]
+            if len(topics) == 3 and topics[0] == APPROVAL_TOPIC and topics[1][-40:].lower() == owner[2:]:
+                key = (Web3.toChecksumAddress(log['address']), topic_to_address(topics[2]))
+                self._allowances[key] = Web3.toInt(hexstr=log['data'])
+                updated.add(key)
+
+        for token_address, spender_address, amount in spent:
+            key = (token_address, spender_address)
+            if key not in updated and key in self._allowances and self._allowances[key] != MAX_UINT256:
+                self._allowances[key] = max(0, self._allowances[key] - amount)
+
+    def invalidate(self):
+        self._allowances = {}
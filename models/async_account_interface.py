@@ -0,0 +1,331 @@
+from .account_interface import Web3Account
+from .allowance_manager import AllowanceManager, approval_amount
+from .async_rpc import RPCError
+from .fee_oracle import FeeOracle, FeePolicy
+from .multicall import AsyncMulticall, encode_call, decode_result, record_contract_calls, to_block_param
+from .nonce_manager import NonceManager
+from .receipt_tracker import ReceiptTracker
+from logger.metrics import METRICS
+from web3 import Web3
+from web3.exceptions import TimeExhausted
+import contextvars
+import time
+
+
+# Called with (tx hash, contract function name) as soon as a transaction is broadcast, before its receipt is
+# awaited. Set per task, ex: by the pipeline executor to checkpoint each transaction of a step.
+TX_SENT_LISTENER = contextvars.ContextVar('tx_sent_listener', default=None)
+
+
+class AsyncWeb3Account(Web3Account):
+    """
+    Async variant of Web3Account. All network I/O goes through an AsyncRPC client, so reads,
+    sends and receipt waits yield to the event loop. The web3 instance is only used to encode calls,
+    decode results and sign transactions locally.
+    """
+    def __init__(
+            self,
+            web3,
+            rpc,
+            account_address: str = None,
+            private_key: str = None,
+            fee_oracle: FeeOracle = None,
+            receipt_tracker: ReceiptTracker = None
+    ):
+        """
+        :param account_address: wallet address, WALLET_ADDRESS environment variable if None
+        :param private_key: wallet private key, PRIVATE_KEY environment variable if None
+        :param fee_oracle: FeeOracle to share between several accounts, a new one if None
+        :param receipt_tracker: ReceiptTracker to share between several accounts, a new one if None
+        """
+        Web3Account.__init__(self, web3, account_address, private_key)
+        self.rpc = rpc
+        self.nonce_manager = NonceManager(rpc, self.account_address)
+        self.fee_oracle = fee_oracle or FeeOracle(rpc, self.settings)
+        self.receipt_tracker = receipt_tracker or ReceiptTracker(
+            rpc,
+            self.settings['receipts']['confirmations'],
+            self.settings['receipts']['poll_interval']
+        )
+        self.fee_policy = FeePolicy(rpc, self.fee_oracle, self.settings)
+        self.multicall = AsyncMulticall(web3, rpc, self.settings.get('multicall_address'))
+        self.allowance_manager = AllowanceManager(self)
+        self.block_number = None
+
+    async def on_block(self, block_number: int):
+        """
+        Block hook: keeps track of the latest block, for per-block caches, and refreshes the fee oracle.
+        """
+        self.block_number = block_number
+        await self.fee_oracle.on_block(block_number)
+
+    # --------- WEB3 HELPER RELATED METHODS ---------
+
+    async def call(
+            self,
+            contract_function,
+            block_identifier='latest'
+    ):
+        """
+        Async equivalent of ContractFunction.call()
+        :param contract_function: bound web3 contract function
+        :param block_identifier: block to read from
+        :return: decoded call result
+        """
+        address, data = encode_call(contract_function)
+        started = time.monotonic()
+        return_data = await self.rpc.request('eth_call', [
+            {'to': address, 'data': data},
+            to_block_param(block_identifier)
+        ])
+        record_contract_calls([contract_function], time.monotonic() - started, self.multicall.contract_names)
+        return decode_result(self.web3, contract_function, bytes.fromhex(return_data[2:]))
+
+    async def batch_call(
+            self,
+            calls: dict,
+            block_identifier='latest'
+    ) -> dict:
+        """
+        Perform all given read-only calls in a single round trip, on the same block.
+        :param calls: dict mapping a result key to a bound contract function
+        :param block_identifier: block to read from, latest by default
+        :return: dict with the same keys as calls and decoded results as values
+        """
+        _, results = await self.multicall.call(calls, block_identifier)
+        return results
+
+    async def get_block_number(self) -> int:
+        return int(await self.rpc.request('eth_blockNumber'), 16)
+
+    async def build_tx_dict(
+            self,
+            gas: int,
+            gasprice: int
+    ) -> dict:
+        """
+        :param gas: gas amount to spend for the transaction in wei
+        :param gasprice: gas price in gwei
+        :return: the dict to give in argument to build_transaction method with custom gas/gasprice.
+        Nonce comes from the local nonce manager: no RPC call, except the very first time.
+        """
+        return {
+            'nonce': await self.nonce_manager.allocate(),
+            'from': self.account_address,
+            'gas': int(gas),
+            'gasPrice': Web3.toWei(gasprice, 'gwei'),
+            'chainId': 1285
+        }
+
+    @staticmethod
+    def build_transaction(
+            contract_function,
+            tx_dict: dict
+    ) -> dict:
+        """
+        Offline equivalent of ContractFunction.buildTransaction(): no RPC call is made.
+        :param contract_function: bound web3 contract function to call
+        :param tx_dict: dict returned by build_tx_dict
+        :return: transaction ready to be signed
+        """
+        address, data = encode_call(contract_function)
+        return {
+            **tx_dict,
+            'to': address,
+            'data': data,
+            'value': 0
+        }
+
+    async def wait_for_transaction_receipt(
+            self,
+            tx_hash: str,
+            timeout: float = None
+    ) -> dict:
+        """
+        Wait for transaction receipt without blocking the event loop. Receipts of every pending transaction
+        are fetched together by the receipt tracker.
+        :param tx_hash: hash of the transaction to wait for
+        :param timeout: seconds to wait before raising TimeExhausted, receipts timeout setting if None
+        :return: formatted transaction receipt
+        """
+        if timeout is None:
+            timeout = self.settings['receipts']['timeout']
+        return await self.receipt_tracker.wait(tx_hash, timeout)
+
+    def sign_tx(
+            self,
+            tx
+    ) -> str:
+        """
+        :param tx: transaction dict
+        :return: signed raw transaction, hex string
+        """
+        return self.web3.toHex(self.web3.eth.account.sign_transaction(tx, self.private_key).rawTransaction)
+
+    async def send_raw_tx(
+            self,
+            raw_tx: str
+    ) -> str:
+        """
+        Broadcast a signed transaction, without waiting for its receipt.
+        If it can't be broadcast, local nonce is resynced with the node before raising.
+        :param raw_tx: signed raw transaction, hex string
+        :return: transaction hash
+        """
+        try:
+            return await self.rpc.request('eth_sendRawTransaction', [raw_tx])
+        except Exception:
+            self.nonce_manager.resync()
+            raise
+
+    async def send_tx(
+            self,
+            tx
+    ) -> str:
+        """
+        Sign and broadcast given transaction, without waiting for its receipt.
+        If it can't be broadcast, local nonce is resynced with the node before raising.
+        :param tx: transaction dict
+        :return: transaction hash
+        """
+        try:
+            raw_tx = self.sign_tx(tx)
+        except Exception:
+            self.nonce_manager.resync()
+            raise
+        return await self.send_raw_tx(raw_tx)
+
+    async def sign_and_send_tx(
+            self,
+            tx,
+            function_name: str = 'unknown'
+    ) -> dict:
+        """
+        Sign and send given transaction.
+        Several calls can run concurrently: transactions are broadcast back-to-back with consecutive nonces,
+        and their receipts are awaited concurrently.
+        :param tx: transaction dict
+        :param function_name: called contract function, for metrics labels
+        :return: dict containing tx receipt and tx status (success, failed or still pending)
+        """
+        tx_hash = await self.send_tx(tx)
+        listener = TX_SENT_LISTENER.get()
+        if listener is not None:
+            listener(tx_hash, function_name)
+        return await self.wait_for_tx_result(tx, tx_hash, function_name)
+
+    async def wait_for_tx_result(
+            self,
+            tx,
+            tx_hash: str,
+            function_name: str = 'unknown'
+    ) -> dict:
+        """
+        Wait for a broadcast transaction receipt, and record its metrics.
+        :param tx: transaction dict
+        :param tx_hash: hash returned by its broadcast
+        :param function_name: called contract function, for metrics labels
+        :return: dict containing tx receipt and tx status (success, failed or still pending)
+        """
+        sent = time.monotonic()
+        try:
+            tx_receipt = await self.wait_for_transaction_receipt(tx_hash)
+        except TimeExhausted:
+            # Transaction might have been dropped: don't build on top of its nonce
+            self.nonce_manager.resync()
+            raise
+        tx_status = tx_receipt['status']
+
+        labels = {'function': function_name}
+        METRICS.observe('neron_transaction_inclusion_seconds', time.monotonic() - sent, labels)
+        METRICS.observe('neron_transaction_gas_used_ratio', tx_receipt['gasUsed'] / tx['gas'], labels)
+        METRICS.inc('neron_transactions_total', {**labels, 'status': tx_status})
+        return {
+            'tx_receipt': tx_receipt,
+            'tx_hash': tx_hash,
+            'tx_status': tx_status
+        }
+
+    async def transact(
+            self,
+            contract_function,
+            gas: int = None,
+            gasprice: float = None,
+            max_tries: int = 3,
+            spends: list = ()
+    ) -> dict:
+        """
+        Build, sign and send a contract call. Gas limit and gas price come from the fee policy
+        (unless given), and are adjusted by the policy after each failed attempt.
+        :param contract_function: bound web3 contract function to call
+        :param gas: gas limit of the first attempt. Estimated if None.
+        :param gasprice: gas price of the first attempt in gwei. From fee oracle if None.
+        :param max_tries: number of attempts before giving up
+        :param spends: list of (token address, spender address, amount) this call spends from our allowances
+        :return: sign_and_send_tx result of the last attempt. If the call would revert, it isn't sent: tx_hash is
+        None, tx_status 0 and error the node error.
+        """
+        tx = self.build_transaction(contract_function, {'from': self.account_address})
+        if gas is None or gasprice is None:
+            try:
+                estimated_gas, current_gasprice = await self.fee_policy.initial_fees(tx)
+            except RPCError as e:
+                print(f'[FAIL] - {contract_function.fn_name} would revert, not sent: {e}')
+                return {'tx_receipt': None, 'tx_hash': None, 'tx_status': 0, 'error': str(e)}
+            gas = gas or estimated_gas
+            gasprice = gasprice or current_gasprice
+
+        tx_result, attempts = {}, 0
+        for i in range(0, max_tries):
+            attempts += 1
+            tx = self.build_transaction(contract_function, await self.build_tx_dict(gas, gasprice))
+            tx_result = await self.sign_and_send_tx(tx, contract_function.fn_name)
+            if tx_result['tx_status'] == 1:
+                self.allowance_manager.update_from_receipt(tx_result['tx_receipt'], spends)
+                break
+
+            print(f'[FAIL] - Transaction failed.\nTx Hash: {tx_result["tx_hash"]}')
+            if i < max_tries - 1:
+                try:
+                    gas, gasprice = await self.fee_policy.next_fees(tx, tx_result['tx_receipt'], gas, gasprice)
+                except RPCError as e:
+                    # Reverts against current chain state: another attempt would fail the same way
+                    print(f'[FAIL] - {contract_function.fn_name} would revert again, not retried: {e}')
+                    break
+        METRICS.observe('neron_transaction_attempts', attempts, {'function': contract_function.fn_name})
+        return tx_result
+
+    async def approve_token_spending(
+            self,
+            token_to_spend_contract,
+            amount: int,
+            spender_address,
+            gas: int = None,
+            gasprice: float = None
+    ) -> dict:
+        """
+        Approve token spending, only if current allowance is lower than amount.
+        Approved amount is amount * approval_multiplier setting, so that next spendings don't need approval.
+        :param token_to_spend_contract: token contract where we call approve() function
+        :param amount: amount to spend
+        :param spender_address: the spender, most likely solarbeam in our case
+        :param gas: gas limit of the first attempt, estimated if None
+        :param gasprice: gas price in gwei of the first attempt, from fee oracle if None
+        :return: dict with tx_receipt, tx_hash and tx_status. No receipt nor hash if no approval was needed.
+        """
+        allowance = await self.allowance_manager.get_allowance(token_to_spend_contract, spender_address)
+        if allowance >= amount:
+            return {
+                'tx_receipt': None,
+                'tx_hash': None,
+                'tx_status': 1
+            }
+
+        return await self.transact(
+            token_to_spend_contract.functions.approve(
+                spender_address,
+                approval_amount(amount, self.settings['approval_multiplier'])
+            ),
+            gas,
+            gasprice
+        )
@@ -0,0 +1,630 @@
+from .async_account_interface import AsyncWeb3Account
+from .bond_registry import BondRegistry
+from .claim_presigner import ClaimPresigner
+from .discount_engine import DiscountEngine
+from .rome_contracts import RomeContracts
+from .rome_interface import RomeInterface
+from .solarbeam_pair import SolarbeamPair
+from .token_ledger import TokenLedger
+import asyncio
+
+
+class AsyncRomeInterface(AsyncWeb3Account, RomeInterface):
+    """
+    Async variant of RomeInterface: same methods, same return values, but every method doing network I/O
+    is a coroutine running on an AsyncRPC client. Call builders and parsers are shared with RomeInterface.
+    """
+    def __init__(
+            self,
+            web3,
+            rpc,
+            account_address: str = None,
+            private_key: str = None,
+            fee_oracle=None,
+            receipt_tracker=None
+    ):
+        """
+        :param account_address: wallet address, WALLET_ADDRESS environment variable if None
+        :param private_key: wallet private key, PRIVATE_KEY environment variable if None
+        :param fee_oracle: FeeOracle shared between wallets, a new one if None
+        :param receipt_tracker: ReceiptTracker shared between wallets, a new one if None
+        """
+        AsyncWeb3Account.__init__(self, web3, rpc, account_address, private_key, fee_oracle, receipt_tracker)
+        RomeContracts.__init__(self, web3)
+        self.rome_frax_pair = None
+        self._zap_contract = None
+        self.multicall.contract_names = self.contract_names()
+        self.bond_registry = BondRegistry(self, self.settings['bonds'])
+        self.discount_engine = DiscountEngine(self.bond_registry)
+        # Rebase claims, signed ahead of the rebase trigger
+        self.claim_presigner = ClaimPresigner(self)
+        self.event_decoder = self.build_event_decoder()
+        # Balances the flows spend, from block snapshots and our own receipts
+        self.ledger = TokenLedger(
+            self.account_address,
+            {
+                self.rome_address: 'rome',
+                self.srome_address: 'srome',
+                self.frax_address: 'frax',
+                self.rome_frax_lp_address: 'rome_frax_lp'
+            },
+            rebasing=('srome',)
+        )
+        # Allowances the bonding paths rely on, loaded in one batch on first approval
+        self.allowance_manager.known_pairs = [
+            (self.rome_contract, self.solarbeam_router_address),
+            (self.frax_contract, self.solarbeam_router_address)
+        ] + [
+            (bond.principal_contract, bond.bond_address)
+            for bond in self.bond_registry.all() if bond.principal_contract is not None
+        ]
+
+    async def on_block(self, block_number: int):
+        """
+        Block hook: on top of AsyncWeb3Account.on_block, reconciles the ledger with chain state
+        if no snapshot did it for ledger_reconcile_blocks blocks.
+        """
+        await AsyncWeb3Account.on_block(self, block_number)
+        if self.ledger.block_number is None or \
+                block_number - self.ledger.block_number >= self.settings['ledger_reconcile_blocks']:
+            await self.reconcile_ledger()
+
+    # --------- LEDGER ---------
+
+    def sync_ledger(
+            self,
+            block_number: int,
+            results: dict
+    ):
+        """
+        :param block_number: block results were read on
+        :param results: batch_call results containing balance_calls() keys
+        """
+        drift = self.ledger.sync(block_number, {
+            key[:-len('_balance')]: results[key]
+            for key in self.balance_calls()
+        })
+        if drift:
+            print(
+                f"{self.account_address}: local balances differed from chain state on block {block_number}, "
+                f"resynced: {drift}"
+            )
+
+    async def reconcile_ledger(self):
+        block_number, results = await self.multicall.call(self.balance_calls())
+        self.sync_ledger(block_number, results)
+
+    async def get_token_balance(self, token: str) -> int:
+        """
+        :param token: ledger token name: rome, srome, frax or rome_frax_lp
+        :return: balance in wei, from the ledger. Read from chain the first time.
+        """
+        if self.ledger.get(token) is None:
+            await self.reconcile_ledger()
+        return self.ledger.get(token)
+
+    def apply_receipt(self, tx_receipt) -> tuple:
+        """
+        Decode the events of one of our transaction receipts, and apply its token transfers to the ledger.
+        :return: tuple (decoded events, token name -> balance change in wei)
+        """
+        events = self.decode_receipt(tx_receipt)
+        return events, self.ledger.apply(events)
+
+    # --------- READS ---------
+
+    async def get_total_rome_balance(self) -> float:
+        results = await self.batch_call({
+            'staked_balance': self.srome_contract.functions.balanceOf(self.account_address),
+            'profile': self.rome_conscription_contract.functions.profiles(self.account_address),
+            **self.deposited_bonds_calls()
+        })
+        in_bonds = sum(results[f'bond_info_{bond}'][0] for bond in self.get_bond_contracts())
+        locked = await self.call(self.srome_contract.functions.balanceForGons(results['profile'][3]))
+        return self.convert_rome_to_ether(results['staked_balance'] + in_bonds + locked)
+
+    async def get_stacked_balance(self) -> float:
+        return self.convert_rome_to_ether(
+            await self.call(self.srome_contract.functions.balanceOf(self.account_address))
+        )
+
+    async def check_deposited_bonds(self) -> dict:
+        results = await self.batch_call(self.deposited_bonds_calls())
+        return {
+            bond: results[f'bond_info_{bond}'][0]
+            for bond in self.get_bond_contracts()
+        }
+
+    async def get_pending_bond_reward(self, bond_contract) -> float:
+        return self.convert_rome_to_ether(
+            await self.call(bond_contract.functions.pendingPayoutFor(self.account_address))
+        )
+
+    async def get_all_bond_pending_rewards(self) -> dict:
+        return self.parse_pending_rewards(await self.batch_call(self.pending_rewards_calls()))
+
+    async def get_snapshot(self, block_identifier='latest') -> dict:
+        block_number, results = await self.multicall.call(self.snapshot_calls(), block_identifier)
+        self.sync_ledger(block_number, results)
+        return self.parse_snapshot(block_number, results)
+
+    async def get_rome_market_price(self) -> float:
+        return self.parse_market_price(await self.batch_call(self.market_price_calls()))
+
+    async def get_rome_frax_pair(self) -> SolarbeamPair:
+        """
+        :return: ROME-FRAX pair model. Reserves are read at most once per block: the pair from this block's
+        snapshot (or previous call) is reused, and our own swaps are applied to it locally.
+        """
+        pair = self.rome_frax_pair
+        if pair is not None and self.block_number is not None and pair.block_number is not None \
+                and pair.block_number >= self.block_number:
+            return pair
+        block_number, results = await self.multicall.call(self.market_price_calls())
+        return self.parse_rome_frax_pair(results, block_number)
+
+    async def check_blocks_before_rebase(self) -> int:
+        block_number, results = await self.multicall.call({'epoch': self.staking_rome_contract.functions.epoch()})
+        return results['epoch'][2] - block_number
+
+    async def get_bond_discount(self, bond_contract) -> float:
+        results = await self.batch_call({
+            'bond_price': bond_contract.functions.bondPriceInUSD(),
+            **self.market_price_calls()
+        })
+        return self.parse_bond_discount(results['bond_price'], self.parse_market_price(results))
+
+    # --------- WRITES ---------
+    # Gas limit and gas price come from the fee policy, see AsyncWeb3Account.transact().
+    # gas / gasprice arguments only override the first attempt.
+
+    async def claim_bond_reward(
+            self,
+            bond_contract,
+            do_autostake=True,
+            gas: int = None,
+            gasprice: float = None
+    ) -> dict:
+        tx_result = await self.transact(
+            bond_contract.functions.redeem(
+                self.account_address,
+                do_autostake
+            ),
+            gas,
+            gasprice
+        )
+        return self.claim_result(bond_contract, tx_result)
+
+    def claim_result(
+            self,
+            bond_contract,
+            tx_result: dict
+    ) -> dict:
+        """
+        :param bond_contract: claimed bond
+        :param tx_result: sign_and_send_tx result of its redeem transaction
+        :return: claim_bond_reward result
+        """
+        amount_staked = 0
+        if tx_result['tx_status'] == 1:
+            events, _ = self.apply_receipt(tx_result['tx_receipt'])
+            amount_staked = self.convert_rome_to_ether(self.get_redeemed_payout(events, bond_contract.address))
+            print(f'Successfully redeemed {amount_staked} ROME.\nTx Hash: {tx_result["tx_hash"]}')
+
+        return {
+            'tx_type': 'claim_and_autostake',
+            'tx_hash': tx_result['tx_hash'],
+            'tx_status': tx_result['tx_status'],
+            'rome_staked': amount_staked
+        }
+
+    async def prepare_claims(self, bond_contracts: list):
+        """
+        Sign claim and autostake transactions of given bonds ahead, for claim_bond_rewards().
+        :param bond_contracts: bonds which will be claimed
+        """
+        await self.claim_presigner.prepare(bond_contracts)
+
+    async def claim_bond_rewards(self, bond_contracts: list) -> list:
+        """
+        Claim and autostake pending rewards of several bonds at once. If their transactions were signed ahead
+        by prepare_claims(), they are only broadcast. Any claim which failed to broadcast or to be mined is sent
+        again the regular way, with its retries.
+        :param bond_contracts: bonds to claim
+        :return: claim_bond_reward result of each bond, in the same order
+        """
+        if not bond_contracts or not self.claim_presigner.is_ready(bond_contracts):
+            return list(await asyncio.gather(*(
+                self.claim_bond_reward(bond_contract, do_autostake=True) for bond_contract in bond_contracts
+            )))
+
+        tx_results = await self.claim_presigner.claim(bond_contracts)
+        return list(await asyncio.gather(*(
+            self._presigned_claim_result(bond_contract, tx_result)
+            for bond_contract, tx_result in zip(bond_contracts, tx_results)
+        )))
+
+    async def _presigned_claim_result(
+            self,
+            bond_contract,
+            tx_result
+    ) -> dict:
+        if isinstance(tx_result, Exception) or tx_result['tx_status'] != 1:
+            print(f'[FAIL] - Signed claim failed ({tx_result if isinstance(tx_result, Exception) else tx_result["tx_hash"]}), sending it again.')
+            return await self.claim_bond_reward(bond_contract, do_autostake=True)
+        return self.claim_result(bond_contract, tx_result)
+
+    async def swap_rome_for_frax(
+            self,
+            total_balance=True,
+            gas: int = None,
+            gasprice: float = None
+    ) -> dict:
+        rome_swapped, frax_received_in_wei = 0, 0
+        rome_balance, pair = await asyncio.gather(
+            self.get_token_balance('rome'),
+            self.get_rome_frax_pair()
+        )
+        if total_balance:
+            # In case we want to bond FRAX
+            rome_to_swap = rome_balance
+        else:
+            # In case we want to bond ROME / FRAX LP: swap just enough so that nothing is left once liquidity is added
+            rome_to_swap = pair.optimal_swap_amount(rome_balance, self.rome_address)
+        expected_frax = pair.get_amount_out(rome_to_swap, self.rome_address)
+        print(f'Swapping {self.convert_rome_to_ether(rome_to_swap)} ROME for {self.web3.fromWei(expected_frax, "ether")} FRAX, price impact: {round(pair.price_impact(rome_to_swap, self.rome_address) * 100, 2)}%')
+
+        # Approve Solarbeam to spend our ROME tokens before swapping
+        approve_tx_result = await self.approve_token_spending(
+            token_to_spend_contract=self.rome_contract,
+            amount=rome_to_swap,
+            spender_address=self.solarbeam_router_address,
+            gas=gas,
+            gasprice=gasprice
+        )
+
+        if approve_tx_result['tx_status'] == 1:
+            print("Spending Approved")
+        else:
+            print("Spending not approved")
+            return approve_tx_result
+
+        # Assuming spending approve, we can swap ROME for FRAX
+        tx_result = await self.transact(
+            self.solarbeam_router_contract.functions.swapExactTokensForTokens(
+                rome_to_swap,
+                pair.apply_slippage(expected_frax, self.settings['solarbeam']['slippage']),
+                [self.rome_address, self.frax_address],
+                self.account_address,
+                self.get_swap_deadline()
+            ),
+            gas,
+            gasprice,
+            spends=[(self.rome_address, self.solarbeam_router_address, rome_to_swap)]
+        )
+
+        # get frax received in case of success
+        if tx_result['tx_status'] == 1:
+            _, changes = self.apply_receipt(tx_result['tx_receipt'])
+            frax_received_in_wei = changes.get('frax', 0)
+            rome_swapped = self.convert_rome_to_ether(rome_to_swap)
+            pair.apply_swap(rome_to_swap, self.rome_address, frax_received_in_wei)
+            print(f'Successfully swapped {rome_swapped} ROME for {self.web3.fromWei(frax_received_in_wei, "ether")} FRAX.\nTx Hash: {tx_result["tx_hash"]}')
+
+        return {
+            'tx_type': 'swap',
+            'tx_hash': tx_result['tx_hash'],
+            'tx_status': tx_result['tx_status'],
+            'rome_swapped': rome_swapped,
+            'frax_received_wei': frax_received_in_wei
+        }
+
+    async def swap_frax_for_rome(
+            self,
+            frax_to_swap_in_wei: int,
+            gas: int = None,
+            gasprice: float = None
+    ) -> dict:
+        """
+        Swap FRAX back to ROME, ex: to unwind a bonding path stopped after its swap.
+        :param frax_to_swap_in_wei: FRAX to swap, capped to our FRAX balance
+        """
+        rome_received = 0
+        frax_balance, pair = await asyncio.gather(
+            self.get_token_balance('frax'),
+            self.get_rome_frax_pair()
+        )
+        frax_to_swap = min(frax_to_swap_in_wei, frax_balance)
+        expected_rome = pair.get_amount_out(frax_to_swap, self.frax_address)
+        print(f'Swapping {self.web3.fromWei(frax_to_swap, "ether")} FRAX back for {self.convert_rome_to_ether(expected_rome)} ROME')
+
+        approve_tx_result = await self.approve_token_spending(
+            token_to_spend_contract=self.frax_contract,
+            amount=frax_to_swap,
+            spender_address=self.solarbeam_router_address,
+            gas=gas,
+            gasprice=gasprice
+        )
+        if approve_tx_result['tx_status'] == 1:
+            print("Spending Approved")
+        else:
+            print("Spending not approved")
+            return approve_tx_result
+
+        tx_result = await self.transact(
+            self.solarbeam_router_contract.functions.swapExactTokensForTokens(
+                frax_to_swap,
+                pair.apply_slippage(expected_rome, self.settings['solarbeam']['slippage']),
+                [self.frax_address, self.rome_address],
+                self.account_address,
+                self.get_swap_deadline()
+            ),
+            gas,
+            gasprice,
+            spends=[(self.frax_address, self.solarbeam_router_address, frax_to_swap)]
+        )
+
+        if tx_result['tx_status'] == 1:
+            _, changes = self.apply_receipt(tx_result['tx_receipt'])
+            rome_received = self.convert_rome_to_ether(changes.get('rome', 0))
+            pair.apply_swap(frax_to_swap, self.frax_address, changes.get('rome', 0))
+            print(f'Successfully swapped FRAX back for {rome_received} ROME.\nTx Hash: {tx_result["tx_hash"]}')
+
+        return {
+            'tx_type': 'swap_back',
+            'tx_hash': tx_result['tx_hash'],
+            'tx_status': tx_result['tx_status'],
+            'frax_swapped_wei': frax_to_swap,
+            'rome_received': rome_received
+        }
+
+    async def add_rome_frax_lp(
+            self,
+            frax_to_add_in_wei: int,
+            gas: int = None,
+            gasprice: float = None
+    ) -> dict:
+        amount_rome_desired, pair = await asyncio.gather(
+            self.get_token_balance('rome'),
+            self.get_rome_frax_pair()
+        )
+        amount_frax_desired = frax_to_add_in_wei
+
+        # Minimums are the amounts the router will actually add at current pool ratio, minus slippage
+        slippage = self.settings['solarbeam']['slippage']
+        amount_rome, amount_frax = pair.get_liquidity_amounts(amount_rome_desired, self.rome_address, amount_frax_desired)
+        amount_rome_min = pair.apply_slippage(amount_rome, slippage)
+        amount_frax_min = pair.apply_slippage(amount_frax, slippage)
+
+        # Approving Solarbeam to spend ROME before adding liquidity
+        approve_tx_result = await self.approve_token_spending(
+            token_to_spend_contract=self.rome_contract,
+            amount=amount_rome_desired,
+            spender_address=self.solarbeam_router_address,
+            gas=gas,
+            gasprice=gasprice
+        )
+        if approve_tx_result['tx_status'] == 1:
+            approve_tx_result = await self.approve_token_spending(
+                token_to_spend_contract=self.frax_contract,
+                amount=amount_frax_desired,
+                spender_address=self.solarbeam_router_address,
+                gas=gas,
+                gasprice=gasprice
+            )
+        if approve_tx_result['tx_status'] == 1:
+            print("Spending Approved")
+        else:
+            print("Spending not approved")
+            return approve_tx_result
+
+        # Assuming spending is approved, we can add liquidity
+        tx_result = await self.transact(
+            self.solarbeam_router_contract.functions.addLiquidity(
+                self.rome_address,
+                self.frax_address,
+                amount_rome_desired,
+                amount_frax_desired,
+                amount_rome_min,
+                amount_frax_min,
+                self.account_address,
+                self.get_swap_deadline()
+            ),
+            gas,
+            gasprice,
+            spends=[
+                (self.rome_address, self.solarbeam_router_address, amount_rome_desired),
+                (self.frax_address, self.solarbeam_router_address, amount_frax_desired)
+            ]
+        )
+
+        lp_token_received = 0
+        if tx_result['tx_status'] == 1:
+            _, changes = self.apply_receipt(tx_result['tx_receipt'])
+            lp_token_received = self.web3.fromWei(changes.get('rome_frax_lp', 0), 'ether')
+            print(f'Successfully added ROME-FRAX liquidity Token received: {lp_token_received}.\nTx Hash: {tx_result["tx_hash"]}')
+
+        return {
+            'tx_type': 'add_liquidity',
+            'tx_hash': tx_result['tx_hash'],
+            'tx_status': tx_result['tx_status'],
+            'lp_token_amount': lp_token_received
+        }
+
+    async def deposit_bond(
+            self,
+            bond_contract,
+            bond_contract_address,
+            bonded_token_contract,
+            frax_bond=False,
+            frax_to_bond=0,
+            gas: int = None,
+            gasprice: float = None
+    ) -> dict:
+        # Approving bond_contract to spend token
+        if frax_bond:
+            amount_to_bond = frax_to_bond
+        else:
+            amount_to_bond = await self.get_token_balance(self.ledger.tokens[bonded_token_contract.address])
+
+        approve_tx_result = await self.approve_token_spending(
+            token_to_spend_contract=bonded_token_contract,
+            amount=amount_to_bond,
+            spender_address=bond_contract_address,
+            gas=gas,
+            gasprice=gasprice
+        )
+        if approve_tx_result['tx_status'] == 1:
+            print("Spending Approved")
+        else:
+            print("Spending not approved")
+            return approve_tx_result
+
+        # Assuming spending is approved, we can deposit our tokens to bond contract
+        max_price = await self.call(bond_contract.functions.bondPrice())
+        tx_result = await self.transact(
+            bond_contract.functions.deposit(
+                amount_to_bond,
+                max_price,
+                self.account_address
+            ),
+            gas,
+            gasprice,
+            spends=[(bonded_token_contract.address, bond_contract_address, amount_to_bond)]
+        )
+        if tx_result['tx_status'] == 1:
+            self.apply_receipt(tx_result['tx_receipt'])
+            print(f'Successfully bonded.\nTx Hash: {tx_result["tx_hash"]}')
+
+        return {
+            'tx_type': 'deposit_bond',
+            'tx_hash': tx_result['tx_hash'],
+            'tx_status': tx_result['tx_status']
+        }
+
+    async def unstake(
+            self,
+            gas: int = None,
+            gasprice: float = None
+    ) -> dict:
+        amount_to_unstake = await self.get_token_balance('srome')
+        tx_result = await self.transact(
+            self.staking_rome_contract.functions.unstake(
+                amount_to_unstake,
+                True
+            ),
+            gas,
+            gasprice
+        )
+
+        unstaked_amount = self.convert_rome_to_ether(amount_to_unstake)
+        if tx_result['tx_status'] == 1:
+            self.apply_receipt(tx_result['tx_receipt'])
+            print(f'Successfully unstaked {unstaked_amount} ROME.\nTx Hash: {tx_result["tx_hash"]}')
+
+        return {
+            'tx_type': 'unstake',
+            'tx_hash': tx_result['tx_hash'],
+            'tx_status': tx_result['tx_status'],
+            'unstaked_rome_amount': unstaked_amount
+        }
+
+    async def zap_bond(
+            self,
+            bond_contract,
+            redeem_bond_contracts: list,
+            unstake: bool,
+            add_liquidity: bool,
+            gas: int = None,
+            gasprice: float = None
+    ) -> dict:
+        """
+        Whole bonding path in a single transaction through the zap contract: redeem, unstake, swap,
+        add liquidity (LP bonds only) and bond. Nothing is left halfway in the wallet if it fails.
+        :param bond_contract: bond to deposit in
+        :param redeem_bond_contracts: bonds to redeem pending rewards from, without autostaking
+        :param unstake: True to bond our sROME balance too
+        :param add_liquidity: True for a ROME-FRAX LP bond, False for a FRAX bond
+        """
+        zap_contract = self.get_zap_contract()
+        results, rome_balance, srome_balance, pair = await asyncio.gather(
+            self.batch_call({
+                'bond_price': bond_contract.functions.bondPrice(),
+                **{
+                    f'pending_{i}': redeem_bond_contract.functions.pendingPayoutFor(self.account_address)
+                    for i, redeem_bond_contract in enumerate(redeem_bond_contracts)
+                }
+            }),
+            self.get_token_balance('rome'),
+            self.get_token_balance('srome'),
+            self.get_rome_frax_pair()
+        )
+        # ROME pulled from the wallet once rewards are redeemed, and sROME unstaked by the zap
+        rome_amount = rome_balance + sum(results[f'pending_{i}'] for i in range(len(redeem_bond_contracts)))
+        srome_amount = srome_balance if unstake else 0
+        rome_to_swap = rome_amount + srome_amount
+        if add_liquidity:
+            rome_to_swap = pair.optimal_swap_amount(rome_to_swap, self.rome_address)
+        expected_frax = pair.get_amount_out(rome_to_swap, self.rome_address)
+        print(f'Zapping {self.convert_rome_to_ether(rome_amount + srome_amount)} ROME into {"ROME-FRAX LP" if add_liquidity else "FRAX"} bond, swap price impact: {round(pair.price_impact(rome_to_swap, self.rome_address) * 100, 2)}%')
+
+        # Independent approvals: broadcast back-to-back
+        approve_tx_results = await asyncio.gather(
+            self.approve_token_spending(
+                token_to_spend_contract=self.rome_contract,
+                amount=rome_amount,
+                spender_address=zap_contract.address,
+                gas=gas,
+                gasprice=gasprice
+            ),
+            self.approve_token_spending(
+                token_to_spend_contract=self.srome_contract,
+                amount=srome_amount,
+                spender_address=zap_contract.address,
+                gas=gas,
+                gasprice=gasprice
+            )
+        )
+        for approve_tx_result in approve_tx_results:
+            if approve_tx_result['tx_status'] != 1:
+                print("Spending not approved")
+                return approve_tx_result
+        print("Spending Approved")
+
+        tx_result = await self.transact(
+            zap_contract.functions.zapBond(
+                [redeem_bond_contract.address for redeem_bond_contract in redeem_bond_contracts],
+                srome_amount,
+                bond_contract.address,
+                add_liquidity,
+                pair.apply_slippage(expected_frax, self.settings['solarbeam']['slippage']),
+                results['bond_price'],
+                self.get_swap_deadline()
+            ),
+            gas,
+            gasprice,
+            spends=[
+                (self.rome_address, zap_contract.address, rome_amount),
+                (self.srome_address, zap_contract.address, srome_amount)
+            ]
+        )
+
+        rome_bonded, principal_bonded, payout = 0, 0, 0
+        if tx_result['tx_status'] == 1:
+            events, _ = self.apply_receipt(tx_result['tx_receipt'])
+            zapped = next(event['args'] for event in events if event['event'] == 'Zapped')
+            rome_bonded = self.convert_rome_to_ether(zapped['romeIn'])
+            principal_bonded = self.web3.fromWei(zapped['principal'], 'ether')
+            payout = self.convert_rome_to_ether(zapped['payout'])
+            # Reserves moved by our swap (and liquidity add): read them again on next use
+            self.rome_frax_pair = None
+            print(f'Successfully bonded {rome_bonded} ROME for a {payout} ROME payout.\nTx Hash: {tx_result["tx_hash"]}')
+
+        return {
+            'tx_type': 'zap_bond',
+            'tx_hash': tx_result['tx_hash'],
+            'tx_status': tx_result['tx_status'],
+            'rome_bonded': rome_bonded,
+            'principal_bonded': principal_bonded,
+            'payout': payout
+        }
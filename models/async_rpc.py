@@ -0,0 +1,178 @@
+from logger.metrics import METRICS
+import aiohttp
+import asyncio
+import itertools
+import json
+import time
+
+
+# Read-only methods: identical requests in flight at the same time share a single response
+DEDUPLICATED_METHODS = {
+    'eth_blockNumber',
+    'eth_call',
+    'eth_estimateGas',
+    'eth_feeHistory',
+    'eth_gasPrice',
+    'eth_getBlockByNumber',
+    'eth_getCode',
+    'eth_getTransactionReceipt'
+}
+
+
+# JSON-RPC error codes and messages of a node which can't serve a request right now: rate limited, overloaded,
+# or without the requested state (not synced yet, pruned). Another node may answer it.
+UNAVAILABLE_CODES = (-32005, 429)
+UNAVAILABLE_ERRORS = (
+    'rate limit',
+    'limit exceeded',
+    'too many requests',
+    'header not found',
+    'unknown block',
+    'missing trie node',
+    'not synced',
+    'busy',
+    'try again',
+    'timeout',
+    'timed out'
+)
+
+
+class RPCError(ValueError):
+    """
+    JSON-RPC error answer of a node, ex: execution reverted. A ValueError, as raised by web3.
+    Unlike other ValueErrors (ex: a response body which isn't JSON), the node did answer.
+    """
+    @property
+    def code(self):
+        error = self.args[0] if self.args else None
+        return error.get('code') if isinstance(error, dict) else None
+
+    @property
+    def message(self) -> str:
+        error = self.args[0] if self.args else None
+        return str(error.get('message', '') if isinstance(error, dict) else error)
+
+    def is_unavailable(self) -> bool:
+        """
+        :return: True if the node couldn't serve the request (ex: rate limited): another node may answer it.
+        False for execution errors (ex: execution reverted), which every node answers the same way.
+        """
+        return self.code in UNAVAILABLE_CODES or any(
+            message in self.message.lower() for message in UNAVAILABLE_ERRORS
+        )
+
+
+class AsyncRPC:
+    """
+    Minimal asynchronous JSON-RPC client.
+    Every request goes through a single pooled aiohttp session, shared by all interfaces using this client,
+    so that concurrent reads, sends and receipt polls reuse the same keep-alive connections.
+    """
+    def __init__(
+            self,
+            endpoint_uri: str,
+            request_timeout: int = 10,
+            pool_size: int = 20
+    ):
+        self.endpoint_uri = endpoint_uri
+        self.request_timeout = request_timeout
+        self.pool_size = pool_size
+        self._session = None
+        self._session_loop = None
+        self._request_ids = itertools.count()
+        self._in_flight = {}
+        self._in_flight_loop = None
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """
+        :return: the shared session, (re)created if closed or bound to another event loop,
+        as main.py restarts the whole event loop on failure.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(total=self.request_timeout)
+            )
+            self._session_loop = loop
+        return self._session
+
+    def build_payload(self, method: str, params=None) -> dict:
+        return {
+            'jsonrpc': '2.0',
+            'method': method,
+            'params': params if params is not None else [],
+            'id': next(self._request_ids)
+        }
+
+    async def post(self, payload):
+        """
+        :param payload: a JSON-RPC request dict, or a list of them for a batch request
+        :return: decoded JSON response
+        """
+        labels = {
+            'method': payload['method'] if isinstance(payload, dict) else 'batch',
+            'endpoint': self.endpoint_uri
+        }
+        METRICS.inc('neron_rpc_requests_total', labels)
+        started = time.monotonic()
+        session = await self.get_session()
+        try:
+            async with session.post(self.endpoint_uri, json=payload) as response:
+                response.raise_for_status()
+                return await response.json(content_type=None)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            METRICS.inc('neron_rpc_errors_total', labels)
+            raise
+        finally:
+            METRICS.observe('neron_rpc_request_seconds', time.monotonic() - started, labels)
+
+    @staticmethod
+    def get_result(response: dict):
+        # Same behavior as web3: RPC errors are raised as ValueError
+        if 'error' in response:
+            raise RPCError(response['error'])
+        return response['result']
+
+    async def request(self, method: str, params=None):
+        """
+        :param method: JSON-RPC method, ex: eth_call
+        :param params: list of method params
+        :return: the result field of the response
+        """
+        if method not in DEDUPLICATED_METHODS:
+            return await self._request(method, params)
+
+        loop = asyncio.get_running_loop()
+        if self._in_flight_loop is not loop:
+            self._in_flight = {}
+            self._in_flight_loop = loop
+
+        key = (method, json.dumps(params, sort_keys=True))
+        if key not in self._in_flight:
+            future = asyncio.ensure_future(self._request(method, params))
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # Shielded, so that a cancelled caller doesn't cancel the request for the other ones
+        return await asyncio.shield(self._in_flight[key])
+
+    async def _request(self, method: str, params=None):
+        return self.get_result(await self.post(self.build_payload(method, params)))
+
+    async def batch_request(self, requests: list) -> list:
+        """
+        Send several requests in a single JSON-RPC batch, so in a single round trip.
+        :param requests: list of (method, params) tuples
+        :return: list of results, in the same order as requests
+        """
+        if not requests:
+            return []
+        payloads = [self.build_payload(method, params) for method, params in requests]
+        responses = {response['id']: response for response in await self.post(payloads)}
+        return [self.get_result(responses[payload['id']]) for payload in payloads]
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
@@ -0,0 +1,89 @@
+class Bond:
+    """
+    Descriptor of a ROME bond: everything needed to price it, claim it and follow its bonding path.
+    """
+    def __init__(
+            self,
+            name: str,
+            label: str,
+            bond_contract,
+            principal_contract,
+            principal_decimals: int = 18,
+            path: str = None,
+            price_in_usd: bool = True
+    ):
+        """
+        :param name: bond key, used in settings.json bonds section and in pending rewards dicts
+        :param label: human-readable name, used in prints and logs
+        :param bond_contract: bond contract instance
+        :param principal_contract: contract of the token deposited in the bond, None if not supported yet
+        :param principal_decimals: decimals of the principal token
+        :param path: name of the bonding path turning ROME into the principal token, see controllers/bonds.py.
+        None if the bot can only claim this bond.
+        :param price_in_usd: True if the bond contract exposes bondPriceInUSD(). Otherwise its price is read with
+        bondPrice(), in hundredths of principal token, and needs a principal token USD price to get a discount.
+        """
+        self.name = name
+        self.label = label
+        self.bond_contract = bond_contract
+        self.bond_address = bond_contract.address
+        self.principal_contract = principal_contract
+        self.principal_address = principal_contract.address if principal_contract is not None else None
+        self.principal_decimals = principal_decimals
+        self.path = path
+        self.price_in_usd = price_in_usd
+
+
+class BondRegistry:
+    """
+    Every known ROME bond, in a single place. Pending rewards, claims, discounts and bonding paths are all driven
+    by this registry: adding a bond means adding its descriptor here, its reads join the existing batched calls.
+    """
+    def __init__(self, rome_contracts, enabled: dict):
+        """
+        :param rome_contracts: RomeContracts instance
+        :param enabled: settings.json bonds section, bond name -> bool
+        """
+        self.enabled = enabled
+        self.bonds = {
+            bond.name: bond
+            for bond in [
+                Bond(
+                    name='frax',
+                    label='FRAX',
+                    bond_contract=rome_contracts.bond_frax_contract,
+                    principal_contract=rome_contracts.frax_contract,
+                    path='frax'
+                ),
+                Bond(
+                    name='rome_frax',
+                    label='ROME-FRAX LP',
+                    bond_contract=rome_contracts.bond_rome_frax_lp_contract,
+                    principal_contract=rome_contracts.rome_frax_lp_contract,
+                    path='rome_frax_lp'
+                ),
+                # No gOHM token contract nor gOHM price source yet: claims only
+                Bond(
+                    name='gohm',
+                    label='gOHM',
+                    bond_contract=rome_contracts.bond_gohm_contract,
+                    principal_contract=None,
+                    price_in_usd=False
+                )
+            ]
+        }
+
+    def get(self, name: str) -> Bond:
+        return self.bonds[name]
+
+    def all(self) -> list:
+        """
+        :return: every bond, enabled or not: we may still have rewards to claim in a disabled one.
+        """
+        return list(self.bonds.values())
+
+    def enabled_bonds(self) -> list:
+        """
+        :return: bonds enabled in settings.json, the ones we may bond in
+        """
+        return [bond for bond in self.bonds.values() if self.enabled.get(bond.name, False)]
@@ -0,0 +1,82 @@
+import asyncio
+
+
+class SnapshotService:
+    """
+    Shares one chain state snapshot per block between all consumers (rebase and bonding hooks of every wallet).
+    Market state (epoch, bond prices, ROME-FRAX reserves) is the same for every wallet: it is read once,
+    in the same batched call as balances and pending rewards of every wallet.
+    The snapshot is fetched once per block: consumers asking for the same block while it is being fetched
+    wait for that same fetch instead of starting their own.
+    A snapshot is invalidated as soon as a consumer asks for a newer block.
+    """
+    def __init__(self, rome_interfaces: list):
+        """
+        :param rome_interfaces: AsyncRomeInterface of every wallet. The first one is used for market reads.
+        """
+        self.rome_interfaces = rome_interfaces
+        self._block_number = None
+        self._snapshot = None
+
+    async def get(
+            self,
+            block_number: int,
+            account_address: str = None
+    ) -> dict:
+        """
+        :param block_number: block the consumer was notified of
+        :param account_address: wallet to get the snapshot of, first wallet if None
+        :return: chain state snapshot, see RomeInterface.parse_snapshot(). Its block_number can be higher
+        than the given one, if the node is already ahead.
+        """
+        if self._snapshot is None or self._block_number is None or block_number > self._block_number:
+            self._block_number = block_number
+            self._snapshot = asyncio.ensure_future(self.fetch())
+        snapshot = self._snapshot
+        try:
+            snapshots = await asyncio.shield(snapshot)
+        except Exception:
+            # Don't keep a failed fetch: next consumer will try again
+            if self._snapshot is snapshot:
+                self._snapshot = None
+            raise
+        return snapshots[account_address or self.rome_interfaces[0].account_address]
+
+    async def fetch(self) -> dict:
+        """
+        :return: dict with wallet addresses as keys and their chain state snapshot as values,
+        all read in a single batched call.
+        """
+        market_interface = self.rome_interfaces[0]
+        account_calls = {
+            rome_interface.account_address: rome_interface.account_calls()
+            for rome_interface in self.rome_interfaces
+        }
+        calls = market_interface.market_calls()
+        for account_address, wallet_calls in account_calls.items():
+            calls.update({(account_address, key): call for key, call in wallet_calls.items()})
+
+        block_number, results = await market_interface.multicall.call(calls)
+        market = market_interface.parse_market(block_number, results)
+
+        snapshots = {}
+        for rome_interface in self.rome_interfaces:
+            # Same pool for everyone: a swap made by any wallet is applied to this shared model
+            rome_interface.rome_frax_pair = market['rome_frax_pair']
+            account_results = {
+                key: results[(rome_interface.account_address, key)]
+                for key in account_calls[rome_interface.account_address]
+            }
+            # Every snapshot is also a ledger reconcile: balances are read anyway
+            rome_interface.sync_ledger(block_number, account_results)
+            snapshots[rome_interface.account_address] = {
+                **market,
+                **rome_interface.parse_account(account_results)
+            }
+        return snapshots
+
+    def invalidate(self):
+        """
+        To be called after our own transactions changed our balances during the block.
+        """
+        self._snapshot = None
@@ -0,0 +1,149 @@
+from .async_rpc import RPCError
+from .multicall import encode_call
+from logger.metrics import METRICS
+import asyncio
+import itertools
+import time
+
+
+class ClaimPresigner:
+    """
+    Rebase claim transactions of a wallet, built and signed ahead of the rebase trigger, so that claiming is only
+    eth_sendRawTransaction calls.
+    redeem(wallet, true) calldata of each bond never changes: it is encoded once. Its gas limit does (vesting state,
+    rebase work of the autostake): it is estimated again on each prepare() round.
+    prepare() is called on every block before the trigger: transactions are signed again only when the claimed
+    bonds, the next nonce, the gas price or a gas limit changed. If the nonce moved in between (ex: a bond was
+    sent), claim() signs them again locally with the right nonces, still without any RPC call.
+    """
+    def __init__(self, account):
+        """
+        :param account: AsyncWeb3Account of the wallet
+        """
+        self.account = account
+        # bond address -> (bond address, calldata), encoded once
+        self._calldata = {}
+        # (bond addresses, first nonce, gas price in wei, gas limits) of signed transactions
+        self._signed_key = None
+        # bond address -> (tx dict, raw tx)
+        self.signed = {}
+
+    def _build(
+            self,
+            bond_contract,
+            nonce: int,
+            gas_price: int,
+            gas: int
+    ) -> dict:
+        to, data = self._calldata[bond_contract.address]
+        return {
+            'nonce': nonce,
+            'from': self.account.account_address,
+            'gas': gas,
+            'gasPrice': gas_price,
+            'chainId': 1285,
+            'to': to,
+            'data': data,
+            'value': 0
+        }
+
+    def _sign(
+            self,
+            bond_contracts: list,
+            first_nonce: int,
+            gas_price: int,
+            gas_limits: tuple
+    ):
+        started = time.monotonic()
+        self.signed = {}
+        for nonce, bond_contract, gas in zip(itertools.count(first_nonce), bond_contracts, gas_limits):
+            tx = self._build(bond_contract, nonce, gas_price, gas)
+            self.signed[bond_contract.address] = (tx, self.account.sign_tx(tx))
+        self._signed_key = (
+            tuple(bond_contract.address for bond_contract in bond_contracts),
+            first_nonce,
+            gas_price,
+            gas_limits
+        )
+        METRICS.observe('neron_claim_sign_seconds', time.monotonic() - started)
+
+    async def prepare(self, bond_contracts: list):
+        """
+        Sign claims of given bonds with the next nonces, current gas price and gas limits, unless already signed so.
+        If a claim would revert, nothing is signed: at trigger, claims are sent the regular way.
+        :param bond_contracts: bonds to claim pending rewards from
+        """
+        for bond_contract in bond_contracts:
+            if bond_contract.address not in self._calldata:
+                self._calldata[bond_contract.address] = encode_call(
+                    bond_contract.functions.redeem(self.account.account_address, True)
+                )
+        try:
+            first_nonce, gas_price, *gas_limits = await asyncio.gather(
+                self.account.nonce_manager.peek(),
+                self.account.fee_oracle.get_gas_price(),
+                *(
+                    self.account.fee_policy.estimate_gas({
+                        'from': self.account.account_address,
+                        'to': self._calldata[bond_contract.address][0],
+                        'data': self._calldata[bond_contract.address][1]
+                    })
+                    for bond_contract in bond_contracts
+                )
+            )
+        except RPCError as e:
+            print(f"[FAIL] - Claims not signed ahead, one of them would revert: {e}")
+            self.reset()
+            return
+        gas_limits = tuple(gas_limits)
+        key = (tuple(bond_contract.address for bond_contract in bond_contracts), first_nonce, gas_price, gas_limits)
+        if key != self._signed_key:
+            self._sign(bond_contracts, first_nonce, gas_price, gas_limits)
+
+    def is_ready(self, bond_contracts: list) -> bool:
+        """
+        :return: True if claims of exactly these bonds are signed
+        """
+        return self._signed_key is not None and \
+            self._signed_key[0] == tuple(bond_contract.address for bond_contract in bond_contracts)
+
+    def reset(self):
+        """
+        Forget signed transactions, ex: once broadcast. Calldata is kept.
+        """
+        self._signed_key = None
+        self.signed = {}
+
+    async def claim(self, bond_contracts: list) -> list:
+        """
+        Broadcast signed claims of given bonds back-to-back, and wait for their receipts.
+        Check is_ready() first.
+        :param bond_contracts: bonds to claim, same as prepared
+        :return: list of broadcast results, in bond_contracts order: sign_and_send_tx result, or the exception
+        raised by its broadcast or receipt wait
+        """
+        started = time.monotonic()
+        nonces = await self.account.nonce_manager.allocate_range(len(bond_contracts))
+        if nonces.start != self._signed_key[1]:
+            self._sign(bond_contracts, nonces.start, self._signed_key[2], self._signed_key[3])
+        signed = [self.signed[bond_contract.address] for bond_contract in bond_contracts]
+        self.reset()
+
+        tx_hashes = await asyncio.gather(
+            *(self.account.send_raw_tx(raw_tx) for _, raw_tx in signed),
+            return_exceptions=True
+        )
+        METRICS.observe('neron_claim_broadcast_seconds', time.monotonic() - started)
+        return await asyncio.gather(
+            *(self._wait(tx, tx_hash) for (tx, _), tx_hash in zip(signed, tx_hashes)),
+            return_exceptions=True
+        )
+
+    async def _wait(
+            self,
+            tx: dict,
+            tx_hash
+    ) -> dict:
+        if isinstance(tx_hash, Exception):
+            raise tx_hash
+        return await self.account.wait_for_tx_result(tx, tx_hash, 'redeem')
@@ -0,0 +1,80 @@
+class DiscountEngine:
+    """
+    Prices every enabled bond from a single chain state snapshot.
+    Bond price calls of all enabled bonds are part of the snapshot batch, then all discounts are computed
+    in one pass against the same ROME market price, and the best bond above min_bond_discount is picked.
+    """
+    def __init__(self, bond_registry):
+        """
+        :param bond_registry: BondRegistry instance
+        """
+        self.bond_registry = bond_registry
+
+    def price_calls(self) -> dict:
+        """
+        :return: bond price calls of every enabled bond, to be added to a batched call
+        """
+        return {
+            f'bond_price_{bond.name}': bond.bond_contract.functions.bondPriceInUSD()
+            if bond.price_in_usd else bond.bond_contract.functions.bondPrice()
+            for bond in self.bond_registry.enabled_bonds()
+        }
+
+    @staticmethod
+    def bond_price_in_usd(
+            bond,
+            bond_price: int,
+            principal_prices: dict
+    ):
+        """
+        :param bond: Bond descriptor
+        :param bond_price: raw bondPriceInUSD() or bondPrice() result
+        :param principal_prices: principal token USD prices, by bond name
+        :return: bond price in usd, None if it can't be computed
+        """
+        if bond.price_in_usd:
+            return bond_price / 10 ** 18
+        if principal_prices.get(bond.name) is None:
+            return None
+        return bond_price / 100 * principal_prices[bond.name]
+
+    def compute_discounts(
+            self,
+            results: dict,
+            rome_market_price: float,
+            principal_prices: dict = None
+    ) -> dict:
+        """
+        :param results: batch_call results containing price_calls() keys
+        :param rome_market_price: ROME market price in usd
+        :param principal_prices: USD prices of principal tokens not priced by their bond contract, by bond name
+        :return: dict with bond names as keys and discount percentages as values (None if it can't be computed)
+        """
+        principal_prices = principal_prices or {}
+        bond_prices = {
+            bond.name: self.bond_price_in_usd(bond, results[f'bond_price_{bond.name}'], principal_prices)
+            for bond in self.bond_registry.enabled_bonds()
+        }
+        return {
+            name: None if bond_price is None else 100 - (bond_price * 100 / rome_market_price)
+            for name, bond_price in bond_prices.items()
+        }
+
+    def best_bond(
+            self,
+            discounts: dict,
+            min_bond_discount: float
+    ) -> tuple:
+        """
+        :param discounts: compute_discounts() result
+        :param min_bond_discount: minimum discount percentage to bond
+        :return: tuple (Bond, discount) of the best bondable bond above min_bond_discount, (None, None) if none
+        """
+        candidates = [
+            (discount, name) for name, discount in discounts.items()
+            if discount is not None and discount > min_bond_discount and self.bond_registry.get(name).path
+        ]
+        if not candidates:
+            return None, None
+        discount, name = max(candidates)
+        return self.bond_registry.get(name), discount
@@ -0,0 +1,84 @@
+from eth_abi import decode_abi, decode_single
+from eth_utils import event_abi_to_log_topic, to_checksum_address
+from web3._utils.abi import collapse_if_tuple
+
+
+def to_bytes(value) -> bytes:
+    """
+    :param value: hex string (raw JSON-RPC answer) or bytes (web3 answer)
+    """
+    if isinstance(value, str):
+        return bytes.fromhex(value[2:] if value.startswith('0x') else value)
+    return bytes(value)
+
+
+class EventDecoder:
+    """
+    Decodes raw logs with the event ABIs of known contracts, looked up by (contract address, topic0):
+    a log is only decoded if it was emitted by a registered contract, so a Transfer of another token
+    or a look-alike event from another contract is never mistaken for ours.
+    Works on eth_getLogs results and receipt logs, from raw JSON-RPC answers or web3 AttributeDicts.
+    """
+    def __init__(self):
+        # (lowercase contract address, topic0 bytes) -> event ABI
+        self.events = {}
+
+    def add_contract(self, contract, event_names: list = None):
+        """
+        :param contract: web3 contract instance
+        :param event_names: events to decode, every event of the contract ABI if None
+        """
+        for abi in contract.abi:
+            if abi['type'] == 'event' and not abi.get('anonymous') and (event_names is None or abi['name'] in event_names):
+                self.events[(contract.address.lower(), event_abi_to_log_topic(abi))] = abi
+
+    def topics(self) -> list:
+        """
+        :return: topic0 of every registered event, as hex strings, for eth_getLogs filters
+        """
+        return sorted({'0x' + topic.hex() for _, topic in self.events})
+
+    def addresses(self) -> list:
+        """
+        :return: every registered contract address, for eth_getLogs filters
+        """
+        return sorted({to_checksum_address(address) for address, _ in self.events})
+
+    def decode(self, log) -> dict:
+        """
+        :param log: raw log
+        :return: dict with the log position (block_number, log_index, transaction_hash), emitting contract address,
+        event name and decoded args, None if the log isn't a registered event
+        """
+        if not log['topics']:
+            return None
+        topics = [to_bytes(topic) for topic in log['topics']]
+        abi = self.events.get((log['address'].lower(), topics[0]))
+        if abi is None:
+            return None
+
+        indexed = [argument for argument in abi['inputs'] if argument['indexed']]
+        not_indexed = [argument for argument in abi['inputs'] if not argument['indexed']]
+        args = dict(zip(
+            (argument['name'] for argument in not_indexed),
+            decode_abi([collapse_if_tuple(argument) for argument in not_indexed], to_bytes(log['data']))
+        ))
+        for argument, topic in zip(indexed, topics[1:]):
+            # Indexed dynamic values are only stored as their hash
+            if argument['type'] in ('string', 'bytes') or argument['type'].endswith(']'):
+                args[argument['name']] = topic
+            else:
+                args[argument['name']] = decode_single(argument['type'], topic)
+        for argument in abi['inputs']:
+            if argument['type'] == 'address' and argument['name'] in args:
+                args[argument['name']] = to_checksum_address(args[argument['name']])
+
+        block_number, log_index = log['blockNumber'], log['logIndex']
+        return {
+            'block_number': int(block_number, 16) if isinstance(block_number, str) else block_number,
+            'log_index': int(log_index, 16) if isinstance(log_index, str) else log_index,
+            'transaction_hash': to_bytes(log['transactionHash']),
+            'address': to_checksum_address(log['address']),
+            'event': abi['name'],
+            'args': args
+        }
@@ -0,0 +1,126 @@
+from .async_rpc import RPCError
+import asyncio
+import statistics
+from web3 import Web3
+
+
+class FeeOracle:
+    """
+    Gas price oracle, refreshed at most once per block.
+    Suggested gas price is the highest between node eth_gasPrice and next block base fee + median priority fee
+    from eth_feeHistory, capped to max_gasprice setting.
+    """
+    def __init__(self, rpc, settings: dict):
+        self.rpc = rpc
+        self.settings = settings
+        self.block_number = None
+        self._cached_block = None
+        self._gas_price = None
+
+    async def on_block(self, block_number: int):
+        """
+        Block hook: cached gas price is only valid for the block it was fetched on.
+        """
+        self.block_number = block_number
+
+    async def get_gas_price(self) -> int:
+        """
+        :return: suggested gas price in wei. Without block hook, it is fetched on every call.
+        """
+        if self._gas_price is not None and self.block_number is not None and self._cached_block == self.block_number:
+            return self._gas_price
+
+        fee_settings = self.settings['fees']
+        gas_price, fee_history = await asyncio.gather(
+            self.rpc.request('eth_gasPrice'),
+            self.rpc.request('eth_feeHistory', [
+                hex(fee_settings['fee_history_blocks']),
+                'latest',
+                [fee_settings['priority_fee_percentile']]
+            ]),
+            return_exceptions=True
+        )
+        if isinstance(gas_price, Exception):
+            raise gas_price
+
+        suggested_gas_price = int(gas_price, 16)
+        # Fee history is optional: some nodes don't expose it
+        if not isinstance(fee_history, Exception) and fee_history.get('reward'):
+            next_base_fee = int(fee_history['baseFeePerGas'][-1], 16)
+            priority_fee = statistics.median(int(reward[0], 16) for reward in fee_history['reward'])
+            suggested_gas_price = max(suggested_gas_price, int(next_base_fee + priority_fee))
+
+        self._gas_price = min(suggested_gas_price, Web3.toWei(fee_settings['max_gasprice'], 'gwei'))
+        self._cached_block = self.block_number
+        return self._gas_price
+
+
+class FeePolicy:
+    """
+    Decides gas limit and gas price of each transaction attempt:
+    - gas limit is estimated with eth_estimateGas, plus a safety margin
+    - gas price comes from the fee oracle
+    - after a failed attempt, gas limit is only raised if the transaction actually ran out of gas,
+    otherwise it is estimated again against the current chain state.
+    settings.json default_gas is used when estimation fails for lack of a node answer (transport error, rate
+    limiting...). A transaction the node estimates as reverting isn't given any gas: its RPCError is raised.
+    """
+    def __init__(self, rpc, fee_oracle: FeeOracle, settings: dict):
+        self.rpc = rpc
+        self.fee_oracle = fee_oracle
+        self.settings = settings
+
+    async def estimate_gas(self, tx: dict) -> int:
+        """
+        :param tx: transaction dict, at least with from, to and data fields
+        :return: estimated gas limit with safety margin
+        :raise RPCError: if the transaction would revert
+        """
+        try:
+            estimate = int(await self.rpc.request('eth_estimateGas', [{
+                'from': tx['from'],
+                'to': tx['to'],
+                'data': tx['data']
+            }]), 16)
+        except Exception as e:
+            if isinstance(e, RPCError) and not e.is_unavailable():
+                # Execution error: sending it would only burn gas on a failed transaction
+                raise
+            print(f"Gas estimation failed ({e}), using default gas.")
+            return self.settings['default_gas']
+        return int(estimate * (1 + self.settings['fees']['gas_limit_margin']))
+
+    async def get_gasprice(self) -> float:
+        """
+        :return: gas price in gwei
+        """
+        return float(Web3.fromWei(await self.fee_oracle.get_gas_price(), 'gwei'))
+
+    async def initial_fees(self, tx: dict) -> tuple:
+        """
+        :param tx: transaction dict without gas fields
+        :return: tuple (gas limit, gas price in gwei) for the first attempt
+        :raise RPCError: if the transaction would revert
+        """
+        return tuple(await asyncio.gather(self.estimate_gas(tx), self.get_gasprice()))
+
+    async def next_fees(
+            self,
+            tx: dict,
+            tx_receipt: dict,
+            gas: int,
+            gasprice: float
+    ) -> tuple:
+        """
+        :param tx: transaction dict of the failed attempt
+        :param tx_receipt: receipt of the failed attempt
+        :param gas: gas limit of the failed attempt
+        :param gasprice: gas price of the failed attempt, in gwei
+        :return: tuple (gas limit, gas price in gwei) for next attempt
+        :raise RPCError: if the transaction would revert again against the current chain state
+        """
+        gas_estimate, current_gasprice = await self.initial_fees(tx)
+        if tx_receipt['gasUsed'] >= gas:
+            # Ran out of gas: estimation was too low for the actual execution
+            gas_estimate = max(gas_estimate, int(gas * (1 + self.settings['fees']['out_of_gas_bump'])))
+        return gas_estimate, max(gasprice, current_gasprice)
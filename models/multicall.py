@@ -0,0 +1,195 @@
+from logger.metrics import METRICS
+from web3._utils.abi import get_abi_output_types, map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+import time
+
+
+# Minimal Multicall2 / Multicall3 ABI: we only need tryBlockAndAggregate(), which returns the block
+# the calls were executed on along with every call result.
+MULTICALL_ABI = '[{"inputs":[{"internalType":"bool","name":"requireSuccess","type":"bool"},{"components":[{"internalType":"address","name":"target","type":"address"},{"internalType":"bytes","name":"callData","type":"bytes"}],"internalType":"struct Multicall2.Call[]","name":"calls","type":"tuple[]"}],"name":"tryBlockAndAggregate","outputs":[{"internalType":"uint256","name":"blockNumber","type":"uint256"},{"internalType":"bytes32","name":"blockHash","type":"bytes32"},{"components":[{"internalType":"bool","name":"success","type":"bool"},{"internalType":"bytes","name":"returnData","type":"bytes"}],"internalType":"struct Multicall2.Result[]","name":"returnData","type":"tuple[]"}],"stateMutability":"nonpayable","type":"function"}]'
+
+
+def encode_call(contract_function) -> tuple:
+    """
+    :param contract_function: bound web3 contract function, ex: contract.functions.balanceOf(address)
+    :return: tuple (target address, calldata) to be given to the aggregator.
+    """
+    return contract_function.address, contract_function._encode_transaction_data()
+
+
+def decode_result(web3, contract_function, return_data: bytes):
+    """
+    Decode raw return data the same way web3 ContractFunction.call() does.
+    :param contract_function: bound web3 contract function which produced return_data
+    :param return_data: raw bytes returned by the call
+    :return: single value if the function has one output, list of values otherwise
+    """
+    output_types = get_abi_output_types(contract_function.abi)
+    output_data = web3.codec.decode_abi(output_types, return_data)
+    normalized_data = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, output_data)
+    if len(normalized_data) == 1:
+        return normalized_data[0]
+    return list(normalized_data)
+
+
+class Multicall:
+    """
+    Packs several read-only contract calls into a single eth_call through a Multicall aggregator contract.
+    All results come from the same block. If no aggregator is configured (or none is deployed at the given
+    address, ex: on a fresh dev chain), calls are performed one by one, all pinned to the same block.
+    """
+    def __init__(self, web3, address=None):
+        self.web3 = web3
+        self.address = web3.toChecksumAddress(address) if address else None
+        self.contract = web3.eth.contract(address=self.address, abi=MULTICALL_ABI) if address else None
+        self._deployed = None
+
+    def is_available(self) -> bool:
+        """
+        :return: True if an aggregator contract is deployed at the configured address. Checked once.
+        """
+        if self.contract is None:
+            return False
+        if self._deployed is None:
+            self._deployed = len(self.web3.eth.get_code(self.address)) > 0
+        return self._deployed
+
+    def call(
+            self,
+            calls: dict,
+            block_identifier='latest'
+    ) -> tuple:
+        """
+        :param calls: dict mapping a result key to a bound contract function
+        :param block_identifier: block to perform the calls on
+        :return: tuple (block number, dict with the same keys as calls and decoded results as values)
+        """
+        if not self.is_available():
+            return self._call_sequentially(calls, block_identifier)
+
+        keys = list(calls.keys())
+        block_number, _, results = self.contract.functions.tryBlockAndAggregate(
+            True,
+            [encode_call(calls[key]) for key in keys]
+        ).call(block_identifier=block_identifier)
+
+        return block_number, {
+            key: decode_result(self.web3, calls[key], return_data)
+            for key, (_, return_data) in zip(keys, results)
+        }
+
+    def _call_sequentially(
+            self,
+            calls: dict,
+            block_identifier
+    ) -> tuple:
+        """
+        Fallback when no aggregator is deployed: one eth_call per function, all on the same block.
+        """
+        if block_identifier == 'latest':
+            block_identifier = self.web3.eth.block_number
+        return block_identifier, {
+            key: contract_function.call(block_identifier=block_identifier)
+            for key, contract_function in calls.items()
+        }
+
+
+def record_contract_calls(
+        contract_functions,
+        duration: float,
+        contract_names: dict
+):
+    """
+    Count contract calls and observe their latency, labelled by contract and function.
+    :param contract_functions: bound web3 contract functions which were called together
+    :param duration: seconds it took to get their results
+    :param contract_names: contract address -> name, for readable labels. Addresses are used for unknown contracts.
+    """
+    for contract_function in contract_functions:
+        labels = {
+            'contract': contract_names.get(contract_function.address, contract_function.address),
+            'function': contract_function.fn_name
+        }
+        METRICS.inc('neron_contract_calls_total', labels)
+        METRICS.observe('neron_contract_call_seconds', duration, labels)
+
+
+def to_block_param(block_identifier) -> str:
+    """
+    :param block_identifier: block number or tag (latest, pending...)
+    :return: block parameter as expected by JSON-RPC
+    """
+    if isinstance(block_identifier, int):
+        return hex(block_identifier)
+    return block_identifier
+
+
+class AsyncMulticall(Multicall):
+    """
+    Same as Multicall, but through an AsyncRPC client. Without aggregator, calls are sent
+    in a single JSON-RPC batch pinned to one block, so it still costs a single round trip.
+    """
+    def __init__(self, web3, rpc, address=None):
+        Multicall.__init__(self, web3, address)
+        self.rpc = rpc
+        # Contract address -> name, for metrics labels
+        self.contract_names = {}
+
+    async def is_available(self) -> bool:
+        if self.contract is None:
+            return False
+        if self._deployed is None:
+            code = await self.rpc.request('eth_getCode', [self.address, 'latest'])
+            self._deployed = code not in ('0x', '0x0', None)
+        return self._deployed
+
+    async def call(
+            self,
+            calls: dict,
+            block_identifier='latest'
+    ) -> tuple:
+        started = time.monotonic()
+        result = await self._call(calls, block_identifier)
+        record_contract_calls(calls.values(), time.monotonic() - started, self.contract_names)
+        return result
+
+    async def _call(
+            self,
+            calls: dict,
+            block_identifier
+    ) -> tuple:
+        if not await self.is_available():
+            return await self._call_sequentially(calls, block_identifier)
+
+        keys = list(calls.keys())
+        aggregate_function = self.contract.functions.tryBlockAndAggregate(
+            True,
+            [encode_call(calls[key]) for key in keys]
+        )
+        aggregate_data = await self.rpc.request('eth_call', [
+            {'to': self.address, 'data': aggregate_function._encode_transaction_data()},
+            to_block_param(block_identifier)
+        ])
+        block_number, _, results = decode_result(self.web3, aggregate_function, bytes.fromhex(aggregate_data[2:]))
+
+        return block_number, {
+            key: decode_result(self.web3, calls[key], return_data)
+            for key, (_, return_data) in zip(keys, results)
+        }
+
+    async def _call_sequentially(
+            self,
+            calls: dict,
+            block_identifier
+    ) -> tuple:
+        if block_identifier == 'latest':
+            block_identifier = int(await self.rpc.request('eth_blockNumber'), 16)
+        keys = list(calls.keys())
+        results = await self.rpc.batch_request([
+            ('eth_call', [{'to': address, 'data': data}, to_block_param(block_identifier)])
+            for address, data in (encode_call(calls[key]) for key in keys)
+        ])
+        return block_identifier, {
+            key: decode_result(self.web3, calls[key], bytes.fromhex(return_data[2:]))
+            for key, return_data in zip(keys, results)
+        }
@@ -0,0 +1,63 @@
+import asyncio
+
+
+class NonceManager:
+    """
+    Tracks the account pending nonce locally, so transactions don't need an eth_getTransactionCount
+    round trip each, and several transactions can be in flight at the same time with consecutive nonces.
+    The nonce is fetched from the node on first use, and again only after resync() (ex: on send error).
+    """
+    def __init__(self, rpc, account_address: str):
+        self.rpc = rpc
+        self.account_address = account_address
+        self._next_nonce = None
+        self._lock = None
+        self._lock_loop = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        # main.py restarts the event loop on failure: in that case, start again from the node nonce
+        loop = asyncio.get_running_loop()
+        if self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+            self._next_nonce = None
+        return self._lock
+
+    async def _fetch(self):
+        if self._next_nonce is None:
+            self._next_nonce = int(
+                await self.rpc.request('eth_getTransactionCount', [self.account_address, 'pending']),
+                16
+            )
+
+    async def allocate(self) -> int:
+        """
+        :return: the next nonce to use. Each call returns a different, consecutive nonce.
+        """
+        return (await self.allocate_range(1))[0]
+
+    async def allocate_range(self, count: int) -> range:
+        """
+        :param count: number of transactions to send
+        :return: count consecutive nonces, allocated at once: no other allocation can interleave
+        """
+        async with self._get_lock():
+            await self._fetch()
+            nonces = range(self._next_nonce, self._next_nonce + count)
+            self._next_nonce += count
+            return nonces
+
+    async def peek(self) -> int:
+        """
+        :return: the nonce next allocation will return, without allocating it (ex: to sign transactions ahead)
+        """
+        async with self._get_lock():
+            await self._fetch()
+            return self._next_nonce
+
+    def resync(self):
+        """
+        Forget the local nonce: it will be fetched again from the node on next allocation.
+        To be called when a transaction could not be broadcast, to avoid leaving a nonce gap.
+        """
+        self._next_nonce = None
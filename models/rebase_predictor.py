@@ -0,0 +1,122 @@
+from collections import deque
+import math
+import time
+
+
+class RebasePredictor:
+    """
+    Tells the rebase hook when it needs chain state. The rebase block is known from the staking contract epoch,
+    so between rebases the hook has nothing to read: it wakes up wake_blocks before its trigger block, then checks
+    every block until it claims.
+    The trigger block is lead_blocks() before the rebase: enough blocks for a claim round to be mined, from the
+    durations of past claim rounds (times latency_margin) and the block time observed over the last blocks.
+    Until both are measured, default_lead_blocks is used.
+    """
+    def __init__(
+            self,
+            default_lead_blocks: int = 30,
+            min_lead_blocks: int = 5,
+            latency_margin: float = 2,
+            wake_blocks: int = 5,
+            block_time_window: int = 100,
+            claim_latency_window: int = 10,
+            clock=time.monotonic
+    ):
+        """
+        :param default_lead_blocks: blocks before rebase to claim at, while claim latency or block time is unknown
+        :param min_lead_blocks: minimum blocks before rebase to claim at
+        :param latency_margin: ratio applied to the longest recent claim round duration
+        :param wake_blocks: blocks before the trigger block from which chain state is read again on every block
+        :param block_time_window: number of last blocks the block time is measured over
+        :param claim_latency_window: number of last claim rounds the claim latency is taken from
+        :param clock: time source, in seconds
+        """
+        self.default_lead_blocks = default_lead_blocks
+        self.min_lead_blocks = min_lead_blocks
+        self.latency_margin = latency_margin
+        self.wake_blocks = wake_blocks
+        self.clock = clock
+        # (block number, arrival time)
+        self.blocks = deque(maxlen=block_time_window)
+        self.claim_latencies = deque(maxlen=claim_latency_window)
+        self.epoch_end_block = None
+        self.epoch_length = None
+
+    async def on_block(self, block_number: int):
+        """
+        Block hook: records block arrival times.
+        """
+        self.blocks.append((block_number, self.clock()))
+
+    def block_time(self) -> float:
+        """
+        :return: average seconds per block over the window, None if not measured yet. Missed blocks (coalesced
+        by the scheduler) don't bias it, as it is computed from block numbers.
+        """
+        if len(self.blocks) < 2:
+            return None
+        (first_block, first_time), (last_block, last_time) = self.blocks[0], self.blocks[-1]
+        if last_block <= first_block:
+            return None
+        return (last_time - first_time) / (last_block - first_block)
+
+    def record_claim(self, seconds: float):
+        """
+        :param seconds: duration of a claim round, from trigger to receipts
+        """
+        self.claim_latencies.append(seconds)
+
+    def lead_blocks(self) -> int:
+        """
+        :return: blocks before rebase to claim at
+        """
+        block_time = self.block_time()
+        if not self.claim_latencies or not block_time:
+            return self.default_lead_blocks
+        return max(self.min_lead_blocks, math.ceil(max(self.claim_latencies) * self.latency_margin / block_time))
+
+    def set_epoch(self, epoch: list):
+        """
+        :param epoch: staking contract epoch() result: length, number, end block, distribute
+        """
+        self.epoch_length, self.epoch_end_block = epoch[0], epoch[2]
+
+    def next_rebase_block(self, block_number: int) -> int:
+        """
+        :return: block of the next rebase after block_number, predicted from last epoch read. None if never read.
+        """
+        if self.epoch_end_block is None:
+            return None
+        if self.epoch_end_block > block_number or not self.epoch_length:
+            return self.epoch_end_block
+        epochs_elapsed = (block_number - self.epoch_end_block) // self.epoch_length + 1
+        return self.epoch_end_block + epochs_elapsed * self.epoch_length
+
+    def wake_block(self, block_number: int) -> int:
+        """
+        :return: first block chain state has to be read on again. None if the rebase block is unknown.
+        """
+        rebase_block = self.next_rebase_block(block_number)
+        if rebase_block is None:
+            return None
+        return rebase_block - self.lead_blocks() - self.wake_blocks
+
+    def should_check(self, block_number: int) -> bool:
+        """
+        :return: True if the rebase hook has to read chain state on this block
+        """
+        wake_block = self.wake_block(block_number)
+        return wake_block is None or block_number >= wake_block
+
+    def seconds_until(
+            self,
+            block_number: int,
+            target_block: int
+    ) -> float:
+        """
+        :return: estimated seconds from block_number to target_block, None if block time is unknown
+        """
+        block_time = self.block_time()
+        if block_time is None:
+            return None
+        return max(0, target_block - block_number) * block_time
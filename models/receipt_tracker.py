@@ -0,0 +1,136 @@
+from web3._utils.method_formatters import receipt_formatter
+from web3.exceptions import TimeExhausted
+import asyncio
+
+
+class ReceiptTracker:
+    """
+    Receipts of every transaction in flight, shared by all wallets, resolved by a single JSON-RPC batch per check
+    instead of one eth_getTransactionReceipt polling loop per transaction.
+    Once registered as a block hook, receipts are checked on each new block: receipt requests grow with blocks,
+    not with transactions. Until then (ex: without a block scheduler), tracked transactions are checked every
+    poll_interval seconds, still all together.
+    With confirmations, a mined transaction is only resolved once that many blocks are on top of its block. Its
+    receipt is fetched again on every check until then: if a reorganization removed or moved it, it waits again.
+    """
+    def __init__(
+            self,
+            rpc,
+            confirmations: int = 0,
+            poll_interval: float = 1
+    ):
+        """
+        :param rpc: AsyncRPC client
+        :param confirmations: number of blocks on top of a transaction block before its receipt is resolved
+        :param poll_interval: seconds between two checks, when no block hook drives them
+        """
+        self.rpc = rpc
+        self.confirmations = confirmations
+        self.poll_interval = poll_interval
+        self.block_driven = False
+        # tx hash -> future resolved with its receipt
+        self.pending = {}
+        # tx hash -> block of its receipt, for mined transactions waiting for confirmations
+        self.mined = {}
+        self._loop = None
+        self._wake = None
+        self._poller = None
+
+    def _check_loop(self):
+        # main.py restarts the event loop on failure: futures of the previous loop can't be awaited anymore
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._wake = asyncio.Event()
+            self._poller = None
+            self.pending = {}
+            self.mined = {}
+
+    async def on_block(self, block_number: int):
+        """
+        Block hook: check every tracked transaction. Registering it stops periodic polling.
+        """
+        self._check_loop()
+        self.block_driven = True
+        if self.pending:
+            await self.check()
+
+    def track(self, tx_hash: str) -> asyncio.Future:
+        """
+        :param tx_hash: hash of a sent transaction
+        :return: future resolved with its formatted receipt
+        """
+        self._check_loop()
+        if tx_hash not in self.pending:
+            self.pending[tx_hash] = self._loop.create_future()
+        if not self.block_driven:
+            self._wake.set()
+            if self._poller is None:
+                self._poller = asyncio.ensure_future(self._poll())
+        return self.pending[tx_hash]
+
+    def untrack(self, tx_hash: str):
+        future = self.pending.pop(tx_hash, None)
+        self.mined.pop(tx_hash, None)
+        if future is not None and not future.done():
+            future.cancel()
+
+    async def wait(
+            self,
+            tx_hash: str,
+            timeout: float = 120
+    ) -> dict:
+        """
+        :param tx_hash: hash of a sent transaction
+        :param timeout: seconds to wait before raising TimeExhausted, same default as web3
+        :return: formatted transaction receipt
+        """
+        future = self.track(tx_hash)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            self.untrack(tx_hash)
+            raise TimeExhausted(f"Transaction {tx_hash} is not in the chain after {timeout} seconds")
+
+    async def check(self):
+        """
+        Fetch receipts of every tracked transaction in a single batch, and resolve the confirmed ones.
+        """
+        tx_hashes = list(self.pending)
+        requests = [('eth_getTransactionReceipt', [tx_hash]) for tx_hash in tx_hashes]
+        if self.confirmations:
+            requests.append(('eth_blockNumber', []))
+        try:
+            results = await self.rpc.batch_request(requests)
+        except Exception as e:
+            # Tried again on next check
+            print(f"Receipts check failed: {e}")
+            return
+        block_number = int(results.pop(), 16) if self.confirmations else None
+
+        for tx_hash, tx_receipt in zip(tx_hashes, results):
+            future = self.pending.get(tx_hash)
+            if future is None or future.done():
+                continue
+            if tx_receipt is None:
+                if tx_hash in self.mined:
+                    print(f"Transaction {tx_hash} was removed from block {self.mined.pop(tx_hash)} by a reorganization.")
+                continue
+            tx_receipt = receipt_formatter(tx_receipt)
+            self.mined[tx_hash] = tx_receipt['blockNumber']
+            if block_number is None or block_number - tx_receipt['blockNumber'] >= self.confirmations:
+                future.set_result(tx_receipt)
+                del self.pending[tx_hash]
+                del self.mined[tx_hash]
+
+    async def _poll(self):
+        while self.pending and not self.block_driven:
+            self._wake.clear()
+            # Transactions sent back-to-back are tracked in the same check
+            await asyncio.sleep(0)
+            await self.check()
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+        self._poller = None
@@ -1,420 +1,386 @@
-from .rome_contracts import RomeContracts
+from .rome_contracts import RomeContracts, load_abi
 from .account_interface import Web3Account
+from .bond_registry import BondRegistry
+from .discount_engine import DiscountEngine
+from .event_decoder import EventDecoder
+from .multicall import Multicall
+from .solarbeam_pair import SolarbeamPair
+import time
 
 
 class RomeInterface(Web3Account, RomeContracts):
-    def __init__(self, web3):
-        Web3Account.__init__(self, web3),
+    def __init__(
+            self,
+            web3,
+            account_address: str = None,
+            private_key: str = None
+    ):
+        Web3Account.__init__(self, web3, account_address, private_key)
         RomeContracts.__init__(self, web3)
-
-    def get_total_rome_balance(self) -> float:
+        self.multicall = Multicall(web3, self.settings.get('multicall_address'))
+        self.rome_frax_pair = None
+        self._zap_contract = None
+        self.bond_registry = BondRegistry(self, self.settings['bonds'])
+        self.discount_engine = DiscountEngine(self.bond_registry)
+        self.event_decoder = self.build_event_decoder()
+
+    def get_zap_contract(self):
         """
-        Get total ROME balance:
-        - staked balance is sRome balance
-        - in_bonds is pending bonded ROME across all bond contracts
-        - locked is balance locked for campaign. We first check for user profile in conscription contract,
-        we get his gons and we pass it as argument to balanceForGons() method of sRome contract.
-        :return: float representing total ROME balance.
+        :return: NeronZap contract at zap address setting, see contracts/NeronZap.sol. None if no address is set.
         """
-        staked_balance = self.srome_contract.functions.balanceOf(self.account_address).call()
-        in_bonds = self.check_deposited_bonds()
-        locked = self.srome_contract.functions.balanceForGons(
-            self.rome_conscription_contract.functions.profiles(self.account_address).call()[3]
-        ).call()
-        return self.convert_rome_to_ether(staked_balance + in_bonds['frax'] + in_bonds['rome_frax'] + in_bonds['gohm'] + locked)
+        if not self.settings['zap']['address']:
+            return None
+        if self._zap_contract is None:
+            self._zap_contract = self.web3.eth.contract(
+                address=self.web3.toChecksumAddress(self.settings['zap']['address']),
+                abi=load_abi('neron_zap')
+            )
+        return self._zap_contract
 
-    def get_stacked_balance(self) -> float:
-        return self.convert_rome_to_ether(self.srome_contract.functions.balanceOf(self.account_address).call())
+    # --------- RECEIPTS ---------
 
-    def check_deposited_bonds(self) -> dict:
+    def build_event_decoder(self) -> EventDecoder:
         """
-        Check if there is pending rewards in a bond
-        :return: dict with bond currency as keys and bool as values
+        :return: decoder of the events our transactions emit: token transfers, ROME-FRAX swaps and liquidity adds,
+        bond deposits and redeems, zaps
         """
-        return {
-            'frax': self.bond_frax_contract.functions.bondInfo(self.account_address).call()[0],
-            'rome_frax': self.bond_rome_frax_lp_contract.functions.bondInfo(self.account_address).call()[0],
-            'gohm': self.bond_gohm_contract.functions.bondInfo(self.account_address).call()[0]
-        }
+        event_decoder = EventDecoder()
+        for token_contract in (self.rome_contract, self.srome_contract, self.frax_contract):
+            event_decoder.add_contract(token_contract, ['Transfer'])
+        event_decoder.add_contract(self.rome_frax_lp_contract, ['Transfer', 'Swap', 'Mint'])
+        for bond in self.bond_registry.all():
+            event_decoder.add_contract(bond.bond_contract, ['BondCreated', 'BondRedeemed'])
+        zap_contract = self.get_zap_contract()
+        if zap_contract is not None:
+            event_decoder.add_contract(zap_contract, ['Zapped'])
+        return event_decoder
+
+    def decode_receipt(self, tx_receipt) -> list:
+        """
+        :param tx_receipt: receipt of one of our transactions
+        :return: decoded events of known contracts, in log order
+        """
+        events = (self.event_decoder.decode(log) for log in tx_receipt['logs'])
+        return [event for event in events if event is not None]
 
-    def get_pending_bond_reward(self, bond_contract) -> float:
+    def get_received_amount(
+            self,
+            events: list,
+            token_address: str
+    ) -> int:
         """
-        Get pending rewards for a given contract.
-        :param bond_contract: bond contract instance
-        :return: pending rewards in ether
+        :param events: decode_receipt() result
+        :param token_address: token contract address
+        :return: amount of this token received by our wallet minus amount sent, in wei
         """
-        return self.convert_rome_to_ether(
-            bond_contract.functions.pendingPayoutFor(self.account_address).call()
+        amount = 0
+        for event in events:
+            if event['event'] == 'Transfer' and event['address'] == token_address:
+                if event['args']['to'] == self.account_address:
+                    amount += event['args']['value']
+                if event['args']['from'] == self.account_address:
+                    amount -= event['args']['value']
+        return amount
+
+    @staticmethod
+    def get_redeemed_payout(
+            events: list,
+            bond_address: str
+    ) -> int:
+        """
+        :param events: decode_receipt() result
+        :param bond_address: bond contract address
+        :return: ROME redeemed from this bond, in wei
+        """
+        return sum(
+            event['args']['payout'] for event in events
+            if event['event'] == 'BondRedeemed' and event['address'] == bond_address
         )
 
-    def get_all_bond_pending_rewards(self) -> dict:
+    # --------- BATCHED READS ---------
+
+    def batch_call(
+            self,
+            calls: dict,
+            block_identifier='latest'
+    ) -> dict:
         """
-        Get total pending rewards across all bond contracts.
-        :return: Dict containing individual pending rewards and total pending rewards.
+        Perform all given read-only calls in a single round trip, on the same block.
+        :param calls: dict mapping a result key to a bound contract function
+        :param block_identifier: block to read from, latest by default
+        :return: dict with the same keys as calls and decoded results as values
+        """
+        _, results = self.multicall.call(calls, block_identifier)
+        return results
+
+    def get_bond_contracts(self) -> dict:
+        """
+        :return: dict with bond currency as keys and bond contract instances as values
         """
-        frax_pending_reward = self.get_pending_bond_reward(self.bond_frax_contract)
-        rome_frax_pending_reward = self.get_pending_bond_reward(self.bond_rome_frax_lp_contract)
-        gohm_pending_reward = self.get_pending_bond_reward(self.bond_gohm_contract)
         return {
-            'frax': frax_pending_reward,
-            'rome_frax': rome_frax_pending_reward,
-            'gohm': gohm_pending_reward,
-            'total': frax_pending_reward + rome_frax_pending_reward + gohm_pending_reward
+            bond.name: bond.bond_contract
+            for bond in self.bond_registry.all()
         }
 
-    def convert_rome_to_ether(
+    def pending_rewards_calls(self) -> dict:
+        return {
+            f'pending_{bond}': bond_contract.functions.pendingPayoutFor(self.account_address)
+            for bond, bond_contract in self.get_bond_contracts().items()
+        }
+
+    def deposited_bonds_calls(self) -> dict:
+        return {
+            f'bond_info_{bond}': bond_contract.functions.bondInfo(self.account_address)
+            for bond, bond_contract in self.get_bond_contracts().items()
+        }
+
+    def market_price_calls(self) -> dict:
+        return {
+            'lp_reserves': self.rome_frax_lp_contract.functions.getReserves()
+        }
+
+    def parse_pending_rewards(self, results: dict) -> dict:
+        """
+        :param results: batch_call results containing pending_rewards_calls() keys
+        :return: Dict containing individual pending rewards and total pending rewards.
+        """
+        pending_rewards = {
+            bond: self.convert_rome_to_ether(results[f'pending_{bond}'])
+            for bond in self.get_bond_contracts()
+        }
+        pending_rewards['total'] = sum(pending_rewards.values())
+        return pending_rewards
+
+    def parse_rome_frax_pair(
             self,
-            rome_amount_in_wei: int
-    ) -> float:
+            results: dict,
+            block_number: int = None
+    ) -> SolarbeamPair:
         """
-        Converts ROME amount in wei to a human-readable amount in ether.
-        :param rome_amount_in_wei: int representing amount to convert.
-        :return: converted amount in ether with the nine ROME decimals.
+        :param results: batch_call results containing market_price_calls() keys
+        :param block_number: block the reserves were read on
+        :return: local model of the ROME-FRAX pair, also kept as self.rome_frax_pair
         """
-        return float(self.web3.fromWei(rome_amount_in_wei, 'ether')) / 0.000000001
+        self.rome_frax_pair = SolarbeamPair.from_reserves(
+            self.rome_address,
+            self.frax_address,
+            results['lp_reserves'],
+            self.settings['solarbeam']['swap_fee_bps'],
+            block_number
+        )
+        return self.rome_frax_pair
 
-    def get_rome_market_price(self) -> float:
+    def parse_market_price(self, results: dict) -> float:
         """
+        :param results: batch_call results containing market_price_calls() keys
         :return: Float representing ROME market price in usd
         """
-        return self.frax_contract.functions.balanceOf(
-            self.rome_frax_lp_address
-        ).call() / self.rome_contract.functions.balanceOf(
-            self.rome_frax_lp_address
-        ).call() * 0.000000001
+        # FRAX has 18 decimals, ROME has 9
+        return self.parse_rome_frax_pair(results).spot_price(self.rome_address) * 0.000000001
 
-    def check_blocks_before_rebase(self) -> int:
+    def get_swap_deadline(self) -> int:
         """
-        :return: integer representing remaining blocks before sROME rebase
+        :return: timestamp after which our router transactions revert instead of executing at a stale price
         """
-        return self.staking_rome_contract.functions.epoch().call()[2] - self.web3.eth.get_block('latest')['number']
+        return int(time.time()) + self.settings['solarbeam']['deadline_seconds']
 
-    def get_bond_discount(self, bond_contract) -> float:
+    def parse_bond_discount(self, bond_price_in_usd: int, rome_market_price: float) -> float:
         """
-        :param bond_contract: bond contract to get discount
+        :param bond_price_in_usd: raw bondPriceInUSD() result
+        :param rome_market_price: ROME market price in usd
         :return: float as discount percentage
         """
-        rome_market_price = self.get_rome_market_price()
-        bond_price = float(self.web3.fromWei(bond_contract.functions.bondPriceInUSD().call(), 'ether'))
+        bond_price = float(self.web3.fromWei(bond_price_in_usd, 'ether'))
         return 100 - (bond_price * 100 / rome_market_price)
 
-    def claim_bond_reward(
-            self,
-            bond_contract,
-            gas: int,
-            gasprice: int,
-            do_autostake=True
-    ) -> dict:
+    def market_calls(self) -> dict:
         """
-        use redeem() function on the given bond contract to automatically claim bonding reward.
-        :param do_autostake: boolean to autostake or not. True by default.
-        :param bond_contract: the given bond contract
-        :return: dict with tx_receipt, tx_hash and tx_status
-        """
-        tx_result, amount_staked = {}, 0
-
-        for i in range(0, 3):
-            # At 3 tries, if tx still failed, return tx result
-            # If tx fails, retry with more gas
-
-            tx = bond_contract.functions.redeem(
-                self.account_address,
-                do_autostake
-            ).buildTransaction(
-                self.build_tx_dict(
-                    gas,
-                    gasprice,
-                )
-            )
-            tx_result = self.sign_and_send_tx(tx)
-
-            if tx_result['tx_status'] == 1:
-                amount_hex = ""
-                for log in tx_result['tx_receipt']['logs']:
-                    amount_hex = log['data']
-                amount_staked = self.convert_rome_to_ether(self.web3.toInt(hexstr=amount_hex))
+        :return: read calls of the market part of a snapshot, identical for every wallet:
+        epoch, enabled bond prices and ROME-FRAX reserves
+        """
+        return {
+            'epoch': self.staking_rome_contract.functions.epoch(),
+            **self.discount_engine.price_calls(),
+            **self.market_price_calls()
+        }
 
-                print(f'Successfully redeemed {amount_staked} ROME.\nTx Hash: {tx_result["tx_hash"]}')
-                break
+    def balance_calls(self) -> dict:
+        """
+        :return: balanceOf() calls of every token our flows use, keyed <token name>_balance
+        """
+        return {
+            'srome_balance': self.srome_contract.functions.balanceOf(self.account_address),
+            'rome_balance': self.rome_contract.functions.balanceOf(self.account_address),
+            'frax_balance': self.frax_contract.functions.balanceOf(self.account_address),
+            'rome_frax_lp_balance': self.rome_frax_lp_contract.functions.balanceOf(self.account_address)
+        }
 
-            else:
-                amount_staked = 0
-                print(f'[FAIL] - Transaction failed: likely not enough gas.\nTx Hash: {tx_result["tx_hash"]}')
-                gas += gas * 0.2
-                gasprice += 1
+    def account_calls(self) -> dict:
+        """
+        :return: read calls of the wallet part of a snapshot: balances and pending rewards
+        """
+        return {
+            **self.balance_calls(),
+            **self.pending_rewards_calls()
+        }
 
+    def snapshot_calls(self) -> dict:
+        """
+        :return: every read call of a chain state snapshot: market data, enabled bond prices, balances,
+        pending rewards and epoch
+        """
         return {
-            'tx_type': 'claim_and_autostake',
-            'tx_hash': tx_result['tx_hash'],
-            'tx_status': tx_result['tx_status'],
-            'rome_staked': amount_staked
+            **self.market_calls(),
+            **self.account_calls()
         }
 
-    def swap_rome_for_frax(
+    def parse_market(
             self,
-            gas: int,
-            gasprice: int,
-            total_balance=True
+            block_number: int,
+            results: dict
     ) -> dict:
         """
-        Swap web3_interface tokens for frax. if total_balance is set to false (in case of adding web3_interface-frax lp),
-        it will swap half web3_interface balance for frax.
-        :param total_balance: bool for swapping total balance or not
-        :return: dict with tx_hash and tx_status
-        """
-        tx_result, rome_swapped, frax_received_in_wei = {}, 0, 0
-        if total_balance:
-            # In case we want to bond FRAX
-            rome_to_swap = self.rome_contract.functions.balanceOf(self.account_address).call()
-        else:
-            # In case we want to bond ROME / FRAX LP
-            rome_to_swap = round(self.rome_contract.functions.balanceOf(self.account_address).call() / 2)
-
-        # Approve Solarbeam to spend our ROME tokens before swapping
-        approve_tx_result = self.approve_token_spending(
-            token_to_spend_contract=self.rome_contract,
-            amount=rome_to_swap,
-            spender_address=self.solarbeam_router_address,
-            gas=gas,
-            gasprice=gasprice
-        )
-
-        if approve_tx_result['tx_status'] == 1:
-            print("Spending Approved")
-        else:
-            print("Spending not approved")
-            return approve_tx_result
-
-        # Assuming spending approve, we can swap ROME for FRAX
-        # At 3 tries, if tx still failed, return tx result
-        # If tx fails, retry with more gas
-        for i in range(0, 3):
-            tx = self.solarbeam_router_contract.functions.swapExactTokensForTokens(
-                rome_to_swap,
-                0,
-                [self.rome_address, self.frax_address],
-                self.account_address,
-                1673825868
-            ).buildTransaction(
-                self.build_tx_dict(
-                    gas,
-                    gasprice
-                )
-            )
-            tx_result = self.sign_and_send_tx(tx)
-
-            # get frax received in case of success
-            if tx_result['tx_status'] == 1:
-                amount_hex = ""
-                for i, log in enumerate(tx_result['tx_receipt']['logs']):
-                    if i == 2:
-                        amount_hex = log['data']
-                        break
-                frax_received_in_wei = self.web3.toInt(hexstr=amount_hex)
-                rome_swapped = self.convert_rome_to_ether(rome_to_swap)
-                print(f'Successfully swapped {rome_swapped} ROME for {self.web3.fromWei(frax_received_in_wei, "ether")} FRAX.\nTx Hash: {tx_result["tx_hash"]}')
-                break
-
-            else:
-                print(f'[FAIL] - Transaction failed: likely not enough gas.\nTx Hash: {tx_result["tx_hash"]}')
-                gas += gas * 0.2
-                gasprice += 1
+        :param block_number: block the market calls were performed on
+        :param results: batch_call results of market_calls()
+        :return: market part of a chain state snapshot
+        """
+        rome_frax_pair = self.parse_rome_frax_pair(results, block_number)
+        rome_market_price = rome_frax_pair.spot_price(self.rome_address) * 0.000000001
+        return {
+            'block_number': block_number,
+            'epoch': results['epoch'],
+            'blocks_before_rebase': results['epoch'][2] - block_number,
+            'rome_market_price': rome_market_price,
+            'discounts': self.discount_engine.compute_discounts(results, rome_market_price),
+            'rome_frax_pair': rome_frax_pair
+        }
 
+    def parse_account(self, results: dict) -> dict:
+        """
+        :param results: batch_call results of account_calls()
+        :return: wallet part of a chain state snapshot
+        """
         return {
-            'tx_type': 'swap',
-            'tx_hash': tx_result['tx_hash'],
-            'tx_status': tx_result['tx_status'],
-            'rome_swapped': rome_swapped,
-            'frax_received_wei': frax_received_in_wei
+            'srome_balance': self.convert_rome_to_ether(results['srome_balance']),
+            'rome_balance_wei': results['rome_balance'],
+            'frax_balance_wei': results['frax_balance'],
+            'rome_frax_lp_balance_wei': results['rome_frax_lp_balance'],
+            'pending_rewards': self.parse_pending_rewards(results)
         }
 
-    def add_rome_frax_lp(
+    def parse_snapshot(
             self,
-            gas: int,
-            gasprice: int,
-            frax_to_add_in_wei: int
+            block_number: int,
+            results: dict
     ) -> dict:
         """
-        Adding ROME/FRAX liquidity through solarbeam router contract.
-        :param gas: gas to use for transaction
-        :param gasprice_in_gwei: gasprice in gwei
-        :return: dict with tx_receipt, tx_hash and tx_status
+        :param block_number: block the snapshot calls were performed on
+        :param results: batch_call results of snapshot_calls()
+        :return: chain state snapshot, with the discount of every enabled bond in discounts.
         """
-        tx_result, rome_frax_lp_token_balance = {}, 0
-
-        amount_rome_desired = self.rome_contract.functions.balanceOf(self.account_address).call()
-        amount_frax_desired = frax_to_add_in_wei
-
-        # Here we apply 1% slippage to the desired amount
-        amount_rome_min = round(amount_rome_desired - amount_rome_desired * 0.01)
-        amount_frax_min = round(amount_frax_desired - amount_frax_desired * 0.01)
+        return {
+            **self.parse_market(block_number, results),
+            **self.parse_account(results)
+        }
 
-        # Approving Solarbeam to spend ROME before adding liquidity
-        approve_tx_result = self.approve_token_spending(
-            token_to_spend_contract=self.rome_contract,
-            amount=amount_rome_desired,
-            spender_address=self.solarbeam_router_address,
-            gas=gas,
-            gasprice=gasprice
-        )
-        if approve_tx_result['tx_status'] == 1:
-            print("Spending Approved")
-        else:
-            print("Spending not approved")
-            return approve_tx_result
-
-        # Assuming spending is approved, we can add liquidity
-        # At 3 tries, if tx still failed, return tx result
-        # If tx fails, retry with more gas
-        for i in range(0, 3):
-            tx = self.solarbeam_router_contract.functions.addLiquidity(
-                self.rome_address,
-                self.frax_address,
-                amount_rome_desired,
-                amount_frax_desired,
-                amount_rome_min,
-                amount_frax_min,
-                self.account_address,
-                1673825868
-            ).buildTransaction(
-                self.build_tx_dict(
-                    gas,
-                    gasprice
-                )
-            )
-            tx_result = self.sign_and_send_tx(tx)
+    # --------- READS ---------
 
-            rome_frax_lp_token_balance = self.web3.fromWei(
-                self.rome_frax_lp_contract.functions.balanceOf(self.account_address).call(), 'ether'
-            )
+    def get_total_rome_balance(self) -> float:
+        """
+        Get total ROME balance:
+        - staked balance is sRome balance
+        - in_bonds is pending bonded ROME across all bond contracts
+        - locked is balance locked for campaign. We first check for user profile in conscription contract,
+        we get his gons and we pass it as argument to balanceForGons() method of sRome contract.
+        Gons conversion depends on the profile, so this takes two batched round trips.
+        :return: float representing total ROME balance.
+        """
+        results = self.batch_call({
+            'staked_balance': self.srome_contract.functions.balanceOf(self.account_address),
+            'profile': self.rome_conscription_contract.functions.profiles(self.account_address),
+            **self.deposited_bonds_calls()
+        })
+        in_bonds = sum(results[f'bond_info_{bond}'][0] for bond in self.get_bond_contracts())
+        locked = self.srome_contract.functions.balanceForGons(results['profile'][3]).call()
+        return self.convert_rome_to_ether(results['staked_balance'] + in_bonds + locked)
 
-            if tx_result['tx_status'] == 1:
-                print(f'Successfully added ROME-FRAX liquidity Token received: {rome_frax_lp_token_balance}.\nTx Hash: {tx_result["tx_hash"]}')
-                break
-            else:
-                print(f'[FAIL] - Transaction failed: likely not enough gas.\nTx Hash: {tx_result["tx_hash"]}')
-                gas += gas * 0.2
-                gasprice += 1
+    def get_stacked_balance(self) -> float:
+        return self.convert_rome_to_ether(self.srome_contract.functions.balanceOf(self.account_address).call())
 
+    def check_deposited_bonds(self) -> dict:
+        """
+        Check if there is pending rewards in a bond
+        :return: dict with bond currency as keys and bool as values
+        """
+        results = self.batch_call(self.deposited_bonds_calls())
         return {
-            'tx_type': 'add_liquidity',
-            'tx_hash': tx_result['tx_hash'],
-            'tx_status': tx_result['tx_status'],
-            'lp_token_amount': rome_frax_lp_token_balance
+            bond: results[f'bond_info_{bond}'][0]
+            for bond in self.get_bond_contracts()
         }
 
-    def deposit_bond(
-            self,
-            gas: int,
-            gasprice: int,
-            bond_contract,
-            bond_contract_address,
-            bonded_token_contract,
-            frax_bond=False,
-            frax_to_bond=0
-    ) -> dict:
+    def get_pending_bond_reward(self, bond_contract) -> float:
         """
-        Deposit FRAX or ROME-FRAX LP to corresponding bond contract.
-        :param frax_bond: Boolean: if true, we want to bond frax but not necessary the entire balance,
-        so we give the amount of FRAX in wei to bond
-        :param frax_to_bond: if frax bonding, precise the frax amount to bond.
-        :param bond_contract: the bond contract instance
-        :param bond_contract_address: the bond contract address
-        :param bonded_token_contract: the token to bond contract
-        :return: dict containing tx result, tx hash and tx status
-        """
-
-        tx_result = {}
-
-        # Approving bond_contract to spend token
-        if frax_bond:
-            amount_to_bond = frax_to_bond
-        else:
-            amount_to_bond = bonded_token_contract.functions.balanceOf(self.account_address).call()
-
-        approve_tx_result = self.approve_token_spending(
-            token_to_spend_contract=bonded_token_contract,
-            amount=amount_to_bond,
-            spender_address=bond_contract_address,
-            gas=gas,
-            gasprice=gasprice
+        Get pending rewards for a given contract.
+        :param bond_contract: bond contract instance
+        :return: pending rewards in ether
+        """
+        return self.convert_rome_to_ether(
+            bond_contract.functions.pendingPayoutFor(self.account_address).call()
         )
-        if approve_tx_result['tx_status'] == 1:
-            print("Spending Approved")
-        else:
-            print("Spending not approved")
-            return approve_tx_result
-
-        # Assuming spending is approved, we can deposit our tokens to bond contract
-        # At 3 tries, if tx still failed, return tx result
-        # If tx fails, retry with more gas
-        for i in range(0, 3):
-            max_price = bond_contract.functions.bondPrice().call()
-            tx = bond_contract.functions.deposit(
-                amount_to_bond,
-                max_price,
-                self.account_address
-            ).buildTransaction(
-                self.build_tx_dict(
-                    gas,
-                    gasprice
-                )
-            )
-            tx_result = self.sign_and_send_tx(tx)
 
-            if tx_result['tx_status'] == 1:
-                print(f'Successfully bonded.\nTx Hash: {tx_result["tx_hash"]}')
-                break
-            else:
-                print(f'[FAIL] - Transaction failed: likely not enough gas.\nTx Hash: {tx_result["tx_hash"]}')
-                gas += gas * 0.2
-                gasprice += 1
+    def get_all_bond_pending_rewards(self) -> dict:
+        """
+        Get total pending rewards across all bond contracts, in a single batched call.
+        :return: Dict containing individual pending rewards and total pending rewards.
+        """
+        return self.parse_pending_rewards(self.batch_call(self.pending_rewards_calls()))
 
-        return {
-            'tx_type': 'deposit_bond',
-            'tx_hash': tx_result['tx_hash'],
-            'tx_status': tx_result['tx_status']
-        }
+    def get_snapshot(self, block_identifier='latest') -> dict:
+        """
+        :param block_identifier: block to read from, latest by default
+        :return: chain state snapshot read in a single batched call, see parse_snapshot()
+        """
+        block_number, results = self.multicall.call(self.snapshot_calls(), block_identifier)
+        return self.parse_snapshot(block_number, results)
 
-    def unstake(
+    def convert_rome_to_ether(
             self,
-            gas: int,
-            gasprice: int
-    ) -> dict:
+            rome_amount_in_wei: int
+    ) -> float:
         """
-        Unstake all staked tokens
-        :param gas: gas to use un wei
-        :param gasprice_in_gwei: gasprice in gwei
-        :return: dict containing tx hash, tx receipt and tx status
+        Converts ROME amount in wei to a human-readable amount in ether.
+        :param rome_amount_in_wei: int representing amount to convert.
+        :return: converted amount in ether with the nine ROME decimals.
         """
-        tx_result, unstaked_amount = {}, 0
+        return float(self.web3.fromWei(rome_amount_in_wei, 'ether')) / 0.000000001
 
-        amount_to_unstake = self.srome_contract.functions.balanceOf(self.account_address).call()
+    def get_rome_market_price(self) -> float:
+        """
+        :return: Float representing ROME market price in usd
+        """
+        return self.parse_market_price(self.batch_call(self.market_price_calls()))
 
-        for i in range(0, 3):
-            tx = self.staking_rome_contract.functions.unstake(
-                amount_to_unstake,
-                True
-            ).buildTransaction(
-                self.build_tx_dict(
-                    gas,
-                    gasprice
-                )
-            )
-            tx_result = self.sign_and_send_tx(tx)
+    def get_rome_frax_pair(self) -> SolarbeamPair:
+        """
+        :return: ROME-FRAX pair model with fresh reserves, from a single getReserves() call
+        """
+        block_number, results = self.multicall.call(self.market_price_calls())
+        return self.parse_rome_frax_pair(results, block_number)
 
-            unstaked_amount = self.convert_rome_to_ether(amount_to_unstake)
-            if tx_result['tx_status'] == 1:
-                print(f'Successfully unstaked {unstaked_amount} ROME.\nTx Hash: {tx_result["tx_hash"]}')
-                break
-            else:
-                print(f'[FAIL] - Transaction failed: likely not enough gas.\nTx Hash: {tx_result["tx_hash"]}')
-                gas += gas * 0.2
-                gasprice += 1
+    def check_blocks_before_rebase(self) -> int:
+        """
+        :return: integer representing remaining blocks before sROME rebase
+        """
+        block_number, results = self.multicall.call({'epoch': self.staking_rome_contract.functions.epoch()})
+        return results['epoch'][2] - block_number
 
-        return {
-            'tx_type': 'unstake',
-            'tx_hash': tx_result['tx_hash'],
-            'tx_status': tx_result['tx_status'],
-            'unstaked_rome_amount': unstaked_amount
-        }
+    def get_bond_discount(self, bond_contract) -> float:
+        """
+        :param bond_contract: bond contract to get discount
+        :return: float as discount percentage
+        """
+        results = self.batch_call({
+            'bond_price': bond_contract.functions.bondPriceInUSD(),
+            **self.market_price_calls()
+        })
+        return self.parse_bond_discount(results['bond_price'], self.parse_market_price(results))
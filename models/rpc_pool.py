@@ -0,0 +1,248 @@
+from .async_rpc import AsyncRPC, RPCError
+import asyncio
+import time
+
+
+class Endpoint:
+    """
+    One JSON-RPC endpoint of the pool, with its health state:
+    - latency: exponential moving average of successful request durations
+    - token bucket: at most rate_limit requests per second, with bursts up to burst requests
+    - circuit breaker: after failure_threshold consecutive failures, the endpoint is skipped for cooldown seconds,
+    then a single trial request decides whether it is healthy again.
+    """
+    def __init__(
+            self,
+            rpc: AsyncRPC,
+            rate_limit: float,
+            burst: int,
+            failure_threshold: int,
+            cooldown: float
+    ):
+        self.rpc = rpc
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.latency = None
+        self.failures = 0
+        self.open_until = 0
+        self._tokens = burst
+        self._tokens_updated = time.monotonic()
+
+    @property
+    def uri(self) -> str:
+        return self.rpc.endpoint_uri
+
+    def is_available(self) -> bool:
+        """
+        :return: False while the circuit is open. Once cooldown is over, the endpoint is available again
+        (half-open): its next failure opens the circuit again right away.
+        """
+        return time.monotonic() >= self.open_until
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._tokens_updated) * self.rate_limit)
+        self._tokens_updated = now
+
+    def has_token(self) -> bool:
+        self._refill()
+        return self._tokens >= 1
+
+    async def acquire(self):
+        """
+        Take a token from the bucket, waiting for one if the endpoint is at its rate limit.
+        """
+        self._refill()
+        while self._tokens < 1:
+            await asyncio.sleep((1 - self._tokens) / self.rate_limit)
+            self._refill()
+        self._tokens -= 1
+
+    def record_success(self, duration: float):
+        self.latency = duration if self.latency is None else 0.7 * self.latency + 0.3 * duration
+        self.failures = 0
+        self.open_until = 0
+
+    def record_cancelled(self, duration: float):
+        """
+        Hedged request cancelled because another endpoint answered first: this one is at least that slow.
+        """
+        self.latency = max(self.latency or 0, duration)
+
+    def record_failure(self):
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            print(f"RPC endpoint {self.uri} is failing, skipping it for {self.cooldown} seconds.")
+            self.open_until = time.monotonic() + self.cooldown
+            # Half-open after cooldown: a single failure opens the circuit again
+            self.failures = self.failure_threshold - 1
+
+
+def is_node_answer(error: Exception) -> bool:
+    """
+    :return: True if error is a final answer to the request, which any other endpoint would give too
+    """
+    return isinstance(error, RPCError) and not error.is_unavailable()
+
+
+class RPCPool(AsyncRPC):
+    """
+    Drop-in replacement for AsyncRPC spreading requests over several endpoints, configured in settings.json rpc section.
+    - reads go to the fastest healthy endpoint. If it doesn't answer within hedge_delay seconds, the same read is sent
+    to the next one, and so on: the first answer wins and the other requests are cancelled.
+    Transport errors (timeouts, HTTP errors, undecodable responses) and JSON-RPC errors of a node unable to serve
+    the request (rate limiting, header not found...) are endpoint failures: they fail over to the next endpoint right
+    away. Other JSON-RPC errors (ex: execution reverted) are answers from the node, they are raised as is.
+    - raw transactions are broadcast to every healthy endpoint, so they reach the network even if one of them is down.
+    """
+    def __init__(
+            self,
+            endpoint_uris: list,
+            request_timeout: int = 10,
+            pool_size: int = 20,
+            hedge_delay: float = 0.5,
+            rate_limit: float = 20,
+            burst: int = 40,
+            failure_threshold: int = 3,
+            cooldown: float = 30
+    ):
+        """
+        :param endpoint_uris: JSON-RPC HTTP endpoints, by order of preference before latencies are known
+        :param request_timeout: seconds before a request to a single endpoint is considered failed
+        :param pool_size: connection pool size of each endpoint
+        :param hedge_delay: seconds to wait for an endpoint answer before sending the same read to the next one
+        :param rate_limit: maximum requests per second on each endpoint
+        :param burst: maximum requests sent at once on each endpoint
+        :param failure_threshold: consecutive failures before an endpoint is skipped
+        :param cooldown: seconds an endpoint is skipped for
+        """
+        AsyncRPC.__init__(self, endpoint_uris[0], request_timeout, pool_size)
+        self.hedge_delay = hedge_delay
+        self.endpoints = [
+            Endpoint(AsyncRPC(uri, request_timeout, pool_size), rate_limit, burst, failure_threshold, cooldown)
+            for uri in endpoint_uris
+        ]
+
+    @classmethod
+    def from_settings(cls, rpc_settings: dict):
+        """
+        :param rpc_settings: settings.json rpc section
+        """
+        return cls(
+            rpc_settings['endpoints'],
+            request_timeout=rpc_settings['request_timeout'],
+            hedge_delay=rpc_settings['hedge_delay'],
+            rate_limit=rpc_settings['rate_limit'],
+            burst=rpc_settings['burst'],
+            failure_threshold=rpc_settings['failure_threshold'],
+            cooldown=rpc_settings['cooldown']
+        )
+
+    def get_endpoints(self) -> list:
+        """
+        :return: healthy endpoints, ones with available rate limit tokens first, then fastest first.
+        If every circuit is open, all endpoints are returned: better try them than stall.
+        """
+        endpoints = [endpoint for endpoint in self.endpoints if endpoint.is_available()] or self.endpoints
+        return sorted(
+            endpoints,
+            key=lambda endpoint: (
+                not endpoint.has_token(),
+                endpoint.latency if endpoint.latency is not None else 0,
+                self.endpoints.index(endpoint)
+            )
+        )
+
+    @staticmethod
+    async def _send(endpoint: Endpoint, send):
+        """
+        :param endpoint: endpoint to send to
+        :param send: coroutine function taking the endpoint AsyncRPC client
+        :return: send result. Health of the endpoint is updated according to the outcome.
+        """
+        await endpoint.acquire()
+        started = time.monotonic()
+        try:
+            result = await send(endpoint.rpc)
+        except RPCError as e:
+            if e.is_unavailable():
+                # Rate limited, or state not available on this node: another one may answer
+                endpoint.record_failure()
+            else:
+                # Execution error: the endpoint is fine, the request isn't
+                endpoint.record_success(time.monotonic() - started)
+            raise
+        except asyncio.CancelledError:
+            endpoint.record_cancelled(time.monotonic() - started)
+            raise
+        except Exception:
+            endpoint.record_failure()
+            raise
+        endpoint.record_success(time.monotonic() - started)
+        return result
+
+    async def _hedged(self, send):
+        """
+        :param send: coroutine function taking an endpoint AsyncRPC client
+        :return: first successful send result
+        """
+        remaining = self.get_endpoints()
+        pending = {}
+        error = None
+        try:
+            while remaining or pending:
+                if remaining:
+                    endpoint = remaining.pop(0)
+                    pending[asyncio.ensure_future(self._send(endpoint, send))] = endpoint
+                done, _ = await asyncio.wait(
+                    pending,
+                    timeout=self.hedge_delay if remaining else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    endpoint = pending.pop(task)
+                    if task.exception() is None:
+                        return task.result()
+                    if is_node_answer(task.exception()):
+                        raise task.exception()
+                    print(f"RPC endpoint {endpoint.uri} failed: {type(task.exception()).__name__} {task.exception()}")
+                    error = task.exception()
+        finally:
+            for task in pending:
+                task.cancel()
+        raise error
+
+    async def _broadcast(self, send):
+        """
+        :param send: coroutine function taking an endpoint AsyncRPC client
+        :return: first successful send result. Requests to other endpoints are not cancelled.
+        """
+        tasks = [asyncio.ensure_future(self._send(endpoint, send)) for endpoint in self.get_endpoints()]
+        for task in tasks:
+            # Late failures are expected (ex: already known transaction), don't report them as never retrieved
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+        error = None
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                return await next_done
+            except Exception as e:
+                # Prefer reporting a node answer (ex: nonce too low) over a transport error
+                if error is None or is_node_answer(e):
+                    error = e
+        raise error
+
+    async def _request(self, method: str, params=None):
+        if method == 'eth_sendRawTransaction':
+            return await self._broadcast(lambda rpc: rpc._request(method, params))
+        return await self._hedged(lambda rpc: rpc._request(method, params))
+
+    async def batch_request(self, requests: list) -> list:
+        if not requests:
+            return []
+        return await self._hedged(lambda rpc: rpc.batch_request(requests))
+
+    async def close(self):
+        for endpoint in self.endpoints:
+            await endpoint.rpc.close()
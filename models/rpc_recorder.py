@@ -0,0 +1,131 @@
+from .async_rpc import AsyncRPC, RPCError
+from web3.providers.base import BaseProvider
+import gzip
+import json
+import time
+
+
+class RPCRecorder:
+    """
+    Records every JSON-RPC request / response pair of a session into a gzipped JSON lines file,
+    one [elapsed seconds, block number, method, params, result, error, duration] array per request,
+    to be served again by ReplayRPC / ReplayProvider, see rpc_replay.py.
+    Transport failures (timeouts, HTTP errors) are not recorded: only node answers are.
+    The file is overwritten when the recorder is created.
+    """
+    def __init__(self, path: str = 'rpc_session.jsonl.gz'):
+        """
+        :param path: session file
+        """
+        self.path = path
+        self.block_number = None
+        self.records = 0
+        self._file = gzip.open(path, 'wt')
+        self._started = time.monotonic()
+
+    async def on_block(self, block_number: int):
+        """
+        Block hook: stamps next records with this block, and records its arrival as an eth_blockNumber answer,
+        so that replays see blocks at the same pace even when they came from a websocket subscription.
+        Records are flushed to the file once per block.
+        """
+        self.block_number = block_number
+        self.record('eth_blockNumber', [], hex(block_number))
+        self.flush()
+
+    def record(
+            self,
+            method: str,
+            params,
+            result=None,
+            error=None,
+            duration: float = 0
+    ):
+        """
+        :param method: JSON-RPC method, ex: eth_call
+        :param params: list of method params
+        :param result: response result, None if error
+        :param error: response error, None if success
+        :param duration: seconds the node took to answer
+        """
+        if method == 'eth_blockNumber' and result is not None:
+            self.block_number = max(self.block_number or 0, int(result, 16))
+        record = [
+            round(time.monotonic() - self._started, 3),
+            self.block_number,
+            method,
+            params if params is not None else [],
+            result,
+            error,
+            round(duration, 3)
+        ]
+        self._file.write(json.dumps(record, separators=(',', ':')) + '\n')
+        self.records += 1
+
+    def flush(self):
+        """
+        Write buffered records to the file. Records written after the last flush are lost on crash.
+        """
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+            print(f"Recorded {self.records} RPC requests in {self.path}")
+
+
+class RecordingRPC(AsyncRPC):
+    """
+    AsyncRPC wrapper recording every request it forwards to the wrapped client (AsyncRPC or RPCPool).
+    """
+    def __init__(self, rpc: AsyncRPC, recorder: RPCRecorder):
+        AsyncRPC.__init__(self, rpc.endpoint_uri, rpc.request_timeout, rpc.pool_size)
+        self.rpc = rpc
+        self.recorder = recorder
+
+    async def _request(self, method: str, params=None):
+        started = time.monotonic()
+        try:
+            result = await self.rpc._request(method, params)
+        except RPCError as e:
+            self.recorder.record(method, params, error=e.args[0], duration=time.monotonic() - started)
+            raise
+        self.recorder.record(method, params, result, duration=time.monotonic() - started)
+        return result
+
+    async def batch_request(self, requests: list) -> list:
+        started = time.monotonic()
+        # A batch with an error answer raises as a whole, without the other answers: it is not recorded
+        results = await self.rpc.batch_request(requests)
+        duration = time.monotonic() - started
+        for (method, params), result in zip(requests, results):
+            self.recorder.record(method, params, result, duration=duration)
+        return results
+
+    async def close(self):
+        await self.rpc.close()
+
+
+class RecordingProvider(BaseProvider):
+    """
+    Web3 provider wrapper recording every request of the wrapped provider, for synchronous interfaces:
+    Web3(RecordingProvider(Web3.HTTPProvider(endpoint_uri), recorder))
+    """
+    def __init__(self, provider: BaseProvider, recorder: RPCRecorder):
+        self.provider = provider
+        self.recorder = recorder
+
+    def make_request(self, method: str, params) -> dict:
+        started = time.monotonic()
+        response = self.provider.make_request(method, params)
+        self.recorder.record(
+            method,
+            params,
+            response.get('result'),
+            response.get('error'),
+            time.monotonic() - started
+        )
+        return response
+
+    def isConnected(self) -> bool:
+        return self.provider.isConnected()
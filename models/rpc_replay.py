@@ -0,0 +1,197 @@
+from .async_rpc import AsyncRPC
+from collections import defaultdict, deque
+from eth_utils import function_signature_to_4byte_selector
+from web3.providers.base import BaseProvider
+import asyncio
+import gzip
+import json
+import time
+import zlib
+
+
+# Calls whose calldata holds a deadline computed from the current time: a replay never encodes them as recorded
+DEADLINE_SELECTORS = {
+    '0x' + function_signature_to_4byte_selector(signature).hex()
+    for signature in (
+        'swapExactTokensForTokens(uint256,uint256,address[],address,uint256)',
+        'addLiquidity(address,address,uint256,uint256,uint256,uint256,address,uint256)',
+        'zapBond(address[],uint256,address,bool,uint256,uint256,uint256)'
+    )
+}
+
+
+class RPCReplay:
+    """
+    Recorded session, see RPCRecorder, served deterministically:
+    - a request gets the next not yet served answer recorded for the same method and params.
+    Only requests whose params depend on the current time fall back on the next answer recorded for their
+    counterpart: signed transactions (nonce, fees, deadline) by method, gas estimates and calls of a function taking
+    a deadline (ex: swaps) by method and function. Any other request missing from the recording is an error.
+    Once all answers of a request were served, the last one is served again.
+    - eth_blockNumber follows the recorded block timeline: a block is answered once as much time as when it was
+    recorded has passed, scaled by time_dilation. With a time_dilation of 0, each eth_blockNumber request gets the
+    next recorded block.
+    - every answer is delayed by the recorded node duration, scaled by time_dilation.
+    """
+    def __init__(
+            self,
+            records: list,
+            time_dilation: float = 1
+    ):
+        """
+        :param records: recorded [elapsed, block number, method, params, result, error, duration] arrays
+        :param time_dilation: 1 to replay at recorded speed, 2 twice slower, 0.5 twice faster, 0 without any delay
+        """
+        self.records = records
+        self.time_dilation = time_dilation
+        self._by_request = defaultdict(deque)
+        self._by_fallback = defaultdict(deque)
+        self._served = set()
+        self._last_served = {}
+        self._blocks = []
+        self._next_block = 0
+        self._started = None
+        for index, (elapsed, _, method, params, result, _, _) in enumerate(records):
+            if method == 'eth_blockNumber':
+                if result is not None:
+                    self._blocks.append((elapsed, result))
+                continue
+            self._by_request[self.get_key(method, params)].append(index)
+            fallback_key = self.get_fallback_key(method, params)
+            if fallback_key is not None:
+                self._by_fallback[fallback_key].append(index)
+
+    @classmethod
+    def load(
+            cls,
+            path: str = 'rpc_session.jsonl.gz',
+            time_dilation: float = 1
+    ):
+        """
+        :param path: session file written by RPCRecorder. A file truncated by a crash is read up to its last record.
+        """
+        records = []
+        try:
+            with gzip.open(path, 'rt') as f:
+                for line in f:
+                    records.append(json.loads(line))
+        except (EOFError, zlib.error, json.JSONDecodeError):
+            pass
+        return cls(records, time_dilation)
+
+    @staticmethod
+    def get_key(method: str, params) -> tuple:
+        return method, json.dumps(params if params is not None else [], sort_keys=True)
+
+    @staticmethod
+    def get_fallback_key(method: str, params):
+        """
+        :return: key of the recorded counterparts of a time dependent request, None for any other request
+        """
+        if method == 'eth_sendRawTransaction':
+            return (method,)
+        if method in ('eth_estimateGas', 'eth_call') and params:
+            selector = (params[0].get('data') or '')[:10]
+            if selector in DEADLINE_SELECTORS:
+                return method, params[0].get('to', '').lower(), selector
+        return None
+
+    def _pop_unserved(self, indexes: deque):
+        while indexes:
+            index = indexes.popleft()
+            if index not in self._served:
+                self._served.add(index)
+                return index
+        return None
+
+    def get_block_number(self) -> str:
+        if not self._blocks:
+            raise ValueError({'code': -32000, 'message': 'no block recorded'})
+        if self.time_dilation == 0:
+            _, block_number = self._blocks[min(self._next_block, len(self._blocks) - 1)]
+            self._next_block += 1
+            return block_number
+        if self._started is None:
+            self._started = time.monotonic()
+        replay_elapsed = (time.monotonic() - self._started) / self.time_dilation
+        block_number = self._blocks[0][1]
+        for elapsed, recorded_block_number in self._blocks:
+            if elapsed > replay_elapsed:
+                break
+            block_number = recorded_block_number
+        return block_number
+
+    def get_record(self, method: str, params) -> list:
+        """
+        :return: recorded [elapsed, block number, method, params, result, error, duration] answer for this request
+        """
+        key = self.get_key(method, params)
+        index = self._pop_unserved(self._by_request.get(key, deque()))
+        fallback_key = self.get_fallback_key(method, params)
+        if index is None and fallback_key is not None:
+            index = self._pop_unserved(self._by_fallback.get(fallback_key, deque()))
+        if index is None:
+            index = self._last_served.get(key, self._last_served.get(fallback_key))
+        if index is None:
+            raise ValueError({'code': -32000, 'message': f'{method} {key[1]} not in recording'})
+        self._last_served[key] = index
+        if fallback_key is not None:
+            self._last_served[fallback_key] = index
+        return self.records[index]
+
+    def get_delay(self, record: list) -> float:
+        return record[6] * self.time_dilation
+
+    @staticmethod
+    def to_response(record: list, request_id=0) -> dict:
+        _, _, _, _, result, error, _ = record
+        response = {'jsonrpc': '2.0', 'id': request_id}
+        if error is not None:
+            response['error'] = error
+        else:
+            response['result'] = result
+        return response
+
+
+class ReplayRPC(AsyncRPC):
+    """
+    Drop-in replacement for AsyncRPC serving a recorded session instead of a node.
+    """
+    def __init__(self, replay: RPCReplay):
+        AsyncRPC.__init__(self, 'replay')
+        self.replay = replay
+
+    async def _request(self, method: str, params=None):
+        if method == 'eth_blockNumber':
+            return self.replay.get_block_number()
+        record = self.replay.get_record(method, params)
+        await asyncio.sleep(self.replay.get_delay(record))
+        return self.get_result(self.replay.to_response(record))
+
+    async def batch_request(self, requests: list) -> list:
+        if not requests:
+            return []
+        records = [self.replay.get_record(method, params) for method, params in requests]
+        await asyncio.sleep(max(self.replay.get_delay(record) for record in records))
+        return [self.get_result(self.replay.to_response(record)) for record in records]
+
+    async def close(self):
+        pass
+
+
+class ReplayProvider(BaseProvider):
+    """
+    Web3 provider serving a recorded session, for synchronous interfaces: Web3(ReplayProvider(RPCReplay.load(path)))
+    """
+    def __init__(self, replay: RPCReplay):
+        self.replay = replay
+
+    def make_request(self, method: str, params) -> dict:
+        if method == 'eth_blockNumber':
+            return {'jsonrpc': '2.0', 'id': 0, 'result': self.replay.get_block_number()}
+        record = self.replay.get_record(method, params)
+        time.sleep(self.replay.get_delay(record))
+        return self.replay.to_response(record)
+
+    def isConnected(self) -> bool:
+        return True
@@ -0,0 +1,175 @@
+from math import isqrt
+
+
+class SolarbeamPair:
+    """
+    Local model of a Solarbeam (Uniswap V2 fork) pair, built from a single getReserves() call.
+    Prices, swap quotes, price impact and liquidity split are computed locally with constant-product math,
+    the same integer math as the router, so they cost no RPC call.
+    All amounts are in token smallest unit (wei).
+    """
+    def __init__(
+            self,
+            token0: str,
+            token1: str,
+            reserve0: int,
+            reserve1: int,
+            fee_bps: int = 25,
+            block_number: int = None
+    ):
+        """
+        :param token0: address of pair token0
+        :param token1: address of pair token1
+        :param reserve0: token0 reserve
+        :param reserve1: token1 reserve
+        :param fee_bps: swap fee in basis points, 25 (0.25%) on Solarbeam
+        :param block_number: block the reserves were read on
+        """
+        self.token0 = token0
+        self.token1 = token1
+        self.reserve0 = reserve0
+        self.reserve1 = reserve1
+        self.fee_bps = fee_bps
+        self.block_number = block_number
+
+    @classmethod
+    def from_reserves(
+            cls,
+            token_a: str,
+            token_b: str,
+            reserves: list,
+            fee_bps: int = 25,
+            block_number: int = None
+    ):
+        """
+        :param token_a: address of one of the pair tokens
+        :param token_b: address of the other one
+        :param reserves: getReserves() result: [reserve0, reserve1, blockTimestampLast]
+        :return: SolarbeamPair, with tokens sorted the same way as the pair contract does
+        """
+        token0, token1 = sorted([token_a, token_b], key=lambda address: int(address, 16))
+        return cls(token0, token1, reserves[0], reserves[1], fee_bps, block_number)
+
+    def get_reserves(self, token_in: str) -> tuple:
+        """
+        :param token_in: address of the token given to the pair
+        :return: tuple (reserve in, reserve out)
+        """
+        if token_in.lower() == self.token0.lower():
+            return self.reserve0, self.reserve1
+        if token_in.lower() == self.token1.lower():
+            return self.reserve1, self.reserve0
+        raise ValueError(f"{token_in} is not a token of this pair")
+
+    def spot_price(self, token_in: str) -> float:
+        """
+        :param token_in: address of the token to price
+        :return: amount of the other token for one unit of token_in, without fee nor price impact
+        """
+        reserve_in, reserve_out = self.get_reserves(token_in)
+        return reserve_out / reserve_in
+
+    def get_amount_out(
+            self,
+            amount_in: int,
+            token_in: str
+    ) -> int:
+        """
+        Same as router getAmountOut().
+        :param amount_in: amount of token_in to swap
+        :param token_in: address of the token to swap
+        :return: amount of the other token received
+        """
+        reserve_in, reserve_out = self.get_reserves(token_in)
+        amount_in_with_fee = amount_in * (10000 - self.fee_bps)
+        return amount_in_with_fee * reserve_out // (reserve_in * 10000 + amount_in_with_fee)
+
+    def price_impact(
+            self,
+            amount_in: int,
+            token_in: str
+    ) -> float:
+        """
+        :param amount_in: amount of token_in to swap
+        :param token_in: address of the token to swap
+        :return: price impact of the swap as a ratio (0.01 = 1%), fee included
+        """
+        if amount_in == 0:
+            return 0
+        execution_price = self.get_amount_out(amount_in, token_in) / amount_in
+        return 1 - execution_price / self.spot_price(token_in)
+
+    def quote(
+            self,
+            amount_a: int,
+            token_a: str
+    ) -> int:
+        """
+        Same as router quote(): amount of the other token to add along amount_a, at current pool ratio.
+        """
+        reserve_a, reserve_b = self.get_reserves(token_a)
+        return amount_a * reserve_b // reserve_a
+
+    def optimal_swap_amount(
+            self,
+            amount_in: int,
+            token_in: str
+    ) -> int:
+        """
+        When adding liquidity with only token_in, amount to swap first so that the swapped amount and the
+        remaining token_in match the pool ratio after the swap: no token left over once liquidity is added.
+        :param amount_in: total amount of token_in available
+        :param token_in: address of the token we have
+        :return: amount of token_in to swap
+        """
+        reserve_in, _ = self.get_reserves(token_in)
+        fee_base, fee_factor = 10000, 10000 - self.fee_bps
+        return (
+            isqrt(reserve_in ** 2 * (fee_base + fee_factor) ** 2 + 4 * fee_factor * fee_base * amount_in * reserve_in)
+            - reserve_in * (fee_base + fee_factor)
+        ) // (2 * fee_factor)
+
+    def get_liquidity_amounts(
+            self,
+            amount_a_desired: int,
+            token_a: str,
+            amount_b_desired: int
+    ) -> tuple:
+        """
+        Same computation as router addLiquidity(): amounts actually added to the pool at current ratio.
+        :param amount_a_desired: amount of token_a we want to add
+        :param token_a: address of token a
+        :param amount_b_desired: amount of the other token we want to add
+        :return: tuple (amount a, amount b)
+        """
+        amount_b_optimal = self.quote(amount_a_desired, token_a)
+        if amount_b_optimal <= amount_b_desired:
+            return amount_a_desired, amount_b_optimal
+        return self.quote(amount_b_desired, self.token1 if token_a.lower() == self.token0.lower() else self.token0), \
+            amount_b_desired
+
+    def apply_swap(
+            self,
+            amount_in: int,
+            token_in: str,
+            amount_out: int
+    ):
+        """
+        Update local reserves with one of our own swaps, so that next quotes don't need a new getReserves().
+        """
+        if token_in.lower() == self.token0.lower():
+            self.reserve0, self.reserve1 = self.reserve0 + amount_in, self.reserve1 - amount_out
+        else:
+            self.reserve0, self.reserve1 = self.reserve0 - amount_out, self.reserve1 + amount_in
+
+    @staticmethod
+    def apply_slippage(
+            amount: int,
+            slippage: float
+    ) -> int:
+        """
+        :param amount: expected amount
+        :param slippage: accepted slippage as a ratio (0.01 = 1%)
+        :return: minimum amount to accept
+        """
+        return int(amount * (1 - slippage))
@@ -0,0 +1,83 @@
+from logger.metrics import METRICS
+
+
+class TokenLedger:
+    """
+    Local token balances of a wallet, in wei, so that each step of a flow reads the amount the previous steps left
+    instead of calling balanceOf again.
+    Balances come from chain state reads (block snapshots, or a reconcile read when no snapshot was taken for a
+    while), then follow Transfer events decoded from our own transaction receipts. Transfers of blocks already
+    covered by the last chain read are not applied again: they are part of it.
+    Each chain read is also a reconcile check: a local balance different from chain state (a transfer we didn't
+    make, a missed receipt) is reported and counted, and chain state wins.
+    """
+    def __init__(
+            self,
+            account_address: str,
+            tokens: dict,
+            rebasing: tuple = ()
+    ):
+        """
+        :param account_address: wallet address
+        :param tokens: token address -> token name
+        :param rebasing: names of tokens whose balances change without Transfer events, ex: sROME on rebase.
+        Their differences with chain state are expected: they are not reported.
+        """
+        self.account_address = account_address
+        self.tokens = tokens
+        self.rebasing = rebasing
+        self.balances = {}
+        # Block of the last chain read
+        self.block_number = None
+
+    def get(self, token: str) -> int:
+        """
+        :param token: token name
+        :return: balance in wei, None if unknown yet
+        """
+        return self.balances.get(token)
+
+    def sync(
+            self,
+            block_number: int,
+            balances: dict
+    ) -> dict:
+        """
+        Replace local balances with chain state, unless it is older than the last one.
+        :param block_number: block balances were read on
+        :param balances: token name -> balance in wei
+        :return: token name -> chain balance minus local balance, for tokens which differed
+        """
+        if self.block_number is not None and block_number < self.block_number:
+            return {}
+        drift = {}
+        for token, balance in balances.items():
+            local_balance = self.balances.get(token)
+            if local_balance is not None and local_balance != balance and token not in self.rebasing:
+                drift[token] = balance - local_balance
+                METRICS.inc('neron_ledger_drift_total', {'token': token})
+        self.balances.update(balances)
+        self.block_number = block_number
+        return drift
+
+    def apply(self, events: list) -> dict:
+        """
+        :param events: decoded events of one of our transaction receipts, see EventDecoder
+        :return: token name -> balance change in wei, for tokens this transaction moved
+        """
+        changes = {}
+        for event in events:
+            token = self.tokens.get(event['address'])
+            if token is None or event['event'] != 'Transfer':
+                continue
+            amount = 0
+            if event['args']['to'] == self.account_address:
+                amount += event['args']['value']
+            if event['args']['from'] == self.account_address:
+                amount -= event['args']['value']
+            if amount == 0:
+                continue
+            changes[token] = changes.get(token, 0) + amount
+            if token in self.balances and event['block_number'] > self.block_number:
+                self.balances[token] += amount
+        return changes
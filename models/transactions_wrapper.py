@@ -2,6 +2,7 @@
 # methods names are self-explanatory. They calls rome_interface methods with specific arguments
 # regarding the transaction to make.
 # All methods returns a dict containing transactions informations.
+# Works the same on top of AsyncRomeInterface: methods then return awaitables resolving to that dict.
 
 
 class TransactionsWrapper:
@@ -10,44 +11,42 @@ class TransactionsWrapper:
 
     # -------- REDEEM ---------
 
-    def redeem_frax(self, do_autostake: bool) -> dict:
-        print("Redeem FRAX Bond...")
-        frax_claim_tx = self.rome_interface.claim_bond_reward(
-            bond_contract=self.rome_interface.bond_frax_contract,
-            gas=self.rome_interface.settings['default_gas'],
-            gasprice=self.rome_interface.settings['default_gasprice'],
+    def redeem(self, bond, do_autostake: bool) -> dict:
+        """
+        :param bond: Bond descriptor, see models/bond_registry.py
+        """
+        print(f"Redeem {bond.label} Bond...")
+        claim_tx = self.rome_interface.claim_bond_reward(
+            bond_contract=bond.bond_contract,
             do_autostake=do_autostake
         )
-        return frax_claim_tx
-
-    def redeem_rome_frax(self, do_autostake: bool) -> dict:
-        print("Redeem ROME-FRAX Bond...")
-        rome_frax_claim_tx = self.rome_interface.claim_bond_reward(
-            bond_contract=self.rome_interface.bond_rome_frax_lp_contract,
-            gas=self.rome_interface.settings['default_gas'],
-            gasprice=self.rome_interface.settings['default_gasprice'],
-            do_autostake=do_autostake
+        return claim_tx
+
+    def redeem_all(self, bonds: list) -> list:
+        """
+        Claim and autostake several bonds at once, with the transactions signed by prepare_claims if any.
+        :param bonds: Bond descriptors, see models/bond_registry.py
+        """
+        print(f"Redeem {', '.join(bond.label for bond in bonds)} Bonds...")
+        claim_txs = self.rome_interface.claim_bond_rewards(
+            bond_contracts=[bond.bond_contract for bond in bonds]
         )
-        return rome_frax_claim_tx
-
-    def redeem_gohm(self, do_autostake: bool) -> dict:
-        print("Redeem GOHM Bond...")
-        gohm_claim_tx = self.rome_interface.claim_bond_reward(
-            bond_contract=self.rome_interface.bond_gohm_contract,
-            gas=self.rome_interface.settings['default_gas'],
-            gasprice=self.rome_interface.settings['default_gasprice'],
-            do_autostake=do_autostake
+        return claim_txs
+
+    def prepare_claims(self, bonds: list):
+        """
+        Sign claim and autostake transactions of these bonds ahead, for redeem_all.
+        :param bonds: Bond descriptors, see models/bond_registry.py
+        """
+        return self.rome_interface.prepare_claims(
+            bond_contracts=[bond.bond_contract for bond in bonds]
         )
-        return gohm_claim_tx
 
     # --------- UNSTAKE ---------
 
     def unstake(self, srome_balance: float) -> dict:
         print(f"Unstaking {srome_balance}")
-        unstake_tx = self.rome_interface.unstake(
-            gas=self.rome_interface.settings['default_gas'],
-            gasprice=self.rome_interface.settings['default_gasprice']
-        )
+        unstake_tx = self.rome_interface.unstake()
         return unstake_tx
 
     # --------- SWAP ---------
@@ -56,49 +55,60 @@ class TransactionsWrapper:
         if total_balance:
             print("Swapping all ROME for FRAX...")
         else:
-            print("Swapping half ROME for FRAX...")
+            print("Swapping part of ROME for FRAX, to add ROME-FRAX liquidity...")
         swap_tx = self.rome_interface.swap_rome_for_frax(
-            gas=self.rome_interface.settings['default_gas'],
-            gasprice=self.rome_interface.settings['default_gasprice'],
             total_balance=total_balance
         )
         return swap_tx
 
+    def swap_back(self, frax_amount: int) -> dict:
+        """
+        :param frax_amount: FRAX to swap back to ROME, in wei
+        """
+        print("Swapping FRAX back to ROME...")
+        swap_tx = self.rome_interface.swap_frax_for_rome(frax_to_swap_in_wei=frax_amount)
+        return swap_tx
+
     # --------- ADD LIQUIDITY ---------
 
     def add_liquidity(self, frax_amount: int) -> dict:
         print("Adding ROME-FRAX Liquidity...")
         add_liq_tx = self.rome_interface.add_rome_frax_lp(
-            gas=self.rome_interface.settings['default_gas'],
-            gasprice=self.rome_interface.settings['default_gasprice'],
             frax_to_add_in_wei=frax_amount
         )
         return add_liq_tx
 
     # --------- BONDING ---------
 
-    def bond_frax(self, frax_amount: int) -> dict:
-        print("Bonding FRAX...")
+    def bond(self, bond, amount: int = None) -> dict:
+        """
+        :param bond: Bond descriptor, see models/bond_registry.py
+        :param amount: principal amount to bond in wei. Whole principal balance if None.
+        """
+        print(f"Bonding {bond.label}...")
         bonding_tx = self.rome_interface.deposit_bond(
-            gas=self.rome_interface.settings['default_gas'],
-            gasprice=self.rome_interface.settings['default_gasprice'],
-            bond_contract=self.rome_interface.bond_frax_contract,
-            bond_contract_address=self.rome_interface.bond_frax_address,
-            bonded_token_contract=self.rome_interface.frax_contract,
-            frax_bond=True,
-            frax_to_bond=frax_amount
+            bond_contract=bond.bond_contract,
+            bond_contract_address=bond.bond_address,
+            bonded_token_contract=bond.principal_contract,
+            frax_bond=amount is not None,
+            frax_to_bond=amount or 0
         )
         return bonding_tx
 
-    def bond_rome_frax_lp(self) -> dict:
-        print("Bonding ROME-FRAX LP...")
-        bonding_tx = self.rome_interface.deposit_bond(
-            gas=self.rome_interface.settings['default_gas'],
-            gasprice=self.rome_interface.settings['default_gasprice'],
-            bond_contract=self.rome_interface.bond_rome_frax_lp_contract,
-            bond_contract_address=self.rome_interface.bond_rome_frax_lp_address,
-            bonded_token_contract=self.rome_interface.rome_frax_lp_address
+    # --------- ZAP ---------
+
+    def zap_bond(self, bond, redeem_bonds: list, unstake: bool) -> dict:
+        """
+        Whole bonding path in a single transaction, through the zap contract.
+        :param bond: Bond descriptor to bond in, see models/bond_registry.py
+        :param redeem_bonds: Bond descriptors to redeem pending rewards from
+        :param unstake: True to bond our sROME balance too
+        """
+        print(f"Bonding {bond.label} through the zap contract...")
+        zap_tx = self.rome_interface.zap_bond(
+            bond_contract=bond.bond_contract,
+            redeem_bond_contracts=[redeem_bond.bond_contract for redeem_bond in redeem_bonds],
+            unstake=unstake,
+            add_liquidity=bond.path == 'rome_frax_lp'
         )
-        return bonding_tx
-
-
+        return zap_tx